@@ -0,0 +1,239 @@
+"""
+Benchmark the client end to end against the local stand-in Evance API (see fake_server.py).
+
+Each scenario reports throughput and latency percentiles. Results are compared with a stored baseline
+(benchmarks/baselines/<name>.json) and scenarios that got slower than the threshold are flagged.
+Baselines are machine specific: record one on the machine you compare on.
+
+Usage:
+    python benchmarks/bench_client.py                      # run and compare with the baseline
+    python benchmarks/bench_client.py --save-baseline      # run and store the results as the baseline
+    python benchmarks/bench_client.py --only list,parse --latency 0.005 --fail-on-regression
+    python benchmarks/bench_client.py --transport memory   # no sockets: measures the client alone
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from evance_api import EvanceAuth, EvanceClient, Products, Contacts  # noqa: E402
+from evance_api.resources.resources import APIResponse  # noqa: E402
+from evance_api.retry import RetryPolicy  # noqa: E402
+from evance_api.transport import InMemoryTransport  # noqa: E402
+from fake_server import FakeEvanceServer  # noqa: E402
+
+BASELINE_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class Result:
+    def __init__(self, name, operations_per_round, samples, unit="ops"):
+        self.name = name
+        self.operations_per_round = operations_per_round
+        self.samples = samples
+        self.unit = unit
+
+    @property
+    def throughput(self):
+        # Based on the median round, so a few slow rounds (GC, a busy machine) do not skew comparisons
+        median = percentile(self.samples, 0.5)
+        return self.operations_per_round / median if median else 0.0
+
+    def to_dict(self):
+        return {
+            "throughput": round(self.throughput, 2),
+            "unit": f"{self.unit}/s",
+            "p50_ms": round(percentile(self.samples, 0.5) * 1000, 3),
+            "p95_ms": round(percentile(self.samples, 0.95) * 1000, 3),
+        }
+
+
+def measure(name, function, rounds, operations_per_round=1, unit="ops"):
+    """
+    Call `function` `rounds` times, timing each call.
+    """
+    function()  # Warm up connections and caches
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - started)
+    return Result(name, operations_per_round, samples, unit)
+
+
+def memory_transport(server):
+    """
+    Route requests straight to the stand-in API's handler, in-process.
+    """
+    def handle(request):
+        query = {name: [str(value)] for name, value in request.params.items()}
+        if server.latency:
+            time.sleep(server.latency)
+        return server.respond(request.method, request.path, query, request.headers.get("Authorization"),
+                              request.headers.get("Accept-Encoding"))
+
+    return InMemoryTransport(handle)
+
+
+def make_client(server, **options):
+    auth = EvanceAuth(base_url=server.base_url, client_id="benchmark", private_key="secret")
+    transport = getattr(server, "transport", "http")
+    if transport == "memory":
+        options["transport"] = memory_transport(server)
+    elif transport == "http2":
+        options["http2"] = True
+    return EvanceClient(auth, "v2", **options)
+
+
+def scenarios(server, client, args):
+    products = Products(client)
+    page_size = args.page_size
+    pages = -(-args.products // page_size)
+
+    def list_page():
+        products.list({"limit": page_size})
+
+    def list_fields():
+        products.list({"limit": page_size}, fields=["id", "sku", "pricing.price", "stock"])
+
+    def one_product():
+        products.one(42)
+
+    def iterate_pages():
+        for _ in products.iter_pages({"limit": page_size}):
+            pass
+
+    def fetch_pages():
+        for _ in products.fetch_pages({"limit": page_size}, concurrency=8):
+            pass
+
+    def contacts_list():
+        Contacts(client).list({"limit": page_size})
+
+    def hydrate():
+        products.hydrate(products.list({"limit": 20}), concurrency=8)
+
+    payload = client.get("products.json", {"limit": page_size}, raw=True)
+    parsed = APIResponse(payload)
+    parsed.data
+
+    def parse():
+        APIResponse(payload).data
+
+    def parse_lazy():
+        APIResponse(payload, lazy=True)
+
+    def to_json():
+        parsed.to_json()
+
+    yield "list", lambda: measure("list", list_page, args.rounds)
+    yield "list_fields", lambda: measure("list_fields", list_fields, args.rounds)
+    yield "one", lambda: measure("one", one_product, args.rounds)
+    yield "contacts", lambda: measure("contacts", contacts_list, args.rounds)
+    yield "iter_pages", lambda: measure("iter_pages", iterate_pages, max(1, args.rounds // 10), pages, "pages")
+    yield "fetch_pages", lambda: measure("fetch_pages", fetch_pages, max(1, args.rounds // 10), pages, "pages")
+    yield "hydrate", lambda: measure("hydrate", hydrate, max(1, args.rounds // 10), 20, "products")
+    yield "parse", lambda: measure("parse", parse, args.rounds * 5, page_size, "items")
+    yield "parse_lazy", lambda: measure("parse_lazy", parse_lazy, args.rounds * 5, page_size, "items")
+    yield "to_json", lambda: measure("to_json", to_json, args.rounds * 5, page_size, "items")
+
+    def with_pressure():
+        # 10% of responses are 429s, retried by the policy
+        server.configure(rate_limit_rate=0.1)
+        try:
+            with make_client(server, retry_policy=RetryPolicy(max_attempts=6, backoff_factor=0)) as retrying:
+                return measure("list_429", lambda: Products(retrying).list({"limit": page_size}), args.rounds)
+        finally:
+            server.configure(rate_limit_rate=0.0)
+
+    yield "list_429", with_pressure
+
+
+def compare(results, baseline, threshold):
+    """
+    Print each scenario next to its baseline. Return the names of scenarios that regressed.
+    """
+    regressions = []
+    print(f"{'scenario':<12} {'throughput':>16} {'p50 ms':>9} {'p95 ms':>9} {'baseline':>16} {'change':>8}")
+    for name, result in results.items():
+        line = (f"{name:<12} {result['throughput']:>10.1f} {result['unit']:<5} "
+                f"{result['p50_ms']:>9.3f} {result['p95_ms']:>9.3f}")
+        previous = baseline.get("results", {}).get(name)
+        if previous:
+            change = result["throughput"] / previous["throughput"] - 1 if previous["throughput"] else 0.0
+            flag = ""
+            if change < -threshold:
+                flag = "  REGRESSION"
+                regressions.append(name)
+            line += f" {previous['throughput']:>10.1f} {previous['unit']:<5} {change:>+7.1%}{flag}"
+        print(line)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baseline", default="default", help="Baseline name (default: default)")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the baseline")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Throughput drop that counts as a regression (default: 0.2 = 20%%)")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit with status 1 on regressions")
+    parser.add_argument("--only", help="Comma separated scenarios to run")
+    parser.add_argument("--rounds", type=int, default=100)
+    parser.add_argument("--products", type=int, default=2000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds the server adds to each response")
+    parser.add_argument("--description-size", type=int, default=200, help="Characters per product description")
+    parser.add_argument("--gzip", action="store_true", help="The stand-in gzips its responses")
+    parser.add_argument("--transport", choices=("http", "http2", "memory"), default="http",
+                        help="requests over local HTTP, the httpx HTTP2Transport (HTTP/1.1 against the plain-http "
+                             "stand-in), or call the handler in-process (default: http)")
+    args = parser.parse_args()
+
+    only = set(args.only.split(",")) if args.only else None
+    results = {}
+    with FakeEvanceServer(products=args.products, latency=args.latency,
+                          description_size=args.description_size, gzip=args.gzip) as server:
+        server.transport = args.transport
+        with make_client(server, pool_maxsize=16) as client:
+            for name, run in scenarios(server, client, args):
+                if only is None or name in only:
+                    results[name] = run().to_dict()
+
+    path = os.path.join(BASELINE_DIRECTORY, f"{args.baseline}.json")
+    baseline = {}
+    if os.path.exists(path):
+        with open(path, "r") as file:
+            baseline = json.load(file)
+    regressions = compare(results, baseline, args.threshold)
+
+    if args.save_baseline:
+        os.makedirs(BASELINE_DIRECTORY, exist_ok=True)
+        document = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "settings": {"rounds": args.rounds, "products": args.products, "page_size": args.page_size,
+                         "latency": args.latency, "description_size": args.description_size,
+                         "transport": args.transport, "gzip": args.gzip},
+            "results": dict(baseline.get("results", {}), **results),
+        }
+        with open(path, "w") as file:
+            json.dump(document, file, indent=2)
+            file.write("\n")
+        print(f"Baseline saved to {path}")
+
+    if regressions:
+        print(f"Regressed beyond {args.threshold:.0%}: {', '.join(regressions)}")
+        if args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
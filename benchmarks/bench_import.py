@@ -0,0 +1,109 @@
+"""
+Benchmark how long importing the package takes in a fresh interpreter, and which heavy modules it loads.
+
+Each scenario runs in its own subprocess so nothing is cached between rounds. The time reported is
+the import statement alone (interpreter startup is excluded). Results are compared with a stored
+baseline (benchmarks/baselines/import.json), and a scenario that loads a module it should defer
+(e.g., requests before the first request) is always reported.
+
+Usage:
+    python benchmarks/bench_import.py                      # run and compare with the baseline
+    python benchmarks/bench_import.py --save-baseline      # run and store the results as the baseline
+    python benchmarks/bench_import.py --fail-on-regression
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "baselines", "import.json")
+
+# Modules that must only be loaded when the feature that needs them is used
+DEFERRED = ("requests", "urllib3", "httpx", "asyncio", "sqlite3", "concurrent.futures", "email.utils")
+
+SCENARIOS = {
+    "import": "import evance_api",
+    "products": "from evance_api import Products",
+    "client": "from evance_api import EvanceAuth, EvanceClient, Products\n"
+              "EvanceClient(EvanceAuth(base_url='https://example.evance.me'), 'v2')",
+}
+
+PROBE = """
+import sys, time
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+loaded = [name for name in {deferred!r} if name in sys.modules]
+modules = len([name for name in sys.modules if name.startswith("evance_api")])
+print(repr((elapsed, loaded, modules)))
+"""
+
+
+def run_scenario(statement, rounds):
+    samples = []
+    loaded = modules = None
+    code = PROBE.format(statement=statement, deferred=DEFERRED)
+    for _ in range(rounds):
+        output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True, capture_output=True, text=True)
+        elapsed, loaded, modules = eval(output.stdout.strip().splitlines()[-1])
+        samples.append(elapsed)
+    samples.sort()
+    return {
+        "median_ms": round(samples[len(samples) // 2] * 1000, 3),
+        "min_ms": round(samples[0] * 1000, 3),
+        "evance_modules": modules,
+        "deferred_loaded": loaded,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=15)
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the baseline")
+    parser.add_argument("--threshold", type=float, default=0.5,
+                        help="Slow-down that counts as a regression (default: 0.5 = 50%%)")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit with status 1 on regressions")
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH, "r") as file:
+            baseline = json.load(file).get("results", {})
+
+    results = {}
+    regressions = []
+    print(f"{'scenario':<10} {'median ms':>10} {'min ms':>8} {'modules':>8} {'baseline':>9} {'change':>8}  deferred loaded")
+    for name, statement in SCENARIOS.items():
+        result = results[name] = run_scenario(statement, args.rounds)
+        line = f"{name:<10} {result['median_ms']:>10.2f} {result['min_ms']:>8.2f} {result['evance_modules']:>8}"
+        previous = baseline.get(name)
+        if previous:
+            change = result["median_ms"] / previous["median_ms"] - 1 if previous["median_ms"] else 0.0
+            line += f" {previous['median_ms']:>9.2f} {change:>+8.1%}"
+            if change > args.threshold:
+                regressions.append(name)
+                line += " REGRESSION"
+        if result["deferred_loaded"]:
+            regressions.append(name)
+            line += "  " + ", ".join(result["deferred_loaded"])
+        print(line)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(BASELINE_PATH), exist_ok=True)
+        with open(BASELINE_PATH, "w") as file:
+            json.dump({"python": platform.python_version(), "platform": platform.platform(), "results": results},
+                      file, indent=2)
+            file.write("\n")
+        print(f"Baseline saved to {BASELINE_PATH}")
+
+    if regressions:
+        print(f"Regressed: {', '.join(sorted(set(regressions)))}")
+        if args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Compare the JSON codecs on a large product page.
+
+Usage: python benchmarks/bench_json.py [--items 1000] [--rounds 50]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from evance_api.json_backend import CODECS, get_codec  # noqa: E402
+from evance_api.resources.resources import APIResponse  # noqa: E402
+
+
+def make_product(product_id):
+    return {
+        "id": product_id,
+        "sku": f"SKU-{product_id:06d}",
+        "title": f"Product {product_id} with a reasonably long marketing title",
+        "description": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 4,
+        "price": {"amount": 19.99 + product_id % 100, "currency": "GBP"},
+        "stock": product_id % 250,
+        "barcode": f"50{product_id:011d}",
+        "partNumber": f"PN-{product_id}",
+        "status": "active",
+        "type": "simple",
+        "createdOn": "2024-01-01T00:00:00+00:00",
+        "modifiedOn": "2024-06-01T12:30:00+00:00",
+    }
+
+
+def make_page(items):
+    return {
+        "success": True,
+        "status": 200,
+        "pagination": {"page": 1, "limit": items, "total": items, "pages": 1},
+        "links": {"previous": None, "next": None, "self": None},
+        "data": [make_product(i) for i in range(1, items + 1)],
+    }
+
+
+def timed(function, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        function()
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    payload = get_codec().encode(make_page(args.items))
+    print(f"Page of {args.items} products, {len(payload) / 1024:.0f} KiB")
+    print(f"{'codec':<8} {'decode ms':>10} {'to_json ms':>11} {'encode ms':>10}")
+
+    for name in CODECS:
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            print(f"{name:<8} {'not installed':>10}")
+            continue
+        document = codec.loads(payload)
+        response = APIResponse(document, codec=codec)
+        response.data  # Parse items up front so only serialisation is timed
+        decode = timed(lambda: APIResponse(payload, codec=codec), args.rounds)
+        to_json = timed(response.to_json, args.rounds)
+        encode = timed(lambda: codec.encode(document), args.rounds)
+        print(f"{name:<8} {decode:>10.2f} {to_json:>11.2f} {encode:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+"""
+A local stand-in for the Evance API, for benchmarks and manual testing.
+
+It serves the token endpoint, paginated products.json and contacts.json, single products and
+contacts, and each product's specifications and downloads, from generated data. Collections and
+items honour a sparse fieldset (?fields=id,sku). Latency, payload
+size, gzip compression and the share of 503 / 429 responses can be changed while it runs.
+
+Usage: python benchmarks/fake_server.py [--port 8080] [--products 1000] [--latency 0.02]
+"""
+import argparse
+import gzip
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+TOKEN = "benchmark-token"
+
+ROUTES = [
+    (re.compile(r"^/api/[^/]+/(products|contacts)\.json$"), "collection"),
+    (re.compile(r"^/api/[^/]+/(products|contacts)/(\d+)\.json$"), "item"),
+    (re.compile(r"^/api/[^/]+/products/(\d+)/(specifications|downloads)\.json$"), "sub_resource"),
+]
+
+
+def make_product(product_id, description_size=200):
+    return {
+        "id": product_id,
+        "sku": f"SKU-{product_id:06d}",
+        "title": f"Product {product_id}",
+        "description": ("Lorem ipsum dolor sit amet. " * (description_size // 28 + 1))[:description_size],
+        "pricing": {"price": round(19.99 + product_id % 100, 2), "currency": "GBP"},
+        "stock": product_id % 250,
+        "barcode": f"50{product_id:011d}",
+        "partNumber": f"PN-{product_id}",
+        "status": "active" if product_id % 10 else "archived",
+        "type": "simple",
+        "createdOn": "2024-01-01T00:00:00+00:00",
+        "modifiedOn": f"2024-06-{product_id % 28 + 1:02d}T12:00:00+00:00",
+    }
+
+
+def sparse(item, fields):
+    """
+    Keep only the comma-separated top-level `fields` of an item (all of them if `fields` is None).
+    """
+    if fields is None:
+        return item
+    names = fields.split(",")
+    return {key: value for key, value in item.items() if key in names}
+
+
+def make_contact(contact_id):
+    return {
+        "id": contact_id,
+        "email": f"user{contact_id}@example.com",
+        "type": "user",
+        "firstName": "Jane",
+        "lastName": f"Doe {contact_id}",
+        "company": "Example Ltd",
+        "consentsToEmail": bool(contact_id % 2),
+        "createdOn": "2024-01-01T00:00:00+00:00",
+        "modifiedOn": "2024-06-01T12:00:00+00:00",
+    }
+
+
+def make_specifications(product_id):
+    return [{"id": product_id * 10 + n, "specId": n, "valueId": n * 7, "value": f"Value {n}"} for n in range(1, 6)]
+
+
+def make_downloads(product_id):
+    return [{"id": product_id * 10 + n, "file": f"manual-{product_id}-{n}.pdf", "visibility": "public"}
+            for n in range(1, 3)]
+
+
+class FakeEvanceServer:
+    """
+    Runs the stand-in API on a background thread. Use it as a context manager:
+
+        with FakeEvanceServer(products=5000, latency=0.01) as server:
+            auth = EvanceAuth(base_url=server.base_url, client_id="id", private_key="secret")
+    """
+
+    def __init__(self, products=1000, contacts=500, latency=0.0, description_size=200,
+                 error_rate=0.0, rate_limit_rate=0.0, port=0, seed=1, gzip=False):
+        """
+        :param products: Number of products served
+        :param contacts: Number of contacts served
+        :param latency: Seconds added to every response
+        :param description_size: Characters in each product description (controls payload size)
+        :param error_rate: Fraction of API responses replaced by 503
+        :param rate_limit_rate: Fraction of API responses replaced by 429 with Retry-After: 0
+        :param port: Port to listen on (default: a free port)
+        :param seed: Seed for error injection, so runs are repeatable
+        :param gzip: Gzip API responses for clients that accept it
+        """
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.description_size = description_size
+        self.gzip = gzip
+        self.products = products
+        self.contacts = contacts
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._bodies = {}  # Encoded responses, so the server's own work does not dominate timings
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def configure(self, **settings):
+        """
+        Change latency, description_size, gzip, error_rate or rate_limit_rate between runs.
+        """
+        with self._lock:
+            for name, value in settings.items():
+                if not hasattr(self, name):
+                    raise AttributeError(name)
+                setattr(self, name, value)
+            self._bodies.clear()
+
+    def _injected_status(self):
+        with self._lock:
+            self.requests += 1
+            roll = self._random.random()
+        if roll < self.error_rate:
+            return 503
+        if roll < self.error_rate + self.rate_limit_rate:
+            return 429
+        return None
+
+    def _page(self, kind, page, limit, fields=None):
+        total = self.products if kind == "products" else self.contacts
+        make = (lambda i: make_product(i, self.description_size)) if kind == "products" else make_contact
+        first = (page - 1) * limit + 1
+        return {
+            "success": True,
+            "status": 200,
+            "pagination": {"page": page, "limit": limit, "total": total, "pages": max(1, -(-total // limit))},
+            "data": [sparse(make(i), fields) for i in range(first, min(first + limit, total + 1))],
+        }
+
+    def _body(self, key, build):
+        body = self._bodies.get(key)
+        if body is None:
+            body = self._bodies[key] = json.dumps(build()).encode()
+        return body
+
+    def respond(self, method, path, query, authorization, accept_encoding=None):
+        """
+        Return (status, headers, body) for a request.
+        """
+        status, headers, body = self._respond(method, path, query, authorization)
+        if status == 200 and self.gzip and "gzip" in (accept_encoding or "") and path != "/admin/oauth/token":
+            compressed = self._bodies.get(("gzip", body))
+            if compressed is None:
+                compressed = self._bodies[("gzip", body)] = gzip.compress(body, 6)
+            body = compressed
+            headers = dict(headers, **{"Content-Encoding": "gzip"})
+        return status, headers, body
+
+    def _respond(self, method, path, query, authorization):
+        if method == "POST" and path == "/admin/oauth/token":
+            return 200, {}, json.dumps({"access_token": TOKEN, "expires_in": 3600}).encode()
+        if authorization != f"Bearer {TOKEN}":
+            return 401, {}, b'{"success": false, "error": "Unauthorized"}'
+
+        for pattern, route in ROUTES:
+            match = pattern.match(path)
+            if match:
+                break
+        else:
+            return 404, {}, b'{"success": false, "error": "Not found"}'
+
+        injected = self._injected_status()
+        if injected == 503:
+            return 503, {}, b'{"success": false, "error": "Service unavailable"}'
+        if injected == 429:
+            return 429, {"Retry-After": "0"}, b'{"success": false, "error": "Too many requests"}'
+
+        fields = query.get("fields", [None])[0]
+        if route == "collection":
+            kind = match.group(1)
+            page = int(query.get("page", ["1"])[0])
+            limit = min(int(query.get("limit", ["100"])[0]), 250)
+            return 200, {}, self._body((kind, page, limit, fields), lambda: self._page(kind, page, limit, fields))
+
+        if route == "item":
+            kind, item_id = match.group(1), int(match.group(2))
+            if item_id > (self.products if kind == "products" else self.contacts):
+                return 404, {}, b'{"success": false, "error": "Not found"}'
+            make = (lambda: make_product(item_id, self.description_size)) if kind == "products" else (
+                lambda: make_contact(item_id))
+            return 200, {}, self._body((kind, item_id, fields),
+                                       lambda: {"success": True, "data": sparse(make(), fields)})
+
+        product_id, kind = int(match.group(1)), match.group(2)
+        make = make_specifications if kind == "specifications" else make_downloads
+        items = make(product_id)
+        return 200, {}, self._body((kind, product_id), lambda: {
+            "success": True,
+            "pagination": {"page": 1, "limit": 100, "total": len(items), "pages": 1},
+            "data": items,
+        })
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive, like the real API
+            disable_nagle_algorithm = True  # Headers and body are written separately
+
+            def _handle(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                if server.latency:
+                    time.sleep(server.latency)
+                url = urlsplit(self.path)
+                status, headers, body = server.respond(
+                    self.command, url.path, parse_qs(url.query), self.headers.get("Authorization"),
+                    self.headers.get("Accept-Encoding"),
+                )
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the stand-in Evance API.")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--products", type=int, default=1000)
+    parser.add_argument("--contacts", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--gzip", action="store_true", help="Gzip responses for clients that accept it")
+    args = parser.parse_args()
+
+    server = FakeEvanceServer(args.products, args.contacts, args.latency, error_rate=args.error_rate,
+                              rate_limit_rate=args.rate_limit_rate, port=args.port, gzip=args.gzip)
+    print(f"Serving the stand-in Evance API on {server.base_url} (Ctrl+C to stop)")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,45 @@
-# Core components
-from .auth import EvanceAuth
-from .client import EvanceClient
+import importlib
 
-# Resources
-from .resources import Resources, Products, Contacts
-from .resources.product import Downloads, Specifications
+# Public names and the modules that define them. They are imported on first access (PEP 562), so
+# `import evance_api` stays cheap and only the parts of the client that are used get loaded.
+_EXPORTS = {
+    # Core components
+    "EvanceAuth": ".auth",
+    "EvanceClient": ".client",
+    "AsyncEvanceClient": ".async_client",
+    # Resources
+    "Resources": ".resources.resources",
+    "Products": ".resources.products",
+    "Contacts": ".resources.contacts",
+    "Downloads": ".resources.product.downloads",
+    "Specifications": ".resources.product.specifications",
+    "AsyncResources": ".resources.async_resources",
+    "AsyncProducts": ".resources.async_resources",
+    "AsyncContacts": ".resources.async_resources",
+    "AsyncSpecifications": ".resources.async_resources",
+    "AsyncDownloads": ".resources.async_resources",
+}
+
+__all__ = list(_EXPORTS)
 
 # Expose version
-__version__ = '1.0.0'  # Update with your actual version
\ No newline at end of file
+__version__ = '1.0.0'  # Update with your actual version
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(module, __name__), name)
+        globals()[name] = value  # Later lookups no longer reach __getattr__
+        return value
+    # Submodules (e.g., evance_api.client) are imported on first access too
+    try:
+        return importlib.import_module(f".{name}", __name__)
+    except ModuleNotFoundError as error:
+        if error.name != f"{__name__}.{name}":
+            raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
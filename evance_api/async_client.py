@@ -0,0 +1,373 @@
+import asyncio
+import contextlib
+import time
+
+from .cache import cache_key
+from .coalesce import AsyncSingleFlight
+from .compression import compress
+from .json_backend import get_codec
+from .metrics import RequestEvent
+from .exceptions import UnexpectedError, error_for_status
+from .transport import http2_available
+
+
+@contextlib.asynccontextmanager
+async def _hold(lock):
+    """
+    Hold a blocking lock (a context manager, e.g. FileTokenCache.lock) without blocking the event loop:
+    it is acquired in a worker thread. If the waiting task is cancelled, the lock is released as soon as
+    the worker acquires it.
+    """
+    acquiring = asyncio.get_running_loop().run_in_executor(None, lock.__enter__)
+    try:
+        await asyncio.shield(acquiring)
+    except asyncio.CancelledError:
+        def release(future):
+            if not future.cancelled() and future.exception() is None:
+                lock.__exit__(None, None, None)
+        acquiring.add_done_callback(release)
+        raise
+    try:
+        yield
+    finally:
+        lock.__exit__(None, None, None)
+
+
+def _import_httpx():
+    """
+    Import httpx, which is only required by the asyncio client.
+    """
+    try:
+        import httpx
+    except ImportError as import_err:
+        raise ImportError(
+            "AsyncEvanceClient requires httpx. Install it with: pip install evance_api_pyclient[async]"
+        ) from import_err
+    return httpx
+
+
+class AsyncEvanceClient:
+    def __init__(
+            self,
+            auth,
+            api_version="",
+            max_concurrency=100,
+            pool_maxsize=100,
+            max_retries=3,
+            timeout=None,
+            json_codec=None,
+            retry_policy=None,
+            throttle=None,
+            coalesce=False,
+            instrumentation=None,
+            http2=False,
+            accept_encoding=None,
+            compress_requests=None,
+            compress_min_size=1024
+    ):
+        """
+        Initialize the asyncio API client with authentication.
+
+        Every request shares one pooled httpx.AsyncClient. At most `max_concurrency` requests are
+        in flight at once; further calls wait for a free slot.
+
+        :param auth: An instance of the EvanceAuth class
+        :param api_version: API version segment of the base URL (e.g., "v2")
+        :param max_concurrency: Maximum number of requests in flight at the same time
+        :param pool_maxsize: Maximum number of connections kept alive
+        :param max_retries: Retries for connections that fail to establish
+        :param timeout: Default timeout in seconds for every request
+        :param json_codec: JSON backend (see EvanceClient)
+        :param retry_policy: A RetryPolicy for 429/5xx responses and connection failures (default: no retries)
+        :param throttle: An AdaptiveThrottle that paces requests and slows down under server pressure
+        :param coalesce: Share one network call between concurrent identical GET requests
+        :param instrumentation: An Instrumentation hook (e.g., MetricsCollector) or a list of them
+        :param http2: Multiplex requests over one HTTP/2 connection per host, with max_concurrency as the
+                      limit on concurrent streams. Falls back to HTTP/1.1 when the server or environment
+                      does not support it (HTTP/2 requires the h2 package).
+        :param accept_encoding: Accept-Encoding header for responses (see EvanceClient)
+        :param compress_requests: Compress request bodies with "gzip", "deflate", "br" or "zstd" (see EvanceClient)
+        :param compress_min_size: Bodies smaller than this many bytes are sent uncompressed
+        """
+        httpx = _import_httpx()
+
+        self.auth = auth
+        self.api_version = api_version
+        self.base_url = f"{self.auth.base_url}/api/{self.api_version}"
+        self.max_concurrency = max_concurrency
+        self.json_codec = get_codec(json_codec)
+        self.retry_policy = retry_policy
+        self.throttle = throttle
+        self.timeout = timeout
+        self.single_flight = AsyncSingleFlight() if coalesce else None
+        self.pool_maxsize = pool_maxsize
+        self.accept_encoding = accept_encoding
+        if compress_requests is not None:
+            compress(b"", compress_requests)  # Fail early on unknown codings or missing libraries
+        self.compress_requests = compress_requests
+        self.compress_min_size = compress_min_size
+        self._semaphore = None
+        self._refresh_lock = None
+        self._client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                http2=http2_available(http2),
+                verify=not self.auth.debug_mode,
+                retries=max_retries,
+                limits=httpx.Limits(
+                    max_connections=pool_maxsize,
+                    max_keepalive_connections=pool_maxsize
+                ),
+            ),
+            timeout=timeout,
+        )
+        self.instrumentation = None
+        if instrumentation is not None:
+            if not isinstance(instrumentation, (list, tuple)):
+                instrumentation = (instrumentation,)
+            self.instrumentation = tuple(instrumentation)
+            for hook in self.instrumentation:
+                hook.attach(self)
+
+    def _get_semaphore(self):
+        # Created lazily so it binds to the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def authenticate(self):
+        """
+        Authenticate with the Evance API without blocking the event loop and store the token on auth.
+        """
+        data = {
+            "client_id": self.auth.client_id,
+            "client_secret": self.auth.private_key,
+            "grant_type": "client_credentials",
+        }
+        response = await self._send("POST", f"{self.auth.base_url}/admin/oauth/token", data=data)
+        if response.is_error:
+            raise error_for_status(response.status_code, response.text)
+        return self.auth.store_token(self.json_codec.loads(response.content))
+
+    async def refresh(self, stale_token=None):
+        """
+        Obtain a new token, sharing a single request between all tasks (and, with a FileTokenCache,
+        all processes) that ask at the same time.
+
+        :param stale_token: The token that was rejected or has expired
+        :return: The current token
+        """
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock:
+            if self.auth.token != stale_token and self.auth.is_token_valid():
+                return self.auth.token  # Refreshed by another task while we waited
+            token_cache = self.auth.token_cache
+            if token_cache is None:
+                return await self.authenticate()
+            async with _hold(token_cache.lock(self.auth.cache_key)):
+                if self.auth.load_cached_token(stale_token):
+                    return self.auth.token  # Refreshed by another process
+                return await self.authenticate()
+
+    async def get_token(self):
+        """
+        Return the current token, authenticating on first use and refreshing it before it expires.
+        """
+        auth = self.auth
+        if auth.is_token_valid() or not auth.can_refresh():
+            return auth.token
+        if auth.load_cached_token():
+            return auth.token
+        return await self.refresh(auth.token)
+
+    async def request(self, method, endpoint, params=None, json=None, raw=False, deadline=None):
+        """
+        Make a request to the API.
+
+        :param method: HTTP method (GET, POST, etc.)
+        :param endpoint: API endpoint (e.g., 'products')
+        :param params: Query parameters
+        :param json: JSON request body
+        :param raw: Return the undecoded response body (bytes) instead of the parsed JSON
+        :param deadline: Time budget in seconds for the call including retries (default: retry_policy.deadline)
+        :return: JSON response from the API
+        """
+        if self.single_flight is not None and method == "GET":
+            key = (cache_key(f"{self.base_url}/{endpoint}", params), raw)
+            return await self.single_flight.do(
+                key, lambda: self._request(method, endpoint, params, json, raw, deadline)
+            )
+        return await self._request(method, endpoint, params, json, raw, deadline)
+
+    @property
+    def coalescing_stats(self):
+        """
+        Counters for coalesced GETs: "executed" reached the network, "coalesced" were saved.
+        """
+        if self.single_flight is None:
+            return {"executed": 0, "coalesced": 0}
+        return self.single_flight.stats()
+
+    async def _request(self, method, endpoint, params, json, raw, deadline):
+        if self.instrumentation is None:
+            return await self._execute(method, endpoint, params, json, raw, deadline)
+
+        event = RequestEvent(method, endpoint, f"{self.base_url}/{endpoint}")
+        for hook in self.instrumentation:
+            hook.before_request(event)
+        try:
+            return await self._execute(method, endpoint, params, json, raw, deadline, event)
+        except BaseException as error:
+            event.error = error
+            raise
+        finally:
+            event.elapsed = time.perf_counter() - event.started
+            for hook in self.instrumentation:
+                hook.after_request(event)
+
+    async def _execute(self, method, endpoint, params, json, raw, deadline, event=None):
+        headers = {}
+        if self.accept_encoding is not None:
+            headers["Accept-Encoding"] = self.accept_encoding
+        url = f"{self.base_url}/{endpoint}"
+        content = body = None
+        if json is not None:
+            content = body = self.json_codec.encode(json)
+            headers["Content-Type"] = "application/json"
+            encoding = self.compress_requests
+            if encoding is not None and len(content) >= self.compress_min_size:
+                body = compress(content, encoding)
+                headers["Content-Encoding"] = encoding
+            if event is not None:
+                event.bytes_sent = len(content)
+                event.wire_bytes_sent = len(body)
+
+        token = await self.get_token()
+        response = await self._send_with_retries(method, url, params, body, headers, token, deadline, event)
+        if response.status_code == 415 and body is not content:
+            # The server does not accept compressed bodies: resend as is and stop compressing
+            self.compress_requests = None
+            del headers["Content-Encoding"]
+            if event is not None:
+                event.wire_bytes_sent = len(content)
+            response = await self._send_with_retries(method, url, params, content, headers, token, deadline, event)
+        if event is not None:
+            event.status = response.status_code
+            event.bytes_received = len(response.content)
+            event.wire_bytes_received = response.num_bytes_downloaded
+
+        if response.status_code == 204:  # No Content
+            return True
+        if response.is_error:
+            raise error_for_status(response.status_code, response.text)
+        if raw:
+            return response.content
+        if event is not None:
+            started = time.perf_counter()
+            decoded = self.json_codec.loads(response.content)
+            event.parse_time = time.perf_counter() - started
+            return decoded
+        return self.json_codec.loads(response.content)
+
+    async def _send_with_retries(self, method, url, params, content, headers, token, deadline=None, event=None):
+        """
+        Send a request, refreshing a rejected token once and applying the retry policy and throttle.
+        """
+        policy = self.retry_policy
+        if deadline is None and policy is not None:
+            deadline = policy.deadline
+        expires = time.monotonic() + deadline if deadline is not None else None
+
+        attempt = 0
+        refreshed = False
+        while True:
+            attempt += 1
+            if event is not None:
+                event.attempts += 1
+            if self.throttle is not None:
+                delay = self.throttle.reserve()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            kwargs = {"params": params, "content": content, "headers": dict(headers, Authorization=f"Bearer {token}")}
+            if expires is not None:
+                remaining = max(expires - time.monotonic(), 0.001)
+                kwargs["timeout"] = remaining if self.timeout is None else min(self.timeout, remaining)
+            try:
+                response = await self._send(method, url, **kwargs)
+            except (ConnectionError, TimeoutError):
+                if policy is None or not policy.should_retry_error(method, attempt):
+                    raise
+                if not await self._wait(policy.get_delay(attempt), expires):
+                    raise
+                continue
+
+            if response.status_code == 401 and not refreshed and self.auth.can_refresh():
+                # The token was rejected: refresh it once (shared by all tasks) and retry the call
+                token = await self.refresh(token)
+                refreshed = True
+                attempt -= 1
+                if event is not None:
+                    event.attempts -= 1
+                continue
+
+            retry_after = response.headers.get("Retry-After")
+            if self.throttle is not None:
+                self.throttle.feedback(response.status_code, retry_after)
+            if (policy is not None
+                    and policy.should_retry_status(method, response.status_code, attempt)
+                    and await self._wait(policy.get_delay(attempt, retry_after), expires)):
+                continue
+            return response
+
+    @staticmethod
+    async def _wait(delay, expires):
+        """
+        Sleep for `delay` seconds unless that would overrun the deadline. Return True if slept.
+        """
+        if expires is not None and time.monotonic() + delay >= expires:
+            return False
+        await asyncio.sleep(delay)
+        return True
+
+    async def _send(self, method, url, **kwargs):
+        """
+        Send a request once a concurrency slot is free, mapping httpx errors to built-in ones.
+        """
+        httpx = _import_httpx()
+
+        async with self._get_semaphore():
+            try:
+                return await self._client.request(method, url, **kwargs)
+
+            except httpx.TimeoutException as timeout_err:
+                raise TimeoutError() from timeout_err
+
+            except httpx.TransportError as conn_err:
+                raise ConnectionError() from conn_err
+
+            except httpx.HTTPError as req_err:
+                raise UnexpectedError(f"An unexpected error occurred: {req_err}") from req_err
+
+    async def get(self, endpoint, params=None, raw=False):
+        return await self.request("GET", endpoint, params=params, raw=raw)
+
+    async def post(self, endpoint, json=None):
+        return await self.request("POST", endpoint, json=json)
+
+    async def put(self, endpoint, json=None):
+        return await self.request("PUT", endpoint, json=json)
+
+    async def delete(self, endpoint):
+        return await self.request("DELETE", endpoint)
+
+    async def close(self):
+        """
+        Close the pooled connections.
+        """
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
@@ -1,11 +1,24 @@
-import requests
 import json
-import warnings
-from urllib3.exceptions import InsecureRequestWarning
+import threading
+import time
+from urllib.parse import urlencode
+from .exceptions import error_for_status
+from .transport import RequestsTransport
 
 
 class EvanceAuth:
-    def __init__(self, base_url, account=None, client_id=None, private_key=None, algorithm="HS256", debug_mode=False):
+    def __init__(
+            self,
+            base_url,
+            account=None,
+            client_id=None,
+            private_key=None,
+            algorithm="HS256",
+            debug_mode=False,
+            token_cache=None,
+            refresh_leeway=60,
+            transport=None
+    ):
         """
         Initialize the authentication module.
 
@@ -15,6 +28,9 @@ class EvanceAuth:
         :param private_key: Private key for signing the JWT
         :param algorithm: Algorithm for signing the JWT (default: HS256)
         :param base_url: Base URL for the API
+        :param token_cache: Optional MemoryTokenCache/FileTokenCache shared between instances or processes
+        :param refresh_leeway: Seconds before expiry at which the token is proactively refreshed
+        :param transport: A Transport for token requests (default: the client's, or a RequestsTransport)
         """
         self.debug_mode = debug_mode
         self.account = account
@@ -23,6 +39,22 @@ class EvanceAuth:
         self.algorithm = algorithm
         self.base_url = base_url
         self.token = None
+        self.expires_at = None  # Unix timestamp, None when the expiry is unknown
+        self.token_cache = token_cache
+        self.refresh_leeway = refresh_leeway
+        self.transport = transport  # Shared with EvanceClient once a client is created
+        self._refresh_lock = threading.Lock()
+
+    @property
+    def session(self):
+        """
+        The requests.Session used for token requests, or None when the transport does not use one.
+        """
+        return getattr(self.transport, "session", None)
+
+    @session.setter
+    def session(self, session):
+        self.transport = RequestsTransport(session=session) if session is not None else None
 
     def from_json(self, json_file_path):
         """
@@ -36,10 +68,71 @@ class EvanceAuth:
             credentials = json.load(file)
 
 
-        self.account=credentials["account"],
-        self.client_id=credentials["client_id"],
-        self.private_key=credentials["private_key"],
-        self.algorithm=credentials.get("algorithm", "HS256")
+        self.account = credentials["account"]
+        self.client_id = credentials["client_id"]
+        self.private_key = credentials["private_key"]
+        self.algorithm = credentials.get("algorithm", "HS256")
+
+    @property
+    def cache_key(self):
+        """
+        Key identifying this account's token in a shared token cache.
+        """
+        return f"{self.base_url}|{self.client_id}"
+
+    def can_refresh(self):
+        """
+        Return True if credentials are available to request a new token.
+        """
+        return bool(self.client_id and self.private_key)
+
+    def is_token_valid(self, leeway=None):
+        """
+        Return True if a token is set and is not about to expire.
+
+        :param leeway: Seconds of remaining lifetime required (default: refresh_leeway)
+        """
+        if not self.token:
+            return False
+        if self.expires_at is None:
+            return True
+        if leeway is None:
+            leeway = self.refresh_leeway
+        return time.time() + leeway < self.expires_at
+
+    def store_token(self, payload):
+        """
+        Store the token from a token endpoint response and share it through the token cache.
+
+        :param payload: Decoded JSON response of /admin/oauth/token
+        :return: The access token
+        """
+        self.token = payload.get("access_token")
+        expires_in = payload.get("expires_in")
+        self.expires_at = time.time() + float(expires_in) if expires_in is not None else None
+        if self.token_cache is not None and self.token:
+            self.token_cache.set(self.cache_key, self.token, self.expires_at)
+        return self.token
+
+    def load_cached_token(self, stale_token=None):
+        """
+        Adopt a valid token from the token cache, if one is available.
+
+        :param stale_token: A token known to be rejected, which is never adopted
+        :return: True if a cached token was adopted
+        """
+        if self.token_cache is None:
+            return False
+        cached = self.token_cache.get(self.cache_key)
+        if not cached:
+            return False
+        token, expires_at = cached
+        if not token or token == stale_token:
+            return False
+        if expires_at is not None and time.time() + self.refresh_leeway >= expires_at:
+            return False
+        self.token, self.expires_at = token, expires_at
+        return True
 
     def authenticate(self):
         """
@@ -47,36 +140,53 @@ class EvanceAuth:
         """
         url = f"{self.base_url}/admin/oauth/token"
 
-        data = {
+        data = urlencode({
             "client_id": self.client_id,
             "client_secret": self.private_key,
             "grant_type": "client_credentials",
-        }
+        }).encode("ascii")
 
         headers = {
             "Content-Type": "application/x-www-form-urlencoded",
         }
 
-        # Create a Prepared Request to inspect headers
-        session = requests.Session()
-        req = requests.Request("POST", url, data=data, headers=headers)
-        prepared_request = session.prepare_request(req)
+        # Reuse the client's transport (and pooled connections) when available
+        if self.transport is None:
+            self.transport = RequestsTransport()
 
-        # Suppress InsecureRequestWarning when debug_mode is enabled
-        if self.debug_mode:
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore", InsecureRequestWarning)
-                response = session.send(prepared_request, verify=False)
-        else:
-            response = session.send(prepared_request, verify=True)
+        # Certificate verification is disabled in debug_mode
+        response = self.transport.send("POST", url, data=data, headers=headers, verify=not self.debug_mode)
+        if response.status_code >= 400:
+            raise error_for_status(response.status_code, response.text)
+        return self.store_token(response.json())
 
-        response.raise_for_status()
-        self.token = response.json().get("access_token")
+    def refresh(self, stale_token=None):
+        """
+        Obtain a new token, sharing a single request between all threads (and, with a FileTokenCache,
+        all processes) that ask at the same time.
+
+        :param stale_token: The token that was rejected or has expired. If another caller has already
+                            replaced it, the new token is returned without authenticating again.
+        :return: The current token
+        """
+        with self._refresh_lock:
+            if self.token != stale_token and self.is_token_valid():
+                return self.token  # Refreshed by another thread while we waited
+            if self.token_cache is None:
+                return self.authenticate()
+            with self.token_cache.lock(self.cache_key):
+                if self.load_cached_token(stale_token):
+                    return self.token  # Refreshed by another process
+                return self.authenticate()
 
     def get_token(self):
         """
-        Return the current JWT token. Generate a new one if it's not set.
+        Return the current JWT token. Generate a new one if it's not set or is about to expire.
         """
-        if not self.token:
-            self.authenticate()
-        return self.token
+        if self.is_token_valid():
+            return self.token
+        if not self.can_refresh():
+            return self.token
+        if self.load_cached_token():
+            return self.token
+        return self.refresh(self.token)
@@ -0,0 +1,259 @@
+import threading
+import time
+
+from .exceptions import TooManyRequestsError, ServerError
+from .retry import RetryPolicy
+
+
+class BulkResult:
+    """
+    Outcome of a single record in a bulk operation.
+    """
+    __slots__ = ("index", "resource_id", "record", "response", "error", "attempts")
+
+    def __init__(self, index, resource_id=None, record=None, response=None, error=None, attempts=0):
+        self.index = index
+        self.resource_id = resource_id
+        self.record = record
+        self.response = response
+        self.error = error
+        self.attempts = attempts
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return f"BulkResult(index={self.index}, resource_id={self.resource_id}, {status})"
+
+
+class BulkReport:
+    """
+    Results of a bulk operation, in input order, with running throughput figures.
+    """
+
+    def __init__(self):
+        self.results = []
+        self.succeeded = 0
+        self.failed = 0
+        self.started_at = time.monotonic()
+        self.finished_at = None
+        self._lock = threading.Lock()
+
+    def _add(self, result):
+        with self._lock:
+            self.results.append(result)
+            if result.ok:
+                self.succeeded += 1
+            else:
+                self.failed += 1
+
+    @property
+    def completed(self):
+        return self.succeeded + self.failed
+
+    @property
+    def elapsed(self):
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def rate(self):
+        """
+        Records completed per second.
+        """
+        elapsed = self.elapsed
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def errors(self):
+        return [result for result in self.results if not result.ok]
+
+    def __repr__(self):
+        return (
+            f"BulkReport(succeeded={self.succeeded}, failed={self.failed}, "
+            f"elapsed={self.elapsed:.1f}s, rate={self.rate:.1f}/s)"
+        )
+
+
+class BulkWriter:
+    """
+    Validates and writes records for a resource over a bounded pool of workers.
+
+    Each record is validated with the resource's JSONValidator before it is sent. Invalid records and
+    failed writes are recorded in the report without stopping the batch. Failed writes are retried as
+    the RetryPolicy allows: 429 for every method; the policy's other retry statuses and connection
+    failures only for PUT and DELETE, so a record is never created twice.
+
+    `run` writes from a thread pool for the sync client; `run_async` awaits the writes of an
+    AsyncEvanceClient, at most `concurrency` at a time.
+    """
+
+    def __init__(self, resource, concurrency=8, retry_policy=None, progress=None, progress_every=100):
+        """
+        :param resource: The Resources instance to write to
+        :param concurrency: Maximum number of writes in flight
+        :param retry_policy: RetryPolicy used per record (default: 3 attempts with exponential backoff)
+        :param progress: Callable receiving the BulkReport every `progress_every` completed records
+        :param progress_every: How often `progress` is called
+        """
+        self.resource = resource
+        self.concurrency = max(1, concurrency)
+        self.retry_policy = retry_policy or RetryPolicy(max_attempts=3)
+        self.progress = progress
+        self.progress_every = max(1, progress_every)
+
+    def _body(self, record):
+        body = {"data": record}
+        if self.resource.body_validator:
+            self.resource.body_validator.validate(body)
+        return body
+
+    def _retryable(self, method, error, attempt):
+        if isinstance(error, (TooManyRequestsError, ServerError)):
+            status_code = error.status_code
+            if status_code is None and isinstance(error, TooManyRequestsError):
+                status_code = 429
+            if status_code is not None:
+                return self.retry_policy.should_retry_status(method, status_code, attempt)
+            # A server error without a known status is treated like a dropped connection
+            return self.retry_policy.should_retry_error(method, attempt)
+        if isinstance(error, (ConnectionError, TimeoutError)):
+            return self.retry_policy.should_retry_error(method, attempt)
+        return False
+
+    def _prepare(self, method, index, resource_id, record):
+        """
+        Return the BulkResult for a record and the request body to send (None for DELETE).
+        The result already holds an error if the record cannot be sent.
+        """
+        result = BulkResult(index, resource_id, record)
+        if method != "POST" and resource_id is None:
+            result.error = ValueError(f"Cannot {method} a record without an id.")
+            return result, None
+        try:
+            return result, self._body(record) if method != "DELETE" else None
+        except ValueError as error:
+            result.error = error
+            return result, None
+
+    @staticmethod
+    def _succeeded(result, response):
+        result.response = response
+        result.error = None
+        if result.resource_id is None:
+            data = getattr(response, "data", None)
+            result.resource_id = getattr(data, "id", None) if data is not None else None
+        return result
+
+    def _write(self, method, index, resource_id, record, send):
+        result, body = self._prepare(method, index, resource_id, record)
+        if result.error is not None:
+            return result
+
+        while True:
+            result.attempts += 1
+            try:
+                return self._succeeded(result, send(body))
+            except Exception as error:
+                result.error = error
+                if not self._retryable(method, error, result.attempts):
+                    return result
+                time.sleep(self.retry_policy.get_delay(result.attempts))
+
+    async def _write_async(self, method, index, resource_id, record, send, semaphore):
+        import asyncio
+
+        result, body = self._prepare(method, index, resource_id, record)
+        if result.error is not None:
+            return result
+
+        while True:
+            result.attempts += 1
+            try:
+                async with semaphore:
+                    response = await send(body)
+                return self._succeeded(result, response)
+            except Exception as error:
+                result.error = error
+                if not self._retryable(method, error, result.attempts):
+                    return result
+                await asyncio.sleep(self.retry_policy.get_delay(result.attempts))
+
+    def _collect(self, report, result):
+        report._add(result)
+        if self.progress is not None and report.completed % self.progress_every == 0:
+            self.progress(report)
+
+    def _finish(self, report):
+        report.finished_at = time.monotonic()
+        report.results.sort(key=lambda result: result.index)
+        if self.progress is not None and report.completed % self.progress_every:
+            self.progress(report)
+        return report
+
+    def run(self, method, tasks):
+        """
+        Run writes over the worker pool.
+
+        :param method: "POST", "PUT" or "DELETE"
+        :param tasks: Iterable of (resource_id, record, send) tuples, where send(body) performs the write
+        :return: A BulkReport with one BulkResult per task, in input order
+        """
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+        report = BulkReport()
+        window = self.concurrency * 2
+        pending = set()
+
+        def collect(done):
+            for future in done:
+                pending.discard(future)
+                self._collect(report, future.result())
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for index, (resource_id, record, send) in enumerate(tasks):
+                if len(pending) >= window:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                pending.add(executor.submit(self._write, method, index, resource_id, record, send))
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+
+        return self._finish(report)
+
+    async def run_async(self, method, tasks):
+        """
+        Run awaitable writes as tasks, with at most `concurrency` requests in flight.
+
+        :param method: "POST", "PUT" or "DELETE"
+        :param tasks: Iterable of (resource_id, record, send) tuples, where send(body) is a coroutine
+            function performing the write
+        :return: A BulkReport with one BulkResult per task, in input order
+        """
+        import asyncio
+
+        report = BulkReport()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        window = self.concurrency * 2
+        pending = set()
+
+        try:
+            for index, (resource_id, record, send) in enumerate(tasks):
+                if len(pending) >= window:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        self._collect(report, task.result())
+                pending.add(asyncio.ensure_future(
+                    self._write_async(method, index, resource_id, record, send, semaphore)
+                ))
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    self._collect(report, task.result())
+        finally:
+            for task in pending:
+                task.cancel()
+
+        return self._finish(report)
@@ -0,0 +1,211 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlencode
+
+
+def cache_key(url, params=None):
+    """
+    Build the cache key for a GET request from its URL and query parameters (in a stable order).
+    """
+    if not params:
+        return url
+    items = sorted(params.items(), key=lambda item: item[0])
+    return f"{url}?{urlencode(items, doseq=True)}"
+
+
+# Characters that may follow an invalidated path in a key: a nested path, an extension or a query
+_PATH_BOUNDARIES = ("/", ".", "?")
+
+
+def _below(key, prefix):
+    """
+    Return True if `key` is `prefix` itself or a path below it, so "products" does not match
+    "products-archive.json".
+    """
+    return key.startswith(prefix) and (len(key) == len(prefix) or key[len(prefix)] in _PATH_BOUNDARIES)
+
+
+class CacheEntry:
+    """
+    A cached response body with the validators needed to revalidate it.
+    """
+    __slots__ = ("content", "etag", "last_modified", "expires_at")
+
+    def __init__(self, content, etag=None, last_modified=None, expires_at=None):
+        self.content = content
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+
+    @classmethod
+    def from_response(cls, content, headers, ttl):
+        """
+        Build an entry from a response body and headers. Returns None if the response must not be stored.
+        """
+        cache_control = (headers.get("Cache-Control") or "").lower()
+        if "no-store" in cache_control:
+            return None
+        return cls(content, headers.get("ETag"), headers.get("Last-Modified"), time.time() + ttl)
+
+    def is_fresh(self):
+        return self.expires_at is not None and time.time() < self.expires_at
+
+    def can_revalidate(self):
+        return bool(self.etag or self.last_modified)
+
+    def validators(self):
+        """
+        Return the conditional request headers for revalidating this entry.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def refresh(self, ttl):
+        """
+        Mark the entry as fresh again after the server confirmed it is unchanged (304).
+        """
+        self.expires_at = time.time() + ttl
+
+
+class MemoryCache:
+    """
+    In-process LRU response cache bounded by number of entries and, optionally, total body size.
+    """
+
+    def __init__(self, ttl=300, max_entries=1024, max_bytes=None):
+        """
+        :param ttl: Seconds an entry is served without revalidation
+        :param max_entries: Maximum number of cached responses
+        :param max_bytes: Maximum total size of cached bodies (default: unbounded)
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Return the entry for `key` (fresh or stale), or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry):
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous.content)
+            self._entries[key] = entry
+            self._size += len(entry.content)
+            while self._entries and (
+                    len(self._entries) > self.max_entries
+                    or (self.max_bytes is not None and self._size > self.max_bytes)
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.content)
+
+    def invalidate(self, prefix):
+        """
+        Remove the entry for `prefix` and every entry below it, e.g. ".../products" removes
+        ".../products.json?page=2" and ".../products/1.json" but not ".../products-archive.json".
+        """
+        with self._lock:
+            for key in [key for key in self._entries if _below(key, prefix)]:
+                self._size -= len(self._entries.pop(key).content)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class DiskCache:
+    """
+    Response cache persisted in a SQLite file, so it survives restarts and can be shared by processes.
+    Least recently used entries are evicted once `max_entries` is exceeded.
+    """
+
+    def __init__(self, path, ttl=300, max_entries=10000):
+        """
+        :param path: Path of the SQLite cache file
+        :param ttl: Seconds an entry is served without revalidation
+        :param max_entries: Maximum number of cached responses
+        """
+        self.path = os.path.expanduser(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        import sqlite3
+
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, content BLOB NOT NULL, etag TEXT, last_modified TEXT,"
+            " expires_at REAL, accessed_at REAL NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+
+    def get(self, key):
+        """
+        Return the entry for `key` (fresh or stale), or None.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT content, etag, last_modified, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        return CacheEntry(bytes(row[0]), row[1], row[2], row[3])
+
+    def set(self, key, entry):
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, entry.content, entry.etag, entry.last_modified, entry.expires_at, time.time())
+            )
+            self._connection.execute(
+                "DELETE FROM responses WHERE key IN ("
+                " SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+
+    def invalidate(self, prefix):
+        """
+        Remove the entry for `prefix` and every entry below it (see MemoryCache.invalidate).
+        """
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM responses WHERE key = ? OR substr(key, 1, ?) IN (?, ?, ?)",
+                (prefix, len(prefix) + 1) + tuple(prefix + boundary for boundary in _PATH_BOUNDARIES)
+            )
+
+    def clear(self):
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
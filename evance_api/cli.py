@@ -0,0 +1,98 @@
+import argparse
+import sys
+
+from .auth import EvanceAuth
+from .client import EvanceClient
+from .export import Exporter
+from .resources.contacts import Contacts
+from .resources.products import Products
+
+RESOURCES = {
+    "products": Products,
+    "contacts": Contacts,
+}
+
+
+def parse_param(resource, option):
+    """
+    Parse a "key=value" option into a typed query parameter for the resource.
+
+    List parameters are comma separated (e.g., "sku:in=AB-1,AB-2").
+
+    :raises ValueError: If the option is malformed or the parameter is not accepted
+    """
+    key, separator, value = option.partition("=")
+    if not separator:
+        raise ValueError(f"Expected key=value, got '{option}'")
+    expected_type = resource.accepted_params.get(key)
+    if expected_type is list:
+        value = value.split(",")
+    elif expected_type is int:
+        value = int(value)
+    resource.param_validator.check(key, value)
+    return key, value
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="evance-export",
+        description="Stream every record of an Evance resource to an NDJSON, CSV or Parquet file.",
+    )
+    parser.add_argument("resource", choices=sorted(RESOURCES), help="Resource to export")
+    parser.add_argument("output", help="Output path; the format and gzip compression follow the extension "
+                                       "(e.g. products.ndjson.gz, contacts.csv, products.parquet)")
+    parser.add_argument("--base-url", required=True, help="Base URL of the account, e.g. https://example.evance.me")
+    parser.add_argument("--credentials", required=True,
+                        help="JSON file with account, client_id and private_key")
+    parser.add_argument("--api-version", default="v2", help="API version (default: v2)")
+    parser.add_argument("--format", choices=["ndjson", "csv", "parquet"], help="Override the output format")
+    parser.add_argument("--compression", help="gzip for NDJSON/CSV, or a Parquet codec (e.g. snappy, zstd)")
+    parser.add_argument("--fields", help="Comma separated columns as dotted paths, e.g. id,sku,pricing.price")
+    parser.add_argument("--param", action="append", default=[], metavar="KEY=VALUE",
+                        help="Query parameter filter, may be repeated (e.g. --param modifiedOn:min=2024-01-01)")
+    parser.add_argument("--page-limit", type=int, default=100, help="Records per page (default: 100)")
+    parser.add_argument("--checkpoint-every", type=int, default=10,
+                        help="Pages between checkpoints (default: 10)")
+    parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint and start over")
+    parser.add_argument("--quiet", action="store_true", help="Do not report progress")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    auth = EvanceAuth(base_url=args.base_url)
+    auth.from_json(args.credentials)
+
+    with EvanceClient(auth, args.api_version) as client:
+        resource = RESOURCES[args.resource](client)
+        try:
+            params = dict(parse_param(resource, option) for option in args.param)
+        except ValueError as error:
+            print(f"evance-export: {error}", file=sys.stderr)
+            return 2
+
+        def progress(records):
+            print(f"\r{records} records exported", end="", file=sys.stderr, flush=True)
+
+        exporter = Exporter(
+            resource,
+            args.output,
+            format=args.format,
+            compression=args.compression,
+            schema=args.fields.split(",") if args.fields else None,
+            params=params,
+            page_limit=args.page_limit,
+            checkpoint_every=args.checkpoint_every,
+            resume=not args.restart,
+            progress=None if args.quiet else progress,
+        )
+        records = exporter.run()
+
+    if not args.quiet:
+        print(f"\r{records} records exported to {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
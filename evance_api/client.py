@@ -1,27 +1,125 @@
-import requests
-import warnings
-from urllib3.exceptions import InsecureRequestWarning
-from .exceptions import (
-    UnauthorizedError,
-    ForbiddenError,
-    NotFoundError,
-    MethodNotAllowedError,
-    ServerError,
-    UnexpectedError, UnprocessableError,
-)
+import threading
+import time
+from .cache import CacheEntry, cache_key
+from .coalesce import SingleFlight
+from .compression import compress
+from .json_backend import get_codec
+from .metrics import RequestEvent
+from .exceptions import UnexpectedError, error_for_status
+from .transport import HTTP2Transport, RequestsTransport
 
 class EvanceClient:
-    def __init__(self, auth, api_version=""):
+    def __init__(
+            self,
+            auth,
+            api_version="",
+            pool_connections=10,
+            pool_maxsize=10,
+            pool_block=False,
+            max_retries=3,
+            timeout=None,
+            json_codec=None,
+            retry_policy=None,
+            throttle=None,
+            cache=None,
+            coalesce=False,
+            instrumentation=None,
+            transport=None,
+            http2=False,
+            accept_encoding=None,
+            compress_requests=None,
+            compress_min_size=1024
+    ):
         """
         Initialize the API client with authentication.
 
+        The client keeps a single transport for its lifetime (by default a pooled, keep-alive requests
+        session). The transport is shared with `auth`, so token requests and resource requests reuse the
+        same connections.
+
         :param auth: An instance of the EvanceAuth class
+        :param api_version: API version segment of the base URL (e.g., "v2")
+        :param pool_connections: Number of per-host connection pools to cache
+        :param pool_maxsize: Maximum number of connections kept alive per host
+        :param pool_block: Block when the pool is exhausted instead of opening extra connections
+        :param max_retries: Retries for connections that fail or are dropped before a response arrives
+        :param timeout: Default timeout in seconds (or a (connect, read) tuple) for every request
+        :param json_codec: JSON backend for request bodies, responses and to_json: None (standard
+                           library), "orjson", "ujson", "auto" or a JSONCodec instance
+        :param retry_policy: A RetryPolicy for 429/5xx responses and connection failures (default: no retries)
+        :param throttle: An AdaptiveThrottle that paces requests and slows down under server pressure
+        :param cache: A MemoryCache or DiskCache for GET responses, revalidated with ETag/Last-Modified
+        :param coalesce: Share one network call between concurrent identical GET requests
+        :param instrumentation: An Instrumentation hook (e.g., MetricsCollector) or a list of them
+        :param transport: A Transport that sends the requests (default: a RequestsTransport built from the
+                          pool settings above, which are ignored when a transport is given)
+        :param http2: Multiplex requests over one HTTP/2 connection per host (an HTTP2Transport with up to
+                      pool_maxsize connections when falling back to HTTP/1.1). Requires httpx and h2.
+        :param accept_encoding: Accept-Encoding header for responses (default: every coding the transport
+                                can decode, e.g. "gzip, deflate, br, zstd"; "identity" disables compression)
+        :param compress_requests: Compress request bodies with "gzip", "deflate", "br" or "zstd". If the
+                                  server answers 415, the body is resent uncompressed and compression is
+                                  switched off for this client.
+        :param compress_min_size: Bodies smaller than this many bytes are sent uncompressed
         """
         self.auth = auth
         self.api_version = api_version
         self.base_url = f"{self.auth.base_url}/api/{self.api_version}"
+        self.timeout = timeout
+        self.json_codec = get_codec(json_codec)
+        self.retry_policy = retry_policy
+        self.throttle = throttle
+        self.cache = cache
+        self.single_flight = SingleFlight() if coalesce else None
+        self.pool_maxsize = pool_maxsize
+        self.accept_encoding = accept_encoding
+        if compress_requests is not None:
+            compress(b"", compress_requests)  # Fail early on unknown codings or missing libraries
+        self.compress_requests = compress_requests
+        self.compress_min_size = compress_min_size
+        if transport is None and http2:
+            transport = HTTP2Transport(max_connections=pool_maxsize, max_retries=max_retries)
+        elif transport is None:
+            transport = RequestsTransport(pool_connections, pool_maxsize, pool_block, max_retries)
+        self.transport = transport
+        self._lock = threading.Lock()
+        self.instrumentation = None
+        if instrumentation is not None:
+            if not isinstance(instrumentation, (list, tuple)):
+                instrumentation = (instrumentation,)
+            self.instrumentation = tuple(instrumentation)
+            for hook in self.instrumentation:
+                hook.attach(self)
+
+        # Authentication shares the transport and its pooled connections, unless it was given its own
+        if getattr(self.auth, "transport", None) is None:
+            self.auth.transport = self.transport
+
+    @property
+    def session(self):
+        """
+        The underlying requests.Session, or None when the transport does not use one or is closed.
+        """
+        return getattr(self.transport, "session", None)
 
-    def request(self, method, endpoint, params=None, json=None):
+    def close(self):
+        """
+        Close the transport and release its connections.
+        """
+        with self._lock:
+            if self.transport is not None:
+                self.transport.close()
+                if getattr(self.auth, "transport", None) is self.transport:
+                    self.auth.transport = None
+                self.transport = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def request(self, method, endpoint, params=None, json=None, raw=False, deadline=None):
         """
         Make a request to the API.
 
@@ -29,68 +127,227 @@ class EvanceClient:
         :param method: HTTP method (GET, POST, etc.)
         :param endpoint: API endpoint (e.g., 'products')
         :param params: Query parameters
+        :param raw: Return the undecoded response body (bytes) instead of the parsed JSON
+        :param deadline: Time budget in seconds for the call including retries (default: retry_policy.deadline)
         :return: JSON response from the API
         """
-        headers = {"Authorization": f"Bearer {self.auth.token}"}
-        url = f"{self.base_url}/{endpoint}"
+        if self.single_flight is not None and method == "GET":
+            # Concurrent identical GETs share one call; every caller receives the same result
+            key = (cache_key(f"{self.base_url}/{endpoint}", params), raw)
+            return self.single_flight.do(key, lambda: self._request(method, endpoint, params, json, raw, deadline))
+        return self._request(method, endpoint, params, json, raw, deadline)
 
+    @property
+    def coalescing_stats(self):
+        """
+        Counters for coalesced GETs: "executed" reached the network, "coalesced" were saved.
+        """
+        if self.single_flight is None:
+            return {"executed": 0, "coalesced": 0}
+        return self.single_flight.stats()
+
+    def _request(self, method, endpoint, params, json, raw, deadline):
+        if self.instrumentation is None:
+            return self._execute(method, endpoint, params, json, raw, deadline)
+
+        event = RequestEvent(method, endpoint, f"{self.base_url}/{endpoint}")
+        for hook in self.instrumentation:
+            hook.before_request(event)
         try:
-            # Suppress InsecureRequestWarning when debug_mode is enabled
-            if self.auth.debug_mode:
-                with warnings.catch_warnings():
-                    warnings.simplefilter("ignore", InsecureRequestWarning)
-                    response = requests.request(
-                        method,
-                        url,
-                        params=params,
-                        json=json,
-                        headers=headers,
-                        verify=False
-                    )
-            else:
-                response = requests.request(
-                    method,
-                    url,
-                    params=params,
-                    json=json,
-                    headers=headers,
-                    verify=True
-                )
+            return self._execute(method, endpoint, params, json, raw, deadline, event)
+        except BaseException as error:
+            event.error = error
+            raise
+        finally:
+            event.elapsed = time.perf_counter() - event.started
+            for hook in self.instrumentation:
+                hook.after_request(event)
+
+    def _execute(self, method, endpoint, params, json, raw, deadline, event=None):
+        """
+        Perform a request: encode, consult the cache, send with retries and decode.
+
+        :param event: A RequestEvent to record measurements on, when instrumentation is enabled
+        """
+        headers = {}
+        if self.accept_encoding is not None:
+            headers["Accept-Encoding"] = self.accept_encoding
+        url = f"{self.base_url}/{endpoint}"
+        data = body = None
+        if json is not None:
+            data = body = self.json_codec.encode(json)
+            headers["Content-Type"] = "application/json"
+            encoding = self.compress_requests
+            if encoding is not None and len(data) >= self.compress_min_size:
+                body = compress(data, encoding)
+                headers["Content-Encoding"] = encoding
+            if event is not None:
+                event.bytes_sent = len(data)
+                event.wire_bytes_sent = len(body)
+
+        key = None
+        entry = None
+        if self.cache is not None and method == "GET":
+            key = cache_key(url, params)
+            entry = self.cache.get(key)
+            if entry is not None:
+                if entry.is_fresh():
+                    if event is not None:
+                        event.cache = "hit"
+                    return entry.content if raw else self.json_codec.loads(entry.content)
+                if entry.can_revalidate():
+                    headers.update(entry.validators())
+                else:
+                    entry = None  # Stale without an ETag or Last-Modified: fetch it again in full
 
+        # Authenticates on first use and refreshes proactively before the token expires
+        token = self.auth.get_token()
+
+        # The transport raises ConnectionError / TimeoutError when no response was received
+        response = self._send_with_retries(method, url, params, body, headers, token, deadline, event)
+        if response.status_code == 415 and body is not data:
+            # The server does not accept compressed bodies: resend as is and stop compressing
+            self.compress_requests = None
+            del headers["Content-Encoding"]
+            if event is not None:
+                event.wire_bytes_sent = len(data)
+            response = self._send_with_retries(method, url, params, data, headers, token, deadline, event)
+        if event is not None:
+            event.status = response.status_code
+            event.bytes_received = len(response.content)
+            event.wire_bytes_received = (
+                response.wire_bytes if response.wire_bytes is not None else event.bytes_received
+            )
+
+        if response.status_code == 304 and entry is not None:  # Not Modified: the cached copy is still valid
+            if event is not None:
+                event.cache = "revalidated"
+            entry.refresh(self.cache.ttl)
+            self.cache.set(key, entry)
+            content = entry.content
+        else:
             if response.status_code == 204:  # No Content
+                self._invalidate(method, endpoint)
                 return True  # Successfully handled no content case
-            response.raise_for_status()
-            return response.json()
-
-        except requests.exceptions.HTTPError as http_err:
-            status_code = response.status_code
-
-            if status_code == 401:
-                raise UnauthorizedError(response.text) from http_err
-            elif status_code == 403:
-                raise ForbiddenError(response.text) from http_err
-            elif status_code == 404:
-                raise NotFoundError(response.text) from http_err
-            elif status_code == 405:
-                raise MethodNotAllowedError() from http_err
-            elif status_code == 422:
-                raise UnprocessableError(response.text) from http_err
-            elif 500 <= status_code < 600:
-                raise ServerError(response.text) from http_err
+            if response.status_code >= 400:
+                raise error_for_status(response.status_code, response.text)
+            content = response.content
+            if key is not None:
+                self._store(key, content, response.headers)
             else:
-                raise UnexpectedError(f"Unexpected HTTP error: {http_err}") from http_err
+                self._invalidate(method, endpoint)
+
+        if raw:
+            return content
+        if event is not None:
+            started = time.perf_counter()
+            decoded = self.json_codec.loads(content)
+            event.parse_time = time.perf_counter() - started
+            return decoded
+        return self.json_codec.loads(content)
+
+    def _store(self, key, content, headers):
+        """
+        Store a GET response in the cache.
+        """
+        entry = CacheEntry.from_response(content, headers, self.cache.ttl)
+        if entry is not None:
+            self.cache.set(key, entry)
+
+    def _invalidate(self, method, endpoint):
+        """
+        Drop cached responses affected by a successful write: the collection the written resource
+        belongs to, its items and anything nested below them.
+        """
+        if self.cache is None or method in ("GET", "HEAD", "OPTIONS"):
+            return
+        path = endpoint[:-len(".json")] if endpoint.endswith(".json") else endpoint
+        collection = path if method == "POST" else path.rsplit("/", 1)[0]
+        self.cache.invalidate(f"{self.base_url}/{collection}")
+
+    def _send_with_retries(self, method, url, params, data, headers, token, deadline=None, event=None):
+        """
+        Send a request, refreshing a rejected token once and applying the retry policy and throttle.
 
-        except requests.exceptions.ConnectionError as conn_err:
-            raise ConnectionError() from conn_err
+        :param event: A RequestEvent whose attempt count is updated, when instrumentation is enabled
+        :return: The final response (which may still be an error response)
+        """
+        policy = self.retry_policy
+        if deadline is None and policy is not None:
+            deadline = policy.deadline
+        expires = time.monotonic() + deadline if deadline is not None else None
+
+        attempt = 0
+        refreshed = False
+        while True:
+            attempt += 1
+            if event is not None:
+                event.attempts += 1
+            if self.throttle is not None:
+                self.throttle.acquire()
+            try:
+                response = self._send(method, url, params, data, headers, token, self._attempt_timeout(expires))
+            except (ConnectionError, TimeoutError):
+                if policy is None or not policy.should_retry_error(method, attempt):
+                    raise
+                if not self._wait(policy.get_delay(attempt), expires):
+                    raise
+                continue
+
+            if response.status_code == 401 and not refreshed and self.auth.can_refresh():
+                # The token was rejected: refresh it once (shared by all threads) and retry the call
+                token = self.auth.refresh(token)
+                refreshed = True
+                attempt -= 1
+                if event is not None:
+                    event.attempts -= 1
+                continue
 
-        except requests.exceptions.Timeout as timeout_err:
-            raise TimeoutError() from timeout_err
+            retry_after = response.headers.get("Retry-After")
+            if self.throttle is not None:
+                self.throttle.feedback(response.status_code, retry_after)
+            if (policy is not None
+                    and policy.should_retry_status(method, response.status_code, attempt)
+                    and self._wait(policy.get_delay(attempt, retry_after), expires)):
+                continue
+            return response
+
+    @staticmethod
+    def _wait(delay, expires):
+        """
+        Sleep for `delay` seconds unless that would overrun the deadline. Return True if slept.
+        """
+        if expires is not None and time.monotonic() + delay >= expires:
+            return False
+        time.sleep(delay)
+        return True
 
-        except requests.exceptions.RequestException as req_err:
-            raise UnexpectedError(f"An unexpected error occurred: {response.status_code}: {req_err}") from req_err
+    def _attempt_timeout(self, expires):
+        """
+        Return the timeout for the next attempt, shortened so it cannot overrun the deadline.
+        """
+        if expires is None:
+            return self.timeout
+        remaining = max(expires - time.monotonic(), 0.001)
+        if self.timeout is None:
+            return remaining
+        if isinstance(self.timeout, tuple):
+            return tuple(remaining if value is None else min(value, remaining) for value in self.timeout)
+        return min(self.timeout, remaining)
+
+    def _send(self, method, url, params, data, headers, token, timeout=None):
+        """
+        Send a request through the transport.
+        """
+        transport = self.transport
+        if transport is None:
+            raise UnexpectedError("The client has been closed.")
+        headers = dict(headers, Authorization=f"Bearer {token}")
+        # Certificate verification is disabled in debug_mode
+        return transport.send(method, url, params, data, headers, timeout, not self.auth.debug_mode)
 
-    def get(self, endpoint, params=None):
-        return self.request("GET", endpoint, params=params)
+    def get(self, endpoint, params=None, raw=False):
+        return self.request("GET", endpoint, params=params, raw=raw)
 
     def post(self, endpoint, json=None):
         return self.request("POST", endpoint, json=json)
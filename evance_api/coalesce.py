@@ -0,0 +1,118 @@
+import threading
+
+
+class _Call:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key: the first caller runs the function and every caller
+    that arrives while it is running waits for, and receives, the same result (or exception).
+
+    Callers receive the same object, so results should be treated as read-only.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key, function):
+        """
+        Run `function` for `key`, or wait for the call already running for `key`.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = function()
+            return call.result
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    def stats(self):
+        """
+        Return counters: calls that reached the network and calls answered by another caller's request.
+        """
+        return {"executed": self.executed, "coalesced": self.coalesced}
+
+
+class _AsyncCall:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task):
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncSingleFlight:
+    """
+    asyncio counterpart of SingleFlight: concurrent tasks with the same key await one shared call.
+
+    The call runs in its own task and every caller awaits it through asyncio.shield, so cancelling
+    one caller (e.g., with asyncio.wait_for) does not cancel the others. The call is only cancelled
+    once every caller waiting for it has been cancelled.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    async def do(self, key, function):
+        """
+        Await `function()` for `key`, or the call already in flight for `key`.
+        """
+        import asyncio  # Only needed by the asyncio client; keeps `import evance_api` light
+
+        call = self._calls.get(key)
+        if call is not None:
+            self.coalesced += 1
+        else:
+            call = self._calls[key] = _AsyncCall(asyncio.ensure_future(function()))
+            call.task.add_done_callback(lambda task: self._finished(key, task))
+            self.executed += 1
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            if call.waiters == 1 and not call.task.done():
+                call.task.cancel()  # Nobody else is waiting for the result
+            raise
+        finally:
+            call.waiters -= 1
+
+    def _finished(self, key, task):
+        call = self._calls.get(key)
+        if call is not None and call.task is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()  # Mark as retrieved when every caller was cancelled
+
+    def stats(self):
+        return {"executed": self.executed, "coalesced": self.coalesced}
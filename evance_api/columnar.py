@@ -0,0 +1,165 @@
+import json
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.compute
+    except ImportError:
+        raise ImportError(
+            "Columnar conversion requires pyarrow. Install it with: pip install evance_api_pyclient[columnar]"
+        ) from None
+    return pyarrow
+
+
+def _concat_tables(pyarrow, tables):
+    """
+    Concatenate page tables whose columns may differ (missing columns are filled with nulls).
+    """
+    try:
+        return pyarrow.concat_tables(tables, promote_options="permissive")
+    except TypeError:  # pyarrow < 14
+        return pyarrow.concat_tables(tables, promote=True)
+
+
+def _array(pyarrow, values):
+    """
+    Build an Arrow array from a column of decoded JSON values, letting Arrow infer the type.
+    Columns mixing incompatible types fall back to strings (nested values are JSON-encoded).
+    """
+    try:
+        return pyarrow.array(values)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+        return pyarrow.array(
+            [value if value is None or isinstance(value, str) else json.dumps(value) for value in values],
+            pyarrow.string(),
+        )
+
+
+def _flatten(pyarrow, table):
+    """
+    Flatten struct columns (nested objects) into "parent.child" columns, however deeply nested.
+    """
+    while any(pyarrow.types.is_struct(field.type) for field in table.schema):
+        table = table.flatten()
+    return table
+
+
+class TableBuilder:
+    """
+    Builds one Arrow table from pages of decoded items.
+
+    Each page is converted column by column (one list per column, handed straight to Arrow) and
+    then released, so no per-row Python objects are created beyond the decoded JSON itself. Integer,
+    float and boolean fields become typed columns, nested objects become "parent.child" columns and
+    lists become Arrow list columns. Repetitive string columns are dictionary encoded.
+    """
+
+    def __init__(self, columns=None, types=None, dictionary="auto"):
+        """
+        :param columns: Columns to keep, as flattened names (e.g., ["id", "sku", "pricing.price"])
+        :param types: Dictionary of column name to pyarrow type or type name (e.g., {"price": "float64"})
+        :param dictionary: Dictionary-encode string columns: "auto" (when at most half the values are
+            distinct), True (all), False (none), or a list of column names
+        """
+        self.pyarrow = _import_pyarrow()
+        self.columns = list(columns) if columns is not None else None
+        self.types = types or {}
+        self.dictionary = dictionary
+        self._keys = None
+        if self.columns is not None:
+            self._keys = list(dict.fromkeys(column.split(".", 1)[0] for column in self.columns))
+        self._tables = []
+
+    def add(self, items):
+        """
+        Convert a page of items (dictionaries) and append it to the table.
+        """
+        if not items:
+            return
+        keys = self._keys
+        if keys is None:
+            keys = list(dict.fromkeys(key for item in items for key in item))
+        arrays = [_array(self.pyarrow, [item.get(key) for item in items]) for key in keys]
+        self._tables.append(_flatten(self.pyarrow, self.pyarrow.Table.from_arrays(arrays, names=keys)))
+
+    def _encode_dictionary(self, name, column):
+        if not self.pyarrow.types.is_string(column.type):
+            return False
+        if isinstance(self.dictionary, (list, tuple, set)):
+            return name in self.dictionary
+        if self.dictionary == "auto":
+            return len(column) > 0 and self.pyarrow.compute.count_distinct(column).as_py() * 2 <= len(column)
+        return bool(self.dictionary)
+
+    def build(self):
+        """
+        Return the pyarrow.Table of every page added so far.
+        """
+        pyarrow = self.pyarrow
+        if self._tables:
+            table = _concat_tables(pyarrow, self._tables)
+        else:
+            table = pyarrow.table({column: pyarrow.array([], pyarrow.null()) for column in self.columns or []})
+
+        if self.columns is not None:
+            table = pyarrow.table({
+                column: table.column(column) if column in table.column_names else pyarrow.nulls(len(table))
+                for column in self.columns
+            })
+
+        for name, column_type in self.types.items():
+            if name in table.column_names:
+                if isinstance(column_type, str):
+                    column_type = pyarrow.type_for_alias(column_type)
+                index = table.column_names.index(name)
+                table = table.set_column(index, name, table.column(name).cast(column_type))
+
+        encoded = False
+        for index, name in enumerate(table.column_names):
+            column = table.column(name)
+            if self._encode_dictionary(name, column):
+                table = table.set_column(index, name, pyarrow.compute.dictionary_encode(column))
+                encoded = True
+        return table.unify_dictionaries() if encoded else table
+
+
+def pages_to_arrow(pages, columns=None, types=None, dictionary="auto"):
+    """
+    Build one Arrow table from an iterable of pages (APIResponse objects or lists of dictionaries).
+
+    :return: A pyarrow.Table
+    """
+    builder = TableBuilder(columns, types, dictionary)
+    for page in pages:
+        builder.add(page.to_list() if hasattr(page, "to_list") else page)
+    return builder.build()
+
+
+def table_to_numpy(table):
+    """
+    Convert an Arrow table into a dictionary of column name to NumPy array.
+
+    Numeric columns convert without a Python object per value; integer columns with missing
+    values become float arrays with NaN.
+    """
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "to_numpy() requires numpy. Install it with: pip install evance_api_pyclient[columnar]"
+        ) from None
+    return {name: table.column(name).to_numpy() for name in table.column_names}
+
+
+def table_to_dataframe(table):
+    """
+    Convert an Arrow table into a pandas DataFrame (dictionary-encoded columns become categoricals).
+    """
+    try:
+        import pandas  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "to_dataframe() requires pandas. Install it with: pip install evance_api_pyclient[columnar]"
+        ) from None
+    return table.to_pandas()
@@ -0,0 +1,104 @@
+import zlib
+
+ENCODINGS = ("gzip", "deflate", "br", "zstd")
+
+
+def _import_brotli():
+    try:
+        import brotli
+    except ImportError:
+        try:
+            import brotlicffi as brotli
+        except ImportError:
+            raise ImportError(
+                "Brotli compression requires brotli. Install it with: pip install evance_api_pyclient[compression]"
+            ) from None
+    return brotli
+
+
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "Zstandard compression requires zstandard. Install it with: pip install evance_api_pyclient[compression]"
+        ) from None
+    return zstandard
+
+
+def _installed(importer):
+    try:
+        importer()
+    except ImportError:
+        return False
+    return True
+
+
+def available_encodings():
+    """
+    Return the content codings this installation can compress and decode, best first.
+    """
+    encodings = []
+    if _installed(_import_zstandard):
+        encodings.append("zstd")
+    if _installed(_import_brotli):
+        encodings.append("br")
+    encodings.extend(("gzip", "deflate"))
+    return encodings
+
+
+def accept_encoding():
+    """
+    Return an Accept-Encoding header value advertising every available coding.
+    """
+    return ", ".join(available_encodings())
+
+
+def compress(data, encoding, level=None):
+    """
+    Compress a request body.
+
+    :param data: The encoded body (bytes)
+    :param encoding: "gzip", "deflate", "br" or "zstd"
+    :param level: Compression level (default: a fast level suited to JSON, 6 for gzip/deflate,
+                  5 for brotli, 3 for zstd)
+    :return: The compressed bytes
+    """
+    if encoding == "gzip":
+        compressor = zlib.compressobj(6 if level is None else level, zlib.DEFLATED, 31)
+        return compressor.compress(data) + compressor.flush()
+    if encoding == "deflate":
+        return zlib.compress(data, 6 if level is None else level)
+    if encoding == "br":
+        return _import_brotli().compress(data, quality=5 if level is None else level)
+    if encoding == "zstd":
+        return _import_zstandard().ZstdCompressor(level=3 if level is None else level).compress(data)
+    raise ValueError(f"Unsupported content encoding: {encoding}. Use one of: {', '.join(ENCODINGS)}")
+
+
+def decompress(data, content_encoding):
+    """
+    Decode a body according to its Content-Encoding header, which may list several codings
+    (applied in order, so they are removed in reverse).
+
+    :param data: The body as received
+    :param content_encoding: The Content-Encoding header value, e.g. "gzip" or "gzip, br"
+    :return: The decoded bytes
+    """
+    for encoding in reversed([value.strip().lower() for value in content_encoding.split(",")]):
+        if encoding in ("", "identity"):
+            continue
+        if encoding in ("gzip", "x-gzip"):
+            data = zlib.decompressobj(zlib.MAX_WBITS | 32).decompress(data)  # gzip or zlib header
+        elif encoding == "deflate":
+            try:
+                data = zlib.decompress(data)
+            except zlib.error:  # Raw deflate stream without a zlib header
+                data = zlib.decompress(data, -zlib.MAX_WBITS)
+        elif encoding == "br":
+            data = _import_brotli().decompress(data)
+        elif encoding == "zstd":
+            data = _import_zstandard().ZstdDecompressor().decompressobj().decompress(data)
+        else:
+            raise ValueError(f"Unsupported content encoding: {encoding}")
+    return data
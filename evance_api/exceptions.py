@@ -1,5 +1,7 @@
 class EvanceException(Exception):
     """Base exception for all Evance API errors."""
+    status_code = None  # HTTP status of the failed response, set by error_for_status
+
     def __init__(self, message=None):
         #self.default_message = 'An error has occurred.'
         if message is None:
@@ -26,6 +28,10 @@ class MethodNotAllowedError(EvanceException):
     """Exception for 405 Method Not Allowed errors."""
     default_message = "The HTTP method used is not allowed for this endpoint."
 
+class TooManyRequestsError(EvanceException):
+    """Exception for 429 Too Many Requests errors."""
+    default_message = "Too many requests. Please slow down and try again later."
+
 class ServerError(EvanceException):
     """Exception for 500+ Server errors."""
     default_message = "A server error occurred. Please try again later."
@@ -33,3 +39,32 @@ class ServerError(EvanceException):
 class UnexpectedError(EvanceException):
     """Exception for unexpected errors."""
     default_message = "An unexpected error occurred."
+
+
+def error_for_status(status_code, text, reason=None):
+    """
+    Map an HTTP error status to the matching Evance exception.
+
+    :param status_code: HTTP status code of the failed response
+    :param text: Response body, used as the exception message
+    :param reason: The underlying error, used for unexpected status codes
+    :return: An EvanceException instance (not raised)
+    """
+    if status_code == 401:
+        error = UnauthorizedError(text)
+    elif status_code == 403:
+        error = ForbiddenError(text)
+    elif status_code == 404:
+        error = NotFoundError(text)
+    elif status_code == 405:
+        error = MethodNotAllowedError()
+    elif status_code == 422:
+        error = UnprocessableError(text)
+    elif status_code == 429:
+        error = TooManyRequestsError(text)
+    elif 500 <= status_code < 600:
+        error = ServerError(text)
+    else:
+        error = UnexpectedError(f"Unexpected HTTP error: {reason or status_code}")
+    error.status_code = status_code
+    return error
@@ -0,0 +1,446 @@
+import contextlib
+import csv
+import glob
+import gzip
+import io
+import json
+import os
+import tempfile
+
+from .json_backend import get_codec
+
+FORMATS = ("ndjson", "csv", "parquet")
+
+EXTENSIONS = {
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".csv": "csv",
+    ".parquet": "parquet",
+}
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError(
+            "Parquet export requires pyarrow. Install it with: pip install evance_api_pyclient[parquet]"
+        ) from None
+    return pyarrow, pyarrow.parquet
+
+
+def _split_compression(path):
+    """
+    Return the lower-cased file name without a ".gz" suffix, and the compression that suffix implies.
+    """
+    name = path.rstrip("/\\").lower()
+    if name.endswith(".gz"):
+        return name[:-3], "gzip"
+    return name, None
+
+
+def detect_format(path):
+    """
+    Guess the export format and compression from a file name, e.g. "products.csv.gz" -> ("csv", "gzip").
+
+    :raises ValueError: If the extension is not recognised
+    """
+    name, compression = _split_compression(path)
+    extension = os.path.splitext(name)[1]
+    if extension not in EXTENSIONS:
+        raise ValueError(f"Cannot infer the export format from '{path}'; pass format= one of {FORMATS}")
+    return EXTENSIONS[extension], compression
+
+
+def _encode_cell(value, codec):
+    if isinstance(value, (dict, list)):
+        return codec.dumps(value)
+    return value
+
+
+class Flattener:
+    """
+    Turns nested records into flat rows.
+
+    Without a schema, nested dictionaries become "parent.child" columns and lists are JSON-encoded.
+    With a schema, exactly the given columns are produced, in order. The schema is either a list of
+    dotted paths (e.g. ["id", "pricing.price", "images.0.url"]) or a dictionary mapping each output
+    column to a dotted path or to a callable receiving the record.
+    """
+
+    def __init__(self, schema=None, separator=".", codec=None):
+        self.separator = separator
+        self.codec = get_codec(codec)
+        self.getters = None
+        if schema is not None:
+            if not isinstance(schema, dict):
+                schema = {column: column for column in schema}
+            self.getters = [
+                (column, path if callable(path) else self._path_getter(path))
+                for column, path in schema.items()
+            ]
+
+    @property
+    def columns(self):
+        """
+        Output columns, or None when they are inferred from the data.
+        """
+        return [column for column, _ in self.getters] if self.getters is not None else None
+
+    def _path_getter(self, path):
+        keys = [int(key) if key.isdigit() else key for key in path.split(self.separator)]
+
+        def get(record):
+            value = record
+            for key in keys:
+                try:
+                    value = value[key]
+                except (KeyError, IndexError, TypeError):
+                    return None
+            return value
+
+        return get
+
+    def _flatten_into(self, row, prefix, value):
+        for key, item in value.items():
+            column = f"{prefix}{key}"
+            if isinstance(item, dict) and item:
+                self._flatten_into(row, column + self.separator, item)
+            else:
+                row[column] = _encode_cell(item, self.codec)
+
+    def __call__(self, record):
+        if self.getters is not None:
+            return {column: _encode_cell(get(record), self.codec) for column, get in self.getters}
+        row = {}
+        self._flatten_into(row, "", record)
+        return row
+
+
+class _StreamWriter:
+    """
+    Appends encoded pages to a single file.
+
+    With gzip, each commit() ends the current gzip member, so the file is valid at every checkpoint and
+    can be truncated back to it on resume (concatenated members read back as one stream).
+    """
+
+    def __init__(self, path, compression=None):
+        if compression not in (None, "gzip"):
+            raise ValueError(f"Unsupported compression for {type(self).__name__}: {compression}")
+        self.path = path
+        self.compression = compression
+        self._file = None
+        self._stream = None
+
+    def open(self, state=None):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if state and os.path.exists(self.path):
+            self._file = open(self.path, "r+b")
+            self._file.truncate(state["offset"])  # Drop anything written after the last checkpoint
+            self._file.seek(0, os.SEEK_END)
+        else:
+            self._file = open(self.path, "wb")
+
+    @property
+    def offset(self):
+        return self._file.tell()
+
+    def _write(self, data):
+        if self._stream is None:
+            self._stream = gzip.GzipFile(fileobj=self._file, mode="wb") if self.compression else self._file
+        self._stream.write(data)
+
+    def commit(self):
+        """
+        Make everything written so far durable and return the state needed to resume after it.
+        """
+        if self._stream is not None and self._stream is not self._file:
+            self._stream.close()  # Writes the gzip trailer; the underlying file stays open
+        self._stream = None
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return {"offset": self._file.tell()}
+
+    def close(self, commit=True):
+        if self._file is None:
+            return
+        if commit:
+            self.commit()
+        self._file.close()
+        self._file = None
+
+
+class NDJSONWriter(_StreamWriter):
+    """
+    Writes one JSON document per line.
+    """
+
+    def __init__(self, path, compression=None, codec=None):
+        super().__init__(path, compression)
+        self.codec = get_codec(codec)
+
+    def write(self, rows):
+        encode = self.codec.encode
+        self._write(b"".join(encode(row) + b"\n" for row in rows))
+
+
+class CSVWriter(_StreamWriter):
+    """
+    Writes flat rows as CSV with a header line.
+
+    When no columns are given they are taken from the first page written; keys that only appear in
+    later pages are dropped, so pass a schema when records are sparse.
+    """
+
+    def __init__(self, path, compression=None, columns=None):
+        super().__init__(path, compression)
+        self.columns = list(columns) if columns is not None else None
+
+    def open(self, state=None):
+        if state and state.get("columns"):
+            self.columns = state["columns"]
+        super().open(state)
+
+    def write(self, rows):
+        if not rows:
+            return
+        buffer = io.StringIO()
+        if self.columns is None:
+            self.columns = list(dict.fromkeys(key for row in rows for key in row))
+        writer = csv.DictWriter(buffer, fieldnames=self.columns, extrasaction="ignore")
+        if self.offset == 0 and self._stream is None:
+            writer.writeheader()
+        writer.writerows(rows)
+        self._write(buffer.getvalue().encode("utf-8"))
+
+    def commit(self):
+        return dict(super().commit(), columns=self.columns)
+
+
+class ParquetWriter:
+    """
+    Writes flat rows as a directory of Parquet part files (one per checkpoint), readable as one dataset.
+
+    Each part is written to a temporary file and renamed when committed, so a crash never leaves a
+    truncated part behind. The column types are inferred from the first page (columns that are empty
+    there are stored as strings) unless a pyarrow schema is given.
+    """
+
+    def __init__(self, path, compression="snappy", columns=None, schema=None):
+        self.path = path
+        self.compression = compression or "snappy"
+        self.columns = list(columns) if columns is not None else None
+        self.schema = schema
+        self.parts = 0
+        self._writer = None
+        self._temp_path = None
+
+    def _part_path(self, number):
+        return os.path.join(self.path, f"part-{number:05d}.parquet")
+
+    def open(self, state=None):
+        os.makedirs(self.path, exist_ok=True)
+        self.parts = state["parts"] if state else 0
+        # Remove parts written after the last checkpoint and temporary files left by a crash
+        for leftover in glob.glob(os.path.join(self.path, "part-*.parquet")):
+            if int(os.path.basename(leftover)[5:10]) >= self.parts:
+                os.remove(leftover)
+        for leftover in glob.glob(os.path.join(self.path, ".part-*")):
+            os.remove(leftover)
+        if self.schema is None and self.parts:
+            _, parquet = _import_pyarrow()
+            self.schema = parquet.read_schema(self._part_path(0))
+
+    def _infer_schema(self, rows):
+        pyarrow, _ = _import_pyarrow()
+        columns = self.columns or list(dict.fromkeys(key for row in rows for key in row))
+        inferred = pyarrow.Table.from_pylist([{column: row.get(column) for column in columns} for row in rows]).schema
+        return pyarrow.schema([
+            field.with_type(pyarrow.string()) if pyarrow.types.is_null(field.type) else field
+            for field in inferred
+        ])
+
+    def write(self, rows):
+        if not rows:
+            return
+        pyarrow, parquet = _import_pyarrow()
+        if self.schema is None:
+            self.schema = self._infer_schema(rows)
+        if self._writer is None:
+            descriptor, self._temp_path = tempfile.mkstemp(dir=self.path, prefix=".part-")
+            os.close(descriptor)
+            self._writer = parquet.ParquetWriter(self._temp_path, self.schema, compression=self.compression)
+        self._writer.write_table(pyarrow.Table.from_pylist(rows, schema=self.schema))
+
+    def commit(self):
+        if self._writer is not None:
+            self._writer.close()
+            os.replace(self._temp_path, self._part_path(self.parts))
+            self._writer = None
+            self._temp_path = None
+            self.parts += 1
+        return {"parts": self.parts}
+
+    def close(self, commit=True):
+        if commit:
+            self.commit()
+        elif self._writer is not None:
+            self._writer.close()
+            with contextlib.suppress(OSError):
+                os.remove(self._temp_path)
+            self._writer = None
+
+
+class Exporter:
+    """
+    Streams every page of a resource into an NDJSON, CSV or Parquet file in bounded memory.
+
+    Pages are fetched one at a time (the next one in the background), flattened and appended to the
+    output; no more than two pages are held in memory. Every `checkpoint_every` pages the output is
+    flushed to disk and a small checkpoint file is written next to it, so an interrupted export resumes
+    from the page after the last checkpoint instead of starting over.
+    """
+
+    def __init__(
+            self,
+            resource,
+            path,
+            format=None,
+            compression=None,
+            schema=None,
+            params=None,
+            page_limit=100,
+            checkpoint_every=10,
+            resume=True,
+            progress=None,
+            separator="."
+    ):
+        """
+        :param resource: The Resources instance to export (e.g., Products(client))
+        :param path: Output file (a directory for Parquet)
+        :param format: "ndjson", "csv" or "parquet" (default: inferred from the path)
+        :param compression: "gzip" for NDJSON/CSV (default: inferred from a ".gz" suffix); a Parquet
+            codec such as "snappy" or "zstd" for Parquet
+        :param schema: Columns to export (see Flattener); NDJSON keeps records nested when omitted
+        :param params: Dictionary of additional query parameters (filters)
+        :param page_limit: Records requested per page
+        :param checkpoint_every: Pages written between checkpoints (and Parquet part files)
+        :param resume: Continue from an existing checkpoint; False starts over
+        :param progress: Callable receiving the number of records exported after each page
+        :param separator: Separator between nested keys in flattened column names and schema paths
+        """
+        # An explicit format only overrides the format; a ".gz" suffix still selects gzip
+        detected_compression = _split_compression(path)[1]
+        detected_format = format or detect_format(path)[0]
+        if detected_format not in FORMATS:
+            raise ValueError(f"Unknown export format: {detected_format}")
+        self.resource = resource
+        self.path = path
+        self.format = detected_format
+        self.compression = compression or detected_compression
+        self.params = dict(params or {})
+        self.page_limit = page_limit
+        self.checkpoint_every = max(1, checkpoint_every)
+        self.resume = resume
+        self.progress = progress
+        codec = getattr(resource.client, "json_codec", None)
+        self.flatten = Flattener(schema, separator, codec) if schema is not None or self.format != "ndjson" else None
+        self.writer = self._create_writer(codec)
+
+    def _create_writer(self, codec):
+        columns = self.flatten.columns if self.flatten is not None else None
+        if self.format == "ndjson":
+            return NDJSONWriter(self.path, self.compression, codec)
+        if self.format == "csv":
+            return CSVWriter(self.path, self.compression, columns)
+        return ParquetWriter(self.path, self.compression, columns)
+
+    @property
+    def checkpoint_path(self):
+        return self.path.rstrip("/\\") + ".checkpoint"
+
+    def _load_checkpoint(self):
+        try:
+            with open(self.checkpoint_path, "r") as file:
+                checkpoint = json.load(file)
+        except FileNotFoundError:
+            return None
+        if checkpoint.get("params") != self.params or checkpoint.get("page_limit") != self.page_limit:
+            raise ValueError(
+                f"The checkpoint {self.checkpoint_path} was written for a different query; "
+                f"pass resume=False to start over"
+            )
+        return checkpoint
+
+    def _save_checkpoint(self, page, records, writer_state):
+        checkpoint = {
+            "resource": self.resource.resource_name,
+            "params": self.params,
+            "page_limit": self.page_limit,
+            "page": page,
+            "records": records,
+            "writer": writer_state,
+        }
+        directory = os.path.dirname(self.checkpoint_path) or "."
+        descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix=".export-")
+        try:
+            with os.fdopen(descriptor, "w") as file:
+                json.dump(checkpoint, file)
+            os.replace(temp_path, self.checkpoint_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(temp_path)
+            raise
+
+    def _clear_checkpoint(self):
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.checkpoint_path)
+
+    def run(self):
+        """
+        Run (or resume) the export.
+
+        :return: The total number of records in the output
+        """
+        checkpoint = self._load_checkpoint() if self.resume and os.path.exists(self.path) else None
+        if checkpoint is None:
+            self._clear_checkpoint()
+        page = checkpoint["page"] if checkpoint else 0
+        records = checkpoint["records"] if checkpoint else 0
+        uncommitted = 0
+
+        self.writer.open(checkpoint["writer"] if checkpoint else None)
+        try:
+            query = dict(self.params, limit=self.page_limit, page=page + 1)
+            for response in self.resource.iter_pages(query, raw=True):
+                items = response.to_list()
+                if items:
+                    self.writer.write([self.flatten(item) for item in items] if self.flatten else items)
+                page += 1
+                records += len(items)
+                uncommitted += 1
+                if uncommitted >= self.checkpoint_every:
+                    self._save_checkpoint(page, records, self.writer.commit())
+                    uncommitted = 0
+                if self.progress is not None:
+                    self.progress(records)
+        except BaseException:
+            self.writer.close(commit=False)
+            raise
+
+        self.writer.close()
+        self._clear_checkpoint()
+        return records
+
+
+def export(resource, path, **options):
+    """
+    Export every record of a resource to a file; see Exporter for the options.
+
+    :return: The total number of records in the output
+    """
+    return Exporter(resource, path, **options).run()
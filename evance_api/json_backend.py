@@ -0,0 +1,107 @@
+import json
+
+
+class JSONCodec:
+    """
+    JSON encoder/decoder used by the clients and APIResponse. The default uses the standard library.
+    """
+    name = "json"
+
+    def loads(self, data):
+        """
+        Decode a JSON document.
+
+        :param data: JSON as bytes or str
+        """
+        return json.loads(data)
+
+    def dumps(self, obj):
+        """
+        Encode an object to a JSON string.
+        """
+        return json.dumps(obj)
+
+    def encode(self, obj):
+        """
+        Encode an object to UTF-8 JSON bytes, ready to be sent as a request body.
+        """
+        return json.dumps(obj).encode("utf-8")
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    JSON codec backed by orjson, which decodes straight from bytes and encodes to bytes.
+    """
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def loads(self, data):
+        return self._orjson.loads(data)
+
+    def dumps(self, obj):
+        return self._orjson.dumps(obj).decode("utf-8")
+
+    def encode(self, obj):
+        return self._orjson.dumps(obj)
+
+
+class UjsonCodec(JSONCodec):
+    """
+    JSON codec backed by ujson.
+    """
+    name = "ujson"
+
+    def __init__(self):
+        import ujson
+        self._ujson = ujson
+
+    def loads(self, data):
+        return self._ujson.loads(data)
+
+    def dumps(self, obj):
+        return self._ujson.dumps(obj, ensure_ascii=False)
+
+    def encode(self, obj):
+        return self.dumps(obj).encode("utf-8")
+
+
+CODECS = {
+    JSONCodec.name: JSONCodec,
+    OrjsonCodec.name: OrjsonCodec,
+    UjsonCodec.name: UjsonCodec,
+}
+
+# Fastest first, used when the codec is "auto"
+PREFERRED_CODECS = ("orjson", "ujson", "json")
+
+default_codec = JSONCodec()
+
+
+def get_codec(codec=None):
+    """
+    Resolve a JSON codec.
+
+    :param codec: None (standard library), a codec name ("json", "orjson", "ujson"), "auto" for the
+                  fastest installed backend, or a codec instance
+    :raises ValueError: If the codec name is unknown
+    :raises ImportError: If the requested backend is not installed
+    """
+    if codec is None:
+        return default_codec
+    if not isinstance(codec, str):
+        return codec
+    if codec == "auto":
+        for name in PREFERRED_CODECS:
+            try:
+                return CODECS[name]()
+            except ImportError:
+                continue
+    if codec not in CODECS:
+        raise ValueError(f"Unknown JSON codec: {codec}")
+    return CODECS[codec]()
@@ -0,0 +1,326 @@
+import re
+import threading
+import time
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_ID_SEGMENT = re.compile(r"(?<=/)\d+(?=/|\.|$)")
+
+
+def endpoint_label(endpoint):
+    """
+    Collapse numeric path segments so per-endpoint metrics have bounded cardinality,
+    e.g. "products/620313/downloads.json" -> "products/{id}/downloads.json".
+    """
+    return _ID_SEGMENT.sub("{id}", endpoint)
+
+
+class RequestEvent:
+    """
+    A single client request, as seen by instrumentation hooks.
+
+    before_request() receives it with the request fields set; after_request() receives the same object
+    once the request has finished, successfully or not.
+    """
+    __slots__ = (
+        "method", "endpoint", "url", "started", "elapsed", "status", "attempts",
+        "bytes_sent", "bytes_received", "wire_bytes_sent", "wire_bytes_received", "parse_time", "cache", "error",
+    )
+
+    def __init__(self, method, endpoint, url):
+        self.method = method
+        self.endpoint = endpoint
+        self.url = url
+        self.started = time.perf_counter()
+        self.elapsed = None  # Seconds, including retries and parsing
+        self.status = None  # Final HTTP status code, None for cache hits and failed connections
+        self.attempts = 0  # Attempts counted by the retry policy; attempts - 1 were retries
+        self.bytes_sent = 0  # Encoded request body, before compression
+        self.bytes_received = 0  # Response body, after decompression
+        self.wire_bytes_sent = 0  # Request body as sent (compressed when compress_requests applies)
+        self.wire_bytes_received = 0  # Response body as received (compressed when the server compressed it)
+        self.parse_time = 0.0  # Seconds spent decoding the JSON response
+        self.cache = None  # "hit" or "revalidated" when answered from the response cache
+        self.error = None  # The exception raised to the caller, if any
+
+    def __repr__(self):
+        return f"RequestEvent({self.method} {self.endpoint}, status={self.status}, elapsed={self.elapsed})"
+
+
+class Instrumentation:
+    """
+    Base class for instrumentation hooks passed to EvanceClient(instrumentation=...).
+
+    Override any of the methods; they are called synchronously on the calling thread (or event loop),
+    so keep them cheap. When no instrumentation is configured the client skips all of this entirely.
+    """
+
+    def attach(self, client):
+        """
+        Called once when the hook is attached to a client.
+        """
+
+    def before_request(self, event):
+        """
+        Called before a request is sent (or answered from the cache).
+        """
+
+    def after_request(self, event):
+        """
+        Called when a request has finished; `event.error` is set if it raised.
+        """
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, size):
+        self.counts = [0] * size
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, buckets, value):
+        self.sum += value
+        self.count += 1
+        for index, bound in enumerate(buckets):
+            if value <= bound:
+                self.counts[index] += 1
+                break
+
+    def cumulative(self):
+        total = 0
+        for count in self.counts:
+            total += count
+            yield total
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels):
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+
+
+class MetricsCollector(Instrumentation):
+    """
+    Collects per-endpoint latency histograms, status codes, bytes in/out (decoded and on the wire), retries,
+    JSON parse time and connection pool utilisation, and exports them in the Prometheus text format.
+
+    Endpoints are labelled by path with numeric IDs collapsed (see endpoint_label). One collector can
+    be shared by several clients.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, prefix="evance_client"):
+        """
+        :param buckets: Upper bounds, in seconds, of the latency histogram buckets
+        :param prefix: Prefix of the exported metric names
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self.pool_maxsize = 0
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.latency = {}  # (method, endpoint) -> _Histogram
+            self.parse = {}  # (method, endpoint) -> _Histogram
+            self.statuses = {}  # (method, endpoint, status) -> count
+            self.bytes_sent = {}  # (method, endpoint) -> bytes
+            self.bytes_received = {}
+            self.wire_bytes_sent = {}
+            self.wire_bytes_received = {}
+            self.retries = {}
+            self.errors = {}  # (method, endpoint, exception name) -> count
+            self.cache_hits = {}
+            self.in_flight = 0
+            self.max_in_flight = 0
+
+    def attach(self, client):
+        with self._lock:
+            self.pool_maxsize += getattr(client, "pool_maxsize", 0) or 0
+
+    def before_request(self, event):
+        with self._lock:
+            self.in_flight += 1
+            if self.in_flight > self.max_in_flight:
+                self.max_in_flight = self.in_flight
+
+    def after_request(self, event):
+        key = (event.method, endpoint_label(event.endpoint))
+        status = event.status if event.status is not None else ("cached" if event.cache == "hit" else "none")
+        with self._lock:
+            self.in_flight -= 1
+            histogram = self.latency.get(key)
+            if histogram is None:
+                histogram = self.latency[key] = _Histogram(len(self.buckets))
+            histogram.observe(self.buckets, event.elapsed)
+            if event.parse_time:
+                histogram = self.parse.get(key)
+                if histogram is None:
+                    histogram = self.parse[key] = _Histogram(len(self.buckets))
+                histogram.observe(self.buckets, event.parse_time)
+            status_key = key + (status,)
+            self.statuses[status_key] = self.statuses.get(status_key, 0) + 1
+            self.bytes_sent[key] = self.bytes_sent.get(key, 0) + event.bytes_sent
+            self.bytes_received[key] = self.bytes_received.get(key, 0) + event.bytes_received
+            self.wire_bytes_sent[key] = self.wire_bytes_sent.get(key, 0) + event.wire_bytes_sent
+            self.wire_bytes_received[key] = self.wire_bytes_received.get(key, 0) + event.wire_bytes_received
+            if event.attempts > 1:
+                self.retries[key] = self.retries.get(key, 0) + event.attempts - 1
+            if event.cache is not None:
+                cache_key = key + (event.cache,)
+                self.cache_hits[cache_key] = self.cache_hits.get(cache_key, 0) + 1
+            if event.error is not None:
+                error_key = key + (type(event.error).__name__,)
+                self.errors[error_key] = self.errors.get(error_key, 0) + 1
+
+    @property
+    def pool_utilisation(self):
+        """
+        Requests in flight as a fraction of the attached clients' connection pool size.
+        """
+        return self.in_flight / self.pool_maxsize if self.pool_maxsize else 0.0
+
+    def snapshot(self):
+        """
+        Return the collected metrics as plain dictionaries (e.g., to feed another metrics system).
+        """
+        with self._lock:
+            return {
+                "requests": {
+                    f"{method} {endpoint}": {
+                        "count": histogram.count,
+                        "latency_sum": histogram.sum,
+                        "bytes_sent": self.bytes_sent.get((method, endpoint), 0),
+                        "bytes_received": self.bytes_received.get((method, endpoint), 0),
+                        "wire_bytes_sent": self.wire_bytes_sent.get((method, endpoint), 0),
+                        "wire_bytes_received": self.wire_bytes_received.get((method, endpoint), 0),
+                        "retries": self.retries.get((method, endpoint), 0),
+                        "parse_time": self.parse[(method, endpoint)].sum if (method, endpoint) in self.parse else 0.0,
+                    }
+                    for (method, endpoint), histogram in self.latency.items()
+                },
+                "statuses": {f"{method} {endpoint} {status}": count
+                             for (method, endpoint, status), count in self.statuses.items()},
+                "errors": {f"{method} {endpoint} {name}": count
+                           for (method, endpoint, name), count in self.errors.items()},
+                "in_flight": self.in_flight,
+                "max_in_flight": self.max_in_flight,
+                "pool_maxsize": self.pool_maxsize,
+            }
+
+    def _histogram_lines(self, name, histograms):
+        lines = []
+        for (method, endpoint), histogram in sorted(histograms.items()):
+            labels = _labels(method=method, endpoint=endpoint)
+            for bound, count in zip(self.buckets, histogram.cumulative()):
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+            lines.append(f"{name}_sum{{{labels}}} {histogram.sum}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+        return lines
+
+    def _counter_lines(self, name, values, *label_names):
+        lines = []
+        for key, value in sorted(values.items(), key=lambda item: tuple(map(str, item[0]))):
+            lines.append(f"{name}{{{_labels(**dict(zip(label_names, key)))}}} {value}")
+        return lines
+
+    def to_prometheus(self):
+        """
+        Render the metrics in the Prometheus text exposition format (version 0.0.4).
+        """
+        prefix = self.prefix
+        sections = [
+            ("request_duration_seconds", "histogram", "Request latency including retries and parsing.",
+             lambda name: self._histogram_lines(name, self.latency)),
+            ("parse_duration_seconds", "histogram", "Time spent decoding JSON responses.",
+             lambda name: self._histogram_lines(name, self.parse)),
+            ("requests_total", "counter", "Requests by final status code.",
+             lambda name: self._counter_lines(name, self.statuses, "method", "endpoint", "status")),
+            ("request_bytes_total", "counter", "Request body bytes sent, before compression.",
+             lambda name: self._counter_lines(name, self.bytes_sent, "method", "endpoint")),
+            ("response_bytes_total", "counter", "Response body bytes received, after decompression.",
+             lambda name: self._counter_lines(name, self.bytes_received, "method", "endpoint")),
+            ("request_wire_bytes_total", "counter", "Request body bytes sent on the wire.",
+             lambda name: self._counter_lines(name, self.wire_bytes_sent, "method", "endpoint")),
+            ("response_wire_bytes_total", "counter", "Response body bytes received on the wire.",
+             lambda name: self._counter_lines(name, self.wire_bytes_received, "method", "endpoint")),
+            ("retries_total", "counter", "Retried attempts.",
+             lambda name: self._counter_lines(name, self.retries, "method", "endpoint")),
+            ("cache_responses_total", "counter", "Requests answered from the response cache.",
+             lambda name: self._counter_lines(name, self.cache_hits, "method", "endpoint", "result")),
+            ("errors_total", "counter", "Requests that raised, by exception.",
+             lambda name: self._counter_lines(name, self.errors, "method", "endpoint", "exception")),
+        ]
+        lines = []
+        with self._lock:
+            for suffix, kind, description, render in sections:
+                name = f"{prefix}_{suffix}"
+                lines.append(f"# HELP {name} {description}")
+                lines.append(f"# TYPE {name} {kind}")
+                lines.extend(render(name))
+            for suffix, description, value in (
+                    ("in_flight_requests", "Requests currently in flight.", self.in_flight),
+                    ("max_in_flight_requests", "Highest number of requests in flight.", self.max_in_flight),
+                    ("pool_maxsize", "Connection pool size of the attached clients.", self.pool_maxsize),
+                    ("pool_utilisation", "Requests in flight as a fraction of the pool size.", self.pool_utilisation),
+            ):
+                name = f"{prefix}_{suffix}"
+                lines.append(f"# HELP {name} {description}")
+                lines.append(f"# TYPE {name} gauge")
+                lines.append(f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """
+    Records the same measurements with OpenTelemetry instruments. Requires opentelemetry-api.
+    """
+
+    def __init__(self, meter=None):
+        """
+        :param meter: An opentelemetry.metrics.Meter (default: the global meter provider's "evance_api" meter)
+        """
+        if meter is None:
+            try:
+                from opentelemetry import metrics
+            except ImportError:
+                raise ImportError(
+                    "OpenTelemetryInstrumentation requires opentelemetry-api. Install it with: "
+                    "pip install opentelemetry-api"
+                ) from None
+            meter = metrics.get_meter("evance_api")
+        self.duration = meter.create_histogram("evance.client.request.duration", unit="s")
+        self.parse_duration = meter.create_histogram("evance.client.parse.duration", unit="s")
+        self.request_size = meter.create_counter("evance.client.request.size", unit="By")
+        self.response_size = meter.create_counter("evance.client.response.size", unit="By")
+        self.request_wire_size = meter.create_counter("evance.client.request.wire_size", unit="By")
+        self.response_wire_size = meter.create_counter("evance.client.response.wire_size", unit="By")
+        self.retries = meter.create_counter("evance.client.retries")
+        self.in_flight = meter.create_up_down_counter("evance.client.requests.in_flight")
+
+    def before_request(self, event):
+        self.in_flight.add(1)
+
+    def after_request(self, event):
+        attributes = {
+            "http.request.method": event.method,
+            "evance.endpoint": endpoint_label(event.endpoint),
+        }
+        if event.status is not None:
+            attributes["http.response.status_code"] = event.status
+        if event.error is not None:
+            attributes["error.type"] = type(event.error).__name__
+        self.in_flight.add(-1)
+        self.duration.record(event.elapsed, attributes)
+        if event.parse_time:
+            self.parse_duration.record(event.parse_time, attributes)
+        self.request_size.add(event.bytes_sent, attributes)
+        self.response_size.add(event.bytes_received, attributes)
+        self.request_wire_size.add(event.wire_bytes_sent, attributes)
+        self.response_wire_size.add(event.wire_bytes_received, attributes)
+        if event.attempts > 1:
+            self.retries.add(event.attempts - 1, attributes)
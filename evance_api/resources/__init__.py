@@ -1,3 +1,33 @@
-from .resources import Resources
-from .products import Products
-from .contacts import Contacts
\ No newline at end of file
+import importlib
+
+# Resource classes are imported on first access, so using Products does not load the asyncio resources
+_EXPORTS = {
+    "Resources": ".resources",
+    "Products": ".products",
+    "Contacts": ".contacts",
+    "AsyncResources": ".async_resources",
+    "AsyncProducts": ".async_resources",
+    "AsyncContacts": ".async_resources",
+    "AsyncSpecifications": ".async_resources",
+    "AsyncDownloads": ".async_resources",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(module, __name__), name)
+        globals()[name] = value
+        return value
+    try:
+        return importlib.import_module(f".{name}", __name__)
+    except ModuleNotFoundError as error:
+        if error.name != f"{__name__}.{name}":
+            raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,341 @@
+import asyncio
+
+from ..bulk import BulkWriter
+from ..columnar import TableBuilder, table_to_numpy, table_to_dataframe
+from .resources import Resources, APIResponse, BatchResult
+from .products import Products
+from .contacts import Contacts
+from .product.specifications import Specifications
+from .product.downloads import Downloads
+
+
+class AsyncResources(Resources):
+    """
+    Awaitable variant of Resources for use with AsyncEvanceClient.
+
+    Query parameters, request bodies and validation behave exactly as in Resources; only the
+    request methods are coroutines.
+    """
+
+    async def _get(self, endpoint, params=None, raw=False, fields=None) -> APIResponse:
+        params = self._fields_params(params, fields)
+        if raw:
+            return self._response(await self.client.get(endpoint, params=params, raw=True), True, fields)
+        return self._response(await self.client.get(endpoint, params=params), False, fields)
+
+    async def list(self, params=None, raw=False, fields=None) -> APIResponse:
+        """
+        Retrieve a list of items for this resource.
+
+        :param params: Dictionary of additional parameters to include in the query
+        :param raw: Keep the raw response body (see APIResponse.raw) and parse items lazily
+        :param fields: Only keep these fields of each item (see Resources.list)
+        """
+        return await self._get(f"{self.resource_name}.json", self._list_params(params), raw, fields)
+
+    async def iter_pages(self, params=None, prefetch=True, raw=False, fields=None):
+        """
+        Lazily iterate over every page of this resource, fetching the next page in the background.
+
+        :param params: Dictionary of additional parameters to include in the query
+        :param prefetch: Fetch page N+1 while page N is consumed
+        :param raw: Keep each page's raw response body and parse items lazily
+        :param fields: Only keep these fields of each item (see Resources.list)
+        :return: An async generator of APIResponse objects
+        """
+        query = self._list_params(params)
+        page = query.get("page", 1)
+
+        if not prefetch:
+            while page is not None:
+                response = await self.list(dict(query, page=page), raw=raw, fields=fields)
+                yield response
+                page = self._next_page(response, page)
+            return
+
+        task = asyncio.ensure_future(self.list(dict(query, page=page), raw=raw, fields=fields))
+        try:
+            while task is not None:
+                response = await task
+                next_page = self._next_page(response, page)
+                task = None
+                if next_page is not None:
+                    task = asyncio.ensure_future(self.list(dict(query, page=next_page), raw=raw, fields=fields))
+                yield response
+                page = next_page
+        finally:
+            if task is not None:
+                task.cancel()
+
+    async def fetch_pages(self, params=None, concurrency=8, ordered=True, raw=False, fields=None):
+        """
+        Fetch every page of this resource concurrently once the total page count is known.
+        Behaves like Resources.fetch_pages, using tasks instead of worker threads.
+
+        :param params: Dictionary of additional parameters to include in the query
+        :param concurrency: Maximum number of page requests in flight
+        :param ordered: Yield pages in page order (True) or as soon as each one completes (False)
+        :param raw: Keep each page's raw response body and parse items lazily
+        :param fields: Only keep these fields of each item (see Resources.list)
+        :return: An async generator of APIResponse objects
+        """
+        query = self._list_params(params)
+        first_page = query.get("page", 1)
+
+        first = await self.list(dict(query, page=first_page), raw=raw, fields=fields)
+        yield first
+        if self._next_page(first, first_page) is None:
+            return
+
+        last_page = first.pagination.pages or first_page + 1
+        next_to_submit = first_page + 1
+        next_to_yield = first_page + 1
+        window = max(concurrency, 1) * 2
+        pending = {}
+        buffered = {}
+
+        try:
+            while True:
+                while (next_to_submit <= last_page
+                       and len(pending) < concurrency
+                       and len(pending) + len(buffered) < window):
+                    task = asyncio.ensure_future(self.list(dict(query, page=next_to_submit), raw=raw, fields=fields))
+                    pending[task] = next_to_submit
+                    next_to_submit += 1
+                if not pending:
+                    break
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    page_number = pending.pop(task)
+                    response = task.result()
+                    if response.pagination.pages is not None:
+                        last_page = max(last_page, response.pagination.pages)
+                    elif page_number == last_page and self._next_page(response, page_number) is not None:
+                        last_page += 1
+                    if ordered:
+                        buffered[page_number] = response
+                    elif response._has_items():
+                        yield response
+
+                while next_to_yield in buffered:
+                    response = buffered.pop(next_to_yield)
+                    next_to_yield += 1
+                    if response._has_items():
+                        yield response
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def iter_all(self, params=None, prefetch=True, concurrency=None, fields=None):
+        """
+        Lazily iterate over every item of every page of this resource.
+
+        :param params: Dictionary of additional parameters to include in the query
+        :param prefetch: Fetch the next page while the current one is consumed
+        :param concurrency: Fetch pages concurrently with this many tasks (see fetch_pages)
+        :param fields: Only keep these fields of each item (see Resources.list)
+        :return: An async generator of APIObject items
+        """
+        if concurrency:
+            pages = self.fetch_pages(params, concurrency=concurrency, fields=fields)
+        else:
+            pages = self.iter_pages(params, prefetch=prefetch, fields=fields)
+        async for response in pages:
+            for item in response:
+                yield item
+
+    async def to_arrow(self, params=None, columns=None, types=None, dictionary="auto", concurrency=None):
+        """
+        Fetch every page of this resource into a single pyarrow.Table (see Resources.to_arrow).
+        """
+        builder = TableBuilder(columns, types, dictionary)
+        if concurrency:
+            pages = self.fetch_pages(params, concurrency=concurrency, raw=True, fields=columns)
+        else:
+            pages = self.iter_pages(params, raw=True, fields=columns)
+        async for page in pages:
+            builder.add(page.to_list())
+        return builder.build()
+
+    async def to_numpy(self, params=None, columns=None, types=None, dictionary=False, concurrency=None):
+        return table_to_numpy(await self.to_arrow(params, columns, types, dictionary, concurrency))
+
+    async def to_dataframe(self, params=None, columns=None, types=None, dictionary="auto", concurrency=None):
+        return table_to_dataframe(await self.to_arrow(params, columns, types, dictionary, concurrency))
+
+    async def many(self, ids, chunk_size=None, concurrency=4) -> BatchResult:
+        """
+        Retrieve many items by ID using as few id:in list requests as possible (see Resources.many).
+        """
+        ids = list(dict.fromkeys(ids))
+        requested = {str(resource_id): resource_id for resource_id in ids}
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch(chunk):
+            params = {"id:in": chunk, "limit": min(len(chunk), self.max_page_limit), "page": 1}
+            async with semaphore:
+                return [item async for page in self.iter_pages(params, prefetch=False) for item in page]
+
+        found = {}
+        for items in await asyncio.gather(*(fetch(chunk) for chunk in self._chunk_ids(ids, chunk_size))):
+            for item in items:
+                found[requested.get(str(item.id), item.id)] = item
+
+        missing = [resource_id for resource_id in ids if resource_id not in found]
+        return BatchResult(found, missing)
+
+    async def one(self, resource_id, raw=False, fields=None) -> APIResponse:
+        """
+        Retrieve details of a specific item by ID.
+
+        :param resource_id: The ID of the resource
+        :param raw: Keep the raw response body (see APIResponse.raw)
+        :param fields: Only keep these fields of the item (see Resources.list)
+        """
+        return await self._get(f"{self.resource_name}/{resource_id}.json", raw=raw, fields=fields)
+
+    async def add(self) -> APIResponse:
+        """
+        Add a new resource (POST) using the body set via self.body.
+        """
+        response = await self.client.post(f"{self.resource_name}.json", json=self._prepare_body())
+        return self._response(response)
+
+    async def update(self, resource_id) -> APIResponse:
+        """
+        Update an existing resource (PUT) using the body set via self.body.
+
+        :param resource_id: The ID of the resource to update
+        """
+        response = await self.client.put(f"{self.resource_name}/{resource_id}.json", json=self._prepare_body())
+        return self._response(response)
+
+    async def delete(self, resource_id) -> bool:
+        """
+        Delete a resource (DELETE).
+
+        :param resource_id: The ID of the resource to delete
+        """
+        return await self.client.delete(f"{self.resource_name}/{resource_id}.json")
+
+    async def bulk_add(self, records, concurrency=8, retry_policy=None, progress=None, progress_every=100):
+        """
+        Add many resources concurrently (POST), with at most `concurrency` writes in flight
+        (see Resources.bulk_add).
+        """
+        endpoint = f"{self.resource_name}.json"
+
+        async def send(body):
+            return self._response(await self.client.post(endpoint, json=body))
+
+        writer = BulkWriter(self, concurrency, retry_policy, progress, progress_every)
+        return await writer.run_async("POST", ((None, record, send) for record in records))
+
+    async def bulk_update(self, records, concurrency=8, retry_policy=None, progress=None, progress_every=100):
+        """
+        Update many resources concurrently (PUT) (see Resources.bulk_update).
+        """
+        def tasks():
+            for resource_id, record in self._update_pairs(records):
+                async def send(body, endpoint=f"{self.resource_name}/{resource_id}.json"):
+                    return self._response(await self.client.put(endpoint, json=body))
+                yield resource_id, record, send
+
+        writer = BulkWriter(self, concurrency, retry_policy, progress, progress_every)
+        return await writer.run_async("PUT", tasks())
+
+    async def bulk_delete(self, ids, concurrency=8, retry_policy=None, progress=None, progress_every=100):
+        """
+        Delete many resources concurrently (DELETE) (see Resources.bulk_delete).
+        """
+        def tasks():
+            for resource_id in ids:
+                async def send(body, endpoint=f"{self.resource_name}/{resource_id}.json"):
+                    return await self.client.delete(endpoint)
+                yield resource_id, None, send
+
+        writer = BulkWriter(self, concurrency, retry_policy, progress, progress_every)
+        return await writer.run_async("DELETE", tasks())
+
+
+async def _aiter(iterable):
+    for item in iterable:
+        yield item
+
+
+class AsyncProducts(AsyncResources, Products):
+
+    async def _fetch_sub_resource_async(self, resource_class, product_id, cache, semaphore):
+        resource = resource_class(self.client, product_id)
+        if cache is not None and resource.resource_name in cache:
+            return cache[resource.resource_name]
+        async with semaphore:
+            items = [item async for page in resource.iter_pages(prefetch=False) for item in page.to_list()]
+        if cache is not None:
+            cache[resource.resource_name] = items
+        return items
+
+    async def iter_hydrated(self, products, concurrency=8, cache=None, specifications=True, downloads=True):
+        """
+        Attach each product's specifications and downloads, fetching them concurrently
+        (see Products.iter_hydrated).
+
+        :param products: An APIResponse, or any iterable or async iterable of products (e.g., iter_all())
+        :return: An async generator of hydrated products, in input order
+        """
+        kinds = [
+            (name, AsyncSpecifications if name == "specifications" else AsyncDownloads)
+            for name, _ in self._sub_resources(specifications, downloads)
+        ]
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        window = max(1, concurrency) * 2
+        pending = []
+
+        async def attach(product, tasks):
+            for (name, _), task in zip(kinds, tasks):
+                setattr(product, name, await task)
+            return product
+
+        if not hasattr(products, "__aiter__"):
+            products = _aiter(products)
+        try:
+            async for product in products:
+                tasks = [
+                    asyncio.ensure_future(
+                        self._fetch_sub_resource_async(resource_class, product.id, cache, semaphore)
+                    )
+                    for _, resource_class in kinds
+                ]
+                pending.append((product, tasks))
+                if len(pending) >= window:
+                    yield await attach(*pending.pop(0))
+            while pending:
+                yield await attach(*pending.pop(0))
+        finally:
+            for _, tasks in pending:
+                for task in tasks:
+                    task.cancel()
+
+    async def hydrate(self, products, concurrency=8, cache=None, specifications=True, downloads=True):
+        """
+        Attach specifications and downloads to every product (see iter_hydrated).
+
+        :return: A list of hydrated products
+        """
+        return [
+            product
+            async for product in self.iter_hydrated(products, concurrency, cache, specifications, downloads)
+        ]
+
+
+class AsyncContacts(AsyncResources, Contacts):
+    pass
+
+
+class AsyncSpecifications(AsyncResources, Specifications):
+    pass
+
+
+class AsyncDownloads(AsyncResources, Downloads):
+    pass
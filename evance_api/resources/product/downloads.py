@@ -8,21 +8,21 @@ class Visibility(Enum):
 
 class Downloads(Resources):
 
+    # Query parameters accepted by set() (compiled once per class)
+    accepted_params = {
+        "id:in": list,
+        "id:min": int,
+        "id:max": int,
+        "id:before": int,
+        "id:after": int,
+        "file": str,
+        "visibility": Visibility,
+    }
+
     def __init__(self, client, product_id: int):
         """
         Initialize the Product Specifications module.
 
         :param client: An instance of the EvanceClient
         """
-
-        accepted_params = {
-            "id:in": list,
-            "id:min": int,
-            "id:max": int,
-            "id:before": int,
-            "id:after": int,
-            "file": str,
-            "visibility": Visibility,
-        }
-
-        super().__init__(client, f"products/{product_id}/downloads", accepted_params)
+        super().__init__(client, f"products/{product_id}/downloads")
@@ -2,21 +2,21 @@ from ..resources import Resources
 
 class Specifications(Resources):
 
+    # Query parameters accepted by set() (compiled once per class)
+    accepted_params = {
+        "id:in": list,
+        "id:min": int,
+        "id:max": int,
+        "id:before": int,
+        "id:after": int,
+        "valueId:in": list,
+        "specId:in": list
+    }
+
     def __init__(self, client, product_id: int):
         """
         Initialize the Product Specifications module.
 
         :param client: An instance of the EvanceClient
         """
-
-        accepted_params = {
-            "id:in": list,
-            "id:min": int,
-            "id:max": int,
-            "id:before": int,
-            "id:after": int,
-            "valueId:in": list,
-            "specId:in": list
-        }
-
-        super().__init__(client, f"products/{product_id}/specifications", accepted_params)
+        super().__init__(client, f"products/{product_id}/specifications")
@@ -1,45 +1,119 @@
 from .resources import Resources
+from .product import Specifications, Downloads
 
 class Products(Resources):
 
+    # Query parameters accepted by set() (compiled once per class)
+    accepted_params = {
+        "id:in": list,
+        "id:min": int,
+        "id:max": int,
+        "id:before": int,
+        "id:after": int,
+        "quickfind:in": list,
+        "quickfind:min": int,
+        "quickfind:max": int,
+        "quickfind:before": int,
+        "quickfind:after": int,
+        "createdOn:min": str,
+        "createdOn:max": str,
+        "createdOn:before": str,
+        "createdOn:after": str,
+        "modifiedOn:min": str,
+        "modifiedOn:max": str,
+        "modifiedOn:before": str,
+        "modifiedOn:after": str,
+        "sku:in": list,
+        "sku:startsWith": str,
+        "sku:endsWith": str,
+        "sku:contains": str,
+        "barcode:in": list,
+        "partNumber:in": list,
+        "type": str,
+        "status": str,
+        "bandId": int,
+        "bandId:in": list,
+        "manufacturerId": int,
+        "manufacturerId:in": list
+    }
+
     def __init__(self, client):
         """
         Initialize the Products module.
 
         :param client: An instance of the EvanceClient
         """
+        super().__init__(client, "products")
+
+    def _sub_resources(self, specifications, downloads):
+        kinds = []
+        if specifications:
+            kinds.append(("specifications", Specifications))
+        if downloads:
+            kinds.append(("downloads", Downloads))
+        return kinds
+
+    def _fetch_sub_resource(self, resource_class, product_id, cache):
+        """
+        Fetch every page of a product's sub-resource as plain dictionaries, using the cache if given.
+        """
+        resource = resource_class(self.client, product_id)
+        if cache is not None and resource.resource_name in cache:
+            return cache[resource.resource_name]
+        items = [item for page in resource.iter_pages(prefetch=False) for item in page.to_list()]
+        if cache is not None:
+            cache[resource.resource_name] = items
+        return items
+
+    def iter_hydrated(self, products, concurrency=8, cache=None, specifications=True, downloads=True):
+        """
+        Attach each product's specifications and downloads, fetching them concurrently.
+
+        All sub-resource requests share one pool of `concurrency` workers. Products are read from
+        `products` lazily and yielded in input order, so an iter_all() stream can be hydrated in
+        bounded memory. The sub-resources are attached as lists of dictionaries, e.g.
+        `product.specifications` and `product.downloads`.
+
+        :param products: An APIResponse or any iterable of product items (e.g., iter_all())
+        :param concurrency: Maximum number of sub-resource requests in flight
+        :param cache: Optional dict shared between calls, keyed by sub-resource name
+        :param specifications: Attach specifications
+        :param downloads: Attach downloads
+        :return: A generator of hydrated products
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        kinds = self._sub_resources(specifications, downloads)
+        window = max(1, concurrency) * 2
+        pending = []
+
+        def attach(product, futures):
+            for (name, _), future in zip(kinds, futures):
+                setattr(product, name, future.result())
+            return product
+
+        executor = ThreadPoolExecutor(max_workers=max(1, concurrency))
+        try:
+            for product in products:
+                futures = [
+                    executor.submit(self._fetch_sub_resource, resource_class, product.id, cache)
+                    for _, resource_class in kinds
+                ]
+                pending.append((product, futures))
+                if len(pending) >= window:
+                    yield attach(*pending.pop(0))
+            while pending:
+                yield attach(*pending.pop(0))
+        finally:
+            for _, futures in pending:
+                for future in futures:
+                    future.cancel()
+            executor.shutdown(wait=False)
+
+    def hydrate(self, products, concurrency=8, cache=None, specifications=True, downloads=True):
+        """
+        Attach specifications and downloads to every product (see iter_hydrated).
 
-        accepted_params = {
-            "id:in": list,
-            "id:min": int,
-            "id:max": int,
-            "id:before": int,
-            "id:after": int,
-            "quickfind:in": list,
-            "quickfind:min": int,
-            "quickfind:max": int,
-            "quickfind:before": int,
-            "quickfind:after": int,
-            "createdOn:min": str,
-            "createdOn:max": str,
-            "createdOn:before": str,
-            "createdOn:after": str,
-            "modifiedOn:min": str,
-            "modifiedOn:max": str,
-            "modifiedOn:before": str,
-            "modifiedOn:after": str,
-            "sku:in": list,
-            "sku:startsWith": str,
-            "sku:endsWith": str,
-            "sku:contains": str,
-            "barcode:in": list,
-            "partNumber:in": list,
-            "type": str,
-            "status": str,
-            "bandId": int,
-            "bandId:in": list,
-            "manufacturerId": int,
-            "manufacturerId:in": list
-        }
-
-        super().__init__(client, "products", accepted_params)
+        :return: A list of hydrated products
+        """
+        return list(self.iter_hydrated(products, concurrency, cache, specifications, downloads))
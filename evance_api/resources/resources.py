@@ -1,67 +1,263 @@
-import json
+from functools import lru_cache
+from urllib.parse import quote
 
+from evance_api.bulk import BulkWriter
+from evance_api.columnar import pages_to_arrow, table_to_numpy, table_to_dataframe
+from evance_api.json_backend import default_codec
 from evance_api.pagination import Pagination, Links
 
 
+class APIObject:
+    """
+    Attribute-style (dot notation) access to a single item of the response "data".
+
+    The decoded dictionary is wrapped as-is rather than copied onto the instance, so parsing a page
+    allocates one small slotted object per item. Subclass it and set `Resources.record_type` to add
+    resource-specific behaviour.
+    """
+    __slots__ = ("_fields",)
+
+    def __init__(self, fields=None):
+        object.__setattr__(self, "_fields", fields if fields is not None else {})
+
+    def __getattr__(self, name):
+        """
+        Handle missing attributes gracefully. Return a placeholder string if an attribute is missing.
+        """
+        fields = object.__getattribute__(self, "_fields")
+        if name in fields:
+            return fields[name]
+        if name.startswith("__") and name.endswith("__"):
+            raise AttributeError(name)
+        return f"Attr[{name}] not available"
+
+    def __setattr__(self, name, value):
+        self._fields[name] = value
+
+    def __delattr__(self, name):
+        try:
+            del self._fields[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __dir__(self):
+        return sorted(set(dir(type(self))) | set(self._fields))
+
+    def __getstate__(self):
+        return self._fields
+
+    def __setstate__(self, state):
+        object.__setattr__(self, "_fields", state)
+
+    def to_dict(self):
+        """
+        Convert the object back to a dictionary.
+        """
+        return dict(self._fields)
+
+    def __repr__(self):
+        """
+        String representation for debugging.
+        """
+        return f"{type(self).__name__}({self._fields})"
+
+
+def _field_names(fields):
+    """
+    Normalise a fields= argument ("id,sku" or ["id", "sku"]) into a tuple of names.
+    """
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    return tuple(field.strip() for field in fields if field.strip())
+
+
+def _project(item, tree):
+    projected = {}
+    for key, subtree in tree.items():
+        if key in item:
+            value = item[key]
+            if subtree is not None:
+                if isinstance(value, dict):
+                    value = _project(value, subtree)
+                elif isinstance(value, list):
+                    value = [_project(entry, subtree) if isinstance(entry, dict) else entry for entry in value]
+            projected[key] = value
+    return projected
+
+
+@lru_cache(maxsize=64)
+def compile_projection(fields):
+    """
+    Compile field names into a function that copies only those keys out of a decoded item.
+
+    Dotted names select nested keys (e.g., "pricing.price" keeps only "price" under "pricing"; inside
+    lists, every object is projected). Selecting a parent whole wins over selecting some of its keys.
+
+    :param fields: Tuple of field names
+    :return: A (project, roots) tuple: the projection function and the top-level keys it reads
+    """
+    tree = {}
+    for field in fields:
+        parts = field.split(".")
+        node = tree
+        for part in parts[:-1]:
+            child = node.get(part, {})
+            if child is None:
+                break  # The parent is already selected whole
+            node = node.setdefault(part, child)
+        else:
+            node[parts[-1]] = None
+    roots = tuple(tree)
+    if all(subtree is None for subtree in tree.values()):
+        return (lambda item: {key: item[key] for key in roots if key in item}), roots
+    return (lambda item: _project(item, tree)), roots
+
+
 class APIResponse:
-    def __init__(self, data):
+    # Attributes holding the decoded body. A lazy response built from a raw body sets them on first use.
+    _DECODED = frozenset({"_success", "_status", "_pagination", "_links", "_items", "_data", "_records"})
+
+    def __init__(self, data, record_type=APIObject, lazy=False, codec=None, fields=None):
         """
         Initialize the APIResponse object.
 
-        :param data: The raw JSON response from the API
+        `data` may also be the raw response body (bytes or str). The raw payload is then kept and
+        returned as-is by `raw` and `to_json(original=True)`.
+
+        :param data: The decoded JSON response from the API, or its raw body
+        :param record_type: The class used to wrap each item of "data" (default: APIObject)
+        :param lazy: Decode a raw body only when the response is first read (reading `raw` or
+            `to_json(original=True)` does not decode it), and wrap items only when they are indexed
+            or iterated
+        :param codec: JSON codec used to decode a raw body and by to_json (default: standard library)
+        :param fields: Keep only these keys of each item (see compile_projection); the full decoded
+            items are released once projected
+        """
+        self._codec = codec or default_codec
+        self._raw = None
+        self._record_type = record_type
+        self._lazy = lazy
+        self._selection = fields
+        if isinstance(data, (bytes, str)):
+            self._raw = data
+            if lazy:
+                return  # Decoded by __getattr__ when first needed
+            data = self._codec.loads(data)
+        self._load(data)
+
+    def __getattr__(self, name):
+        # Only reached for attributes that are not set yet, i.e. before a lazy raw body is decoded
+        if name in APIResponse._DECODED and "_raw" in self.__dict__ and "_items" not in self.__dict__:
+            self._load(self._codec.loads(self._raw))
+            return getattr(self, name)
+        raise AttributeError(name)
+
+    def _load(self, data):
+        """
+        Set the decoded body: flags, pagination, links and the (projected) items.
         """
         self._success = data.get("success", False)
         self._status = data.get("status", None)
         self._pagination = data.get("pagination", {})
         self._links = data.get("links", {})
-        #self.data = [self._parse_item(item) for item in data.get("data", [])]
 
         raw_data = data.get("data", [])
-        if isinstance(raw_data, list):
-            self.data = [self._parse_item(item) for item in raw_data]
-        elif isinstance(raw_data, dict):  # Handle a single dictionary item
-            self.data = self._parse_item(raw_data)
-        else:
-            self.data = None  # `data` is neither a list nor a dictionary
+        if not isinstance(raw_data, (list, dict)):
+            raw_data = None  # `data` is neither a list nor a dictionary
+        elif self._selection:
+            project = compile_projection(_field_names(self._selection))[0]
+            if isinstance(raw_data, dict):
+                raw_data = project(raw_data)
+            else:
+                raw_data = [project(item) if isinstance(item, dict) else item for item in raw_data]
+        self._items = raw_data
+        self._data = None
+        self._records = None
+        if not self._lazy:
+            self._data = self._parse_data()
+        elif isinstance(raw_data, list):
+            self._records = [None] * len(raw_data)
+
+    def _parse_data(self):
+        if isinstance(self._items, list):
+            return [self._parse_item(item) for item in self._items]
+        elif isinstance(self._items, dict):  # Handle a single dictionary item
+            return self._parse_item(self._items)
+        return None
 
     def _parse_item(self, item):
         """
-        Parse individual data items into custom objects with attribute-style access.
+        Parse an individual data item into an object with attribute-style access.
 
         :param item: A dictionary representing a single item from the "data" array
         :return: An object representation of the item
         """
+        return self._record_type(item) if isinstance(item, dict) else item
 
-        # Dynamically create a class with an `__init__` to handle item attributes
-        class APIObject:
-            def __init__(self, **kwargs):
-                for key, value in kwargs.items():
-                    setattr(self, key, value)
+    def _record(self, index):
+        """
+        Return the parsed item at `index`, parsing and caching it on first access (lazy mode).
+        """
+        record = self._records[index]
+        if record is None:
+            record = self._records[index] = self._parse_item(self._items[index])
+        return record
 
-            def to_dict(self):
-                """
-                Convert the object back to a dictionary.
-                """
-                return {key: getattr(self, key) for key in self.__dict__}
+    @property
+    def data(self):
+        """
+        The parsed "data" section: a list of items, a single item, or None.
+        In lazy mode, accessing it parses every item that has not been parsed yet.
+        """
+        if self._data is None and self._items is not None:
+            if self._records is not None:
+                self._data = [self._record(index) for index in range(len(self._records))]
+            else:
+                self._data = self._parse_data()
+        return self._data
 
-            def __getattr__(self, name):
-                """
-                Handle missing attributes gracefully. Return None (or another default) if an attribute is missing.
-                """
-                return f"Attr[{name}] not available"
+    @data.setter
+    def data(self, value):
+        self._items  # Decode a lazy raw body first, so it cannot overwrite the new data later
+        self._data = value
+        self._records = None
 
-            def __repr__(self):
-                """
-                String representation for debugging.
-                """
-                return f"APIObject({self.__dict__})"
+    @property
+    def raw(self):
+        """
+        The raw response body as received, or None if the response was built from decoded JSON.
+        """
+        return self._raw
 
-        return APIObject(**item)
+    def to_list(self):
+        """
+        Return the items of "data" as plain dictionaries (a single item is returned as a one-item list).
+        The decoded dictionaries are returned directly, without copying or wrapping them.
+        """
+        data = self._items if self._data is None else self._data
+        if data is None:
+            return []
+        if not isinstance(data, list):
+            data = [data]
+        return [item._fields if isinstance(item, APIObject) else item for item in data]
 
-    def to_json(self):
+    def to_json(self, original=False):
         """
         Convert the response object back to JSON.
+
+        :param original: Return the raw response payload as received (requires a raw response)
         """
+        if original:
+            if self._raw is None:
+                raise ValueError("The raw response payload was not retained")
+            if self._selection:
+                raise ValueError("The raw response payload is not projected; use to_json() for the selected fields")
+            return self._raw.decode("utf-8") if isinstance(self._raw, bytes) else self._raw
+
+        if self._data is None and self._items is not None:
+            # Nothing has been parsed, so the decoded items can be serialised directly
+            return self._codec.dumps(self._items)
+
         if isinstance(self.data, list):
             # Data is a list of parsed items
             json_data = [item.to_dict() for item in self.data]
@@ -72,7 +268,31 @@ class APIResponse:
             # Data is empty or None
             json_data = None
 
-        return json.dumps(json_data)
+        return self._codec.dumps(json_data)
+
+    def to_arrow(self, columns=None, types=None, dictionary="auto"):
+        """
+        Convert the items of "data" into a pyarrow.Table, column by column, without parsing them into
+        records first. Requires pyarrow (see evance_api.columnar.TableBuilder for the options).
+
+        :param columns: Columns to keep, as flattened names (e.g., ["id", "sku", "pricing.price"])
+        :param types: Dictionary of column name to pyarrow type or type name (e.g., {"price": "float64"})
+        :param dictionary: Dictionary-encode string columns: "auto", True, False or a list of names
+        """
+        return pages_to_arrow([self.to_list()], columns, types, dictionary)
+
+    def to_numpy(self, columns=None, types=None, dictionary=False):
+        """
+        Convert the items of "data" into a dictionary of column name to NumPy array (via Arrow).
+        """
+        return table_to_numpy(self.to_arrow(columns, types, dictionary))
+
+    def to_dataframe(self, columns=None, types=None, dictionary="auto"):
+        """
+        Convert the items of "data" into a pandas DataFrame (via Arrow); dictionary-encoded string
+        columns become categoricals.
+        """
+        return table_to_dataframe(self.to_arrow(columns, types, dictionary))
 
     @property
     def success(self):
@@ -112,20 +332,36 @@ class APIResponse:
         """
         Allow dictionary-like access to the underlying data.
         """
+        if self._records is not None and self._data is None:
+            if isinstance(key, slice):
+                return [self._record(index) for index in range(*key.indices(len(self._records)))]
+            if isinstance(key, int):
+                return self._record(key)
         return self.data[key]
 
     def __iter__(self):
         """
         Allow iteration over the data if it's a list.
         """
+        if self._records is not None and self._data is None:
+            return (self._record(index) for index in range(len(self._records)))
         if isinstance(self.data, list):
             return iter(self.data)
         raise TypeError("APIResponse is not iterable")
 
+    def _has_items(self):
+        """
+        Return True if "data" is a non-empty list, without parsing any items in lazy mode.
+        """
+        data = self._items if self._data is None else self._data
+        return isinstance(data, list) and len(data) > 0
+
     def __len__(self):
         """
         Get the number of items in the "data" section.
         """
+        if self._records is not None:
+            return len(self._records)
         return len(self.data)
 
     def __repr__(self):
@@ -135,9 +371,61 @@ class APIResponse:
         return f"APIResponse({self.data})"
 
 
+class BatchResult:
+    """
+    Items retrieved by Resources.many(), keyed by the requested ID, plus the IDs that were not found.
+    """
+
+    def __init__(self, found, missing):
+        self.found = found
+        self.missing = missing
+
+    def get(self, resource_id, default=None):
+        return self.found.get(resource_id, default)
+
+    def __getitem__(self, resource_id):
+        return self.found[resource_id]
+
+    def __contains__(self, resource_id):
+        return resource_id in self.found
+
+    def __iter__(self):
+        return iter(self.found.values())
+
+    def __len__(self):
+        return len(self.found)
+
+    def __repr__(self):
+        return f"BatchResult(found={len(self.found)}, missing={self.missing})"
+
+
 from evance_api.requests import QueryParams, RequestBody
+from evance_api.validator import Validator, JSONValidator
 
 class Resources:
+    # Class used to wrap each item of a response; override per resource for schema-aware records
+    record_type = APIObject
+
+    # Largest page size requested by many(), and the URL length its id:in chunks must fit within
+    max_page_limit = 100
+    max_url_length = 2000
+
+    # Query parameters accepted by set(), and the keys checked in POST/PUT bodies; override per resource.
+    # They are compiled into validators once per class and shared by every instance.
+    accepted_params = {}
+    mandatory_keys = None
+    optional_keys = None
+
+    # Query parameter that asks the API for a sparse fieldset (e.g., "fields" sends fields=id,sku) when
+    # fields= is passed. None (the default) sends nothing; the projection is applied client-side either way.
+    fields_param = None
+
+    # Pagination parameters accepted by every resource
+    default_params = {
+        "page": int,
+        "limit": int
+    }
+
     def __init__(
             self,
             client,
@@ -150,20 +438,43 @@ class Resources:
 
         :param client: An instance of the EvanceClient
         :param resource_name: The name of the resource (e.g., "products", "orders")
+        :param accepted_params: Query parameters and their types (default: the class's accepted_params)
+        :param body_validator: JSONValidator for request bodies (default: built from the class's
+            mandatory_keys and optional_keys)
         """
-        default_params = {
-            "page": int,
-            "limit": int
-        }
-
         self.client = client
         self.resource_name = resource_name
-        self.accepted_params = accepted_params or {}
-        self.body_validator = body_validator
+        if accepted_params is None:
+            self.param_validator = self._class_param_validator()
+        else:
+            self.param_validator = Validator({**accepted_params, **self.default_params})
+        self.accepted_params = self.param_validator.accepted_params
+        self.body_validator = body_validator if body_validator is not None else self._class_body_validator()
         self.query = QueryParams()  # Use the QueryParams class for query parameters
         self.body = RequestBody()  # Use the RequestBody class for request bodies
 
-        self.accepted_params.update(default_params)
+    @classmethod
+    def _class_param_validator(cls):
+        """
+        Return the Validator compiled from the class's accepted_params, compiling it on first use.
+        """
+        validator = cls.__dict__.get("_compiled_param_validator")
+        if validator is None:
+            validator = Validator({**cls.accepted_params, **cls.default_params})
+            cls._compiled_param_validator = validator
+        return validator
+
+    @classmethod
+    def _class_body_validator(cls):
+        """
+        Return the JSONValidator compiled from the class's mandatory_keys and optional_keys, or None.
+        """
+        if "_compiled_body_validator" not in cls.__dict__:
+            validator = None
+            if cls.mandatory_keys is not None or cls.optional_keys is not None:
+                validator = JSONValidator(cls.mandatory_keys or {}, cls.optional_keys)
+            cls._compiled_body_validator = validator
+        return cls.__dict__["_compiled_body_validator"]
 
     def set(self, key, value):
         """
@@ -171,36 +482,328 @@ class Resources:
 
         :param key: The parameter key (e.g., "id:in")
         :param value: The parameter value (e.g., [1, 2, 3])
+        :raises ValueError: If the parameter is not accepted or the value has the wrong type
         """
-        if key not in self.accepted_params:
-            raise ValueError(f"Invalid parameter: {key}")
-        expected_type = self.accepted_params[key]
-        if not isinstance(value, expected_type):
-            raise ValueError(f"Parameter '{key}' must be of type {expected_type.__name__}")
-        self.query_params[key] = value
+        self.param_validator.check(key, value)
+        self.query.set(key, value)
+        return self
 
-    def list(self, params=None) -> APIResponse:
+    def validate_many(self, records):
         """
-        Retrieve a list of items for this resource.
-        Query parameters can be set in advance via self.query or passed dynamically.
+        Validate many records against the resource's body schema without sending anything.
+
+        Every error is collected, so a whole import file can be checked in one pass before bulk_add().
+
+        :param records: Iterable of record dictionaries (the contents of "data")
+        :return: A list of (row_index, message) tuples; empty if every record is valid
+        """
+        if self.body_validator is None:
+            return []
+        return self.body_validator.validate_many({"data": record} for record in records)
+
+    def _list_params(self, params=None):
+        """
+        Merge the pre-set query parameters with the ones passed to a call.
 
         :param params: Dictionary of additional parameters to include in the query
+        :return: A new dictionary of query parameters
         """
-        query_params = self.query.to_dict()  # Get pre-set query params
+        query_params = dict(self.query.to_dict())  # Get pre-set query params
         if params:
             query_params.update(params)  # Merge with dynamically passed params
+        return query_params
+
+    def _prepare_body(self):
+        """
+        Return the request body set via self.body after validating it.
+
+        :raises ValueError: If the body does not satisfy the resource's JSONValidator
+        """
+        body = self.body.to_dict()  # Get request body from self.body
+        if self.body_validator:
+            self.body_validator.validate(body)  # Validate structure of the JSON body
+        return body
+
+    def _response(self, payload, lazy=False, fields=None) -> APIResponse:
+        """
+        Wrap a client payload in an APIResponse using this resource's record type and the client's JSON codec.
+        """
+        return APIResponse(payload, self.record_type, lazy, getattr(self.client, "json_codec", None), fields)
+
+    def _fields_params(self, params, fields):
+        """
+        Add the sparse fieldset parameter for `fields` to the query parameters, if the API supports one.
+        """
+        if not fields or self.fields_param is None:
+            return params
+        roots = compile_projection(_field_names(fields))[1]
+        return dict(params or {}, **{self.fields_param: ",".join(roots)})
+
+    def _get(self, endpoint, params=None, raw=False, fields=None) -> APIResponse:
+        """
+        GET an endpoint and wrap the result in an APIResponse.
+
+        :param raw: Keep the raw response body and parse items lazily
+        :param fields: Request and keep only these fields of each item
+        """
+        params = self._fields_params(params, fields)
+        if raw:
+            return self._response(self.client.get(endpoint, params=params, raw=True), True, fields)
+        return self._response(self.client.get(endpoint, params=params), False, fields)
+
+    def list(self, params=None, raw=False, fields=None) -> APIResponse:
+        """
+        Retrieve a list of items for this resource.
+        Query parameters can be set in advance via self.query or passed dynamically.
+
+        :param params: Dictionary of additional parameters to include in the query
+        :param raw: Keep the raw response body (see APIResponse.raw) and parse items lazily
+        :param fields: Only keep these fields of each item, e.g. ["id", "sku", "pricing.price"] (dotted
+            names select nested keys). If fields_param is set, the API is also asked for a sparse fieldset.
+        """
+        return self._get(f"{self.resource_name}.json", self._list_params(params), raw, fields)
+
+    def _next_page(self, response, page):
+        """
+        Work out which page follows `response`, or None once the last page has been reached.
+
+        :param response: The APIResponse for `page`
+        :param page: The page number that was requested
+        """
+        if not response._has_items():
+            return None
+        pagination = response.pagination
+        current = pagination.page or page
+        if pagination.pages is not None:
+            return current + 1 if current < pagination.pages else None
+        return current + 1 if response.links.next else None
+
+    def iter_pages(self, params=None, prefetch=True, raw=False, fields=None):
+        """
+        Lazily iterate over every page of this resource, starting from the pre-set (or passed) page.
+
+        While a page is being processed by the caller, the next one is fetched in the background,
+        so at most two pages are held in memory at any time.
+
+        :param params: Dictionary of additional parameters to include in the query
+        :param prefetch: Fetch page N+1 in the background while page N is consumed
+        :param raw: Keep each page's raw response body and parse items lazily
+        :param fields: Only keep these fields of each item (see list)
+        :return: A generator of APIResponse objects
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        query = self._list_params(params)
+        page = query.get("page", 1)
+
+        def fetch(page_number):
+            return self.list(dict(query, page=page_number), raw=raw, fields=fields)
+
+        if not prefetch:
+            while page is not None:
+                response = fetch(page)
+                yield response
+                page = self._next_page(response, page)
+            return
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(fetch, page)
+        try:
+            while future is not None:
+                response = future.result()
+                next_page = self._next_page(response, page)
+                future = executor.submit(fetch, next_page) if next_page is not None else None
+                yield response
+                page = next_page
+        finally:
+            if future is not None:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def fetch_pages(self, params=None, concurrency=8, ordered=True, raw=False, fields=None):
+        """
+        Fetch every page of this resource concurrently once the total page count is known.
+
+        The first page is fetched on its own to learn `pagination.pages`; the remaining pages are then
+        requested over a pool of `concurrency` workers. At most `2 * concurrency` pages are in flight or
+        buffered at once. If a later page reports more pages than expected, the extra pages are
+        scheduled too; pages that come back empty because the total shrank are skipped.
+
+        :param params: Dictionary of additional parameters to include in the query
+        :param concurrency: Maximum number of page requests in flight
+        :param ordered: Yield pages in page order (True) or as soon as each one completes (False)
+        :param raw: Keep each page's raw response body and parse items lazily
+        :param fields: Only keep these fields of each item (see list)
+        :return: A generator of APIResponse objects
+        """
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+        query = self._list_params(params)
+        first_page = query.get("page", 1)
+
+        first = self.list(dict(query, page=first_page), raw=raw, fields=fields)
+        yield first
+        if self._next_page(first, first_page) is None:
+            return
+
+        def fetch(page_number):
+            return self.list(dict(query, page=page_number), raw=raw, fields=fields)
+
+        last_page = first.pagination.pages or first_page + 1
+        next_to_submit = first_page + 1
+        next_to_yield = first_page + 1
+        window = max(concurrency, 1) * 2
+        pending = {}
+        buffered = {}
+
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            while True:
+                while next_to_submit <= last_page and len(pending) + len(buffered) < window:
+                    pending[executor.submit(fetch, next_to_submit)] = next_to_submit
+                    next_to_submit += 1
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    page_number = pending.pop(future)
+                    response = future.result()
+                    if response.pagination.pages is not None:
+                        last_page = max(last_page, response.pagination.pages)
+                    elif page_number == last_page and self._next_page(response, page_number) is not None:
+                        last_page += 1
+                    if ordered:
+                        buffered[page_number] = response
+                    elif response._has_items():
+                        yield response
+
+                while next_to_yield in buffered:
+                    response = buffered.pop(next_to_yield)
+                    next_to_yield += 1
+                    if response._has_items():
+                        yield response
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def iter_all(self, params=None, prefetch=True, concurrency=None, fields=None):
+        """
+        Lazily iterate over every item of every page of this resource.
+
+        :param params: Dictionary of additional parameters to include in the query
+        :param prefetch: Fetch the next page in the background while the current one is consumed
+        :param concurrency: Fetch pages concurrently with this many workers (see fetch_pages)
+        :param fields: Only keep these fields of each item (see list)
+        :return: A generator of APIObject items
+        """
+        if concurrency:
+            pages = self.fetch_pages(params, concurrency=concurrency, fields=fields)
+        else:
+            pages = self.iter_pages(params, prefetch=prefetch, fields=fields)
+        for response in pages:
+            yield from response
+
+    def _columnar_pages(self, params, concurrency, columns=None):
+        # Selected columns double as a field projection, so unused fields are neither fetched nor kept
+        if concurrency:
+            pages = self.fetch_pages(params, concurrency=concurrency, raw=True, fields=columns)
+        else:
+            pages = self.iter_pages(params, raw=True, fields=columns)
+        return (page.to_list() for page in pages)
+
+    def to_arrow(self, params=None, columns=None, types=None, dictionary="auto", concurrency=None):
+        """
+        Fetch every page of this resource into a single pyarrow.Table.
+
+        Pages are fetched raw and converted column by column as they arrive, so items are never
+        wrapped in records and each page's decoded JSON is released once converted.
+
+        :param params: Dictionary of additional parameters to include in the query
+        :param columns: Columns to keep, as flattened names (e.g., ["id", "sku", "pricing.price"])
+        :param types: Dictionary of column name to pyarrow type or type name (e.g., {"price": "float64"})
+        :param dictionary: Dictionary-encode string columns: "auto", True, False or a list of names
+        :param concurrency: Fetch pages concurrently with this many workers (see fetch_pages)
+        """
+        return pages_to_arrow(self._columnar_pages(params, concurrency, columns), columns, types, dictionary)
+
+    def to_numpy(self, params=None, columns=None, types=None, dictionary=False, concurrency=None):
+        """
+        Fetch every page of this resource into a dictionary of column name to NumPy array.
+        """
+        return table_to_numpy(self.to_arrow(params, columns, types, dictionary, concurrency))
 
-        response = self.client.get(f"{self.resource_name}.json", params=query_params)
-        return APIResponse(response)
+    def to_dataframe(self, params=None, columns=None, types=None, dictionary="auto", concurrency=None):
+        """
+        Fetch every page of this resource into a pandas DataFrame.
+        """
+        return table_to_dataframe(self.to_arrow(params, columns, types, dictionary, concurrency))
 
-    def one(self, resource_id) -> APIResponse:
+    def _chunk_ids(self, ids, chunk_size=None):
+        """
+        Split IDs into id:in chunks that respect both the page limit and the maximum URL length.
+        """
+        chunk_size = min(chunk_size or self.max_page_limit, self.max_page_limit)
+        base_length = len(f"{getattr(self.client, 'base_url', '')}/{self.resource_name}.json?limit=000&page=0")
+        key_length = len(quote("id:in")) + 2  # "id%3Ain=" plus the "&" separator
+
+        chunks = []
+        chunk = []
+        length = base_length
+        for resource_id in ids:
+            id_length = key_length + len(quote(str(resource_id)))
+            if chunk and (len(chunk) >= chunk_size or length + id_length > self.max_url_length):
+                chunks.append(chunk)
+                chunk = []
+                length = base_length
+            chunk.append(resource_id)
+            length += id_length
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    def many(self, ids, chunk_size=None, concurrency=4) -> BatchResult:
+        """
+        Retrieve many items by ID using as few id:in list requests as possible.
+
+        IDs are split into chunks sized to the page limit and URL length, chunks are fetched
+        concurrently, and any pagination within a chunk is followed.
+
+        :param ids: Iterable of resource IDs (duplicates are fetched once)
+        :param chunk_size: Maximum number of IDs per request (capped at max_page_limit)
+        :param concurrency: Maximum number of chunk requests in flight
+        :return: A BatchResult with items keyed by requested ID and the IDs that were not found
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        ids = list(dict.fromkeys(ids))
+        requested = {str(resource_id): resource_id for resource_id in ids}
+
+        def fetch(chunk):
+            params = {"id:in": chunk, "limit": min(len(chunk), self.max_page_limit), "page": 1}
+            return [item for page in self.iter_pages(params, prefetch=False) for item in page]
+
+        found = {}
+        chunks = self._chunk_ids(ids, chunk_size)
+        if chunks:
+            with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(chunks)))) as executor:
+                for items in executor.map(fetch, chunks):
+                    for item in items:
+                        found[requested.get(str(item.id), item.id)] = item
+
+        missing = [resource_id for resource_id in ids if resource_id not in found]
+        return BatchResult(found, missing)
+
+    def one(self, resource_id, raw=False, fields=None) -> APIResponse:
         """
         Retrieve details of a specific item by ID.
 
         :param resource_id: The ID of the resource
+        :param raw: Keep the raw response body (see APIResponse.raw)
+        :param fields: Only keep these fields of the item (see list)
         """
-        response = self.client.get(f"{self.resource_name}/{resource_id}.json")
-        return APIResponse(response)
+        return self._get(f"{self.resource_name}/{resource_id}.json", raw=raw, fields=fields)
 
     def add(self) -> APIResponse:
         """
@@ -209,13 +812,9 @@ class Resources:
 
         :return: APIResponse object
         """
-        body = self.body.to_dict()  # Get request body from self.body
-        if self.body_validator:
-            self.body_validator.validate(body)  # Validate structure of the JSON body
+        response = self.client.post(f"{self.resource_name}.json", json=self._prepare_body())
 
-        response = self.client.post(f"{self.resource_name}.json", json=body)
-
-        return APIResponse(response)
+        return self._response(response)
 
     def update(self, resource_id) -> APIResponse:
         """
@@ -225,11 +824,8 @@ class Resources:
         :param resource_id: The ID of the resource to update
         :return: APIResponse object
         """
-        body = self.body.to_dict()  # Get request body from self.body
-        if self.body_validator:
-            self.body_validator.validate(body)  # Validate structure of the JSON body
-        response = self.client.put(f"{self.resource_name}/{resource_id}.json", json=body)
-        return APIResponse(response)
+        response = self.client.put(f"{self.resource_name}/{resource_id}.json", json=self._prepare_body())
+        return self._response(response)
 
     def delete(self, resource_id) -> bool:
         """
@@ -238,4 +834,70 @@ class Resources:
         :param resource_id: The ID of the resource to delete
         """
         response = self.client.delete(f"{self.resource_name}/{resource_id}.json")
-        return response
\ No newline at end of file
+        return response
+
+    def bulk_add(self, records, concurrency=8, retry_policy=None, progress=None, progress_every=100):
+        """
+        Add many resources concurrently (POST). Each record is validated and sent as {"data": record}.
+        Failures are reported per record and never abort the batch.
+
+        :param records: Iterable of record dictionaries (the fields under "data"); may be a stream
+        :param concurrency: Maximum number of writes in flight
+        :param retry_policy: RetryPolicy applied per record (see BulkWriter)
+        :param progress: Callable receiving the BulkReport every `progress_every` records
+        :return: A BulkReport
+        """
+        endpoint = f"{self.resource_name}.json"
+
+        def send(body):
+            return self._response(self.client.post(endpoint, json=body))
+
+        writer = BulkWriter(self, concurrency, retry_policy, progress, progress_every)
+        return writer.run("POST", ((None, record, send) for record in records))
+
+    @staticmethod
+    def _update_pairs(records):
+        """
+        Yield (resource_id, record) for bulk_update input. The id of a record without one is None, and
+        BulkWriter reports it as an error instead of sending the request.
+        """
+        for item in records:
+            if isinstance(item, dict):
+                yield item.get("id"), {key: value for key, value in item.items() if key != "id"}
+            else:
+                yield item
+
+    def bulk_update(self, records, concurrency=8, retry_policy=None, progress=None, progress_every=100):
+        """
+        Update many resources concurrently (PUT).
+
+        :param records: Iterable of (resource_id, record) pairs, or of records containing an "id"
+        :param concurrency: Maximum number of writes in flight
+        :param retry_policy: RetryPolicy applied per record (see BulkWriter)
+        :param progress: Callable receiving the BulkReport every `progress_every` records
+        :return: A BulkReport
+        """
+        def tasks():
+            for resource_id, record in self._update_pairs(records):
+                endpoint = f"{self.resource_name}/{resource_id}.json"
+                yield resource_id, record, lambda body, endpoint=endpoint: self._response(
+                    self.client.put(endpoint, json=body)
+                )
+
+        writer = BulkWriter(self, concurrency, retry_policy, progress, progress_every)
+        return writer.run("PUT", tasks())
+
+    def bulk_delete(self, ids, concurrency=8, retry_policy=None, progress=None, progress_every=100):
+        """
+        Delete many resources concurrently (DELETE).
+
+        :param ids: Iterable of resource IDs
+        :return: A BulkReport
+        """
+        def tasks():
+            for resource_id in ids:
+                endpoint = f"{self.resource_name}/{resource_id}.json"
+                yield resource_id, None, lambda body, endpoint=endpoint: self.client.delete(endpoint)
+
+        writer = BulkWriter(self, concurrency, retry_policy, progress, progress_every)
+        return writer.run("DELETE", tasks())
@@ -0,0 +1,159 @@
+import random
+import threading
+import time
+
+
+class RetryPolicy:
+    """
+    Decides whether a failed request is retried and how long to wait before the next attempt.
+
+    Requests that the server rejected before processing (429) are retried for every method.
+    Server errors and dropped connections are only retried for idempotent methods, so a POST is
+    never applied twice.
+    """
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+    def __init__(
+            self,
+            max_attempts=4,
+            backoff_factor=0.5,
+            max_backoff=30.0,
+            jitter=True,
+            retry_statuses=(429, 502, 503, 504),
+            methods=IDEMPOTENT_METHODS,
+            respect_retry_after=True,
+            deadline=None
+    ):
+        """
+        :param max_attempts: Total attempts per call, including the first one
+        :param backoff_factor: Base delay in seconds; attempt N waits backoff_factor * 2 ** (N - 1)
+        :param max_backoff: Upper bound of a single delay in seconds
+        :param jitter: Randomise delays ("full jitter") so clients do not retry in lockstep
+        :param retry_statuses: HTTP status codes that are retried
+        :param methods: HTTP methods that are retried after server errors and connection failures
+        :param respect_retry_after: Wait as long as the server's Retry-After header asks
+        :param deadline: Default time budget in seconds for a call, including all retries
+        """
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.methods = frozenset(method.upper() for method in methods)
+        self.respect_retry_after = respect_retry_after
+        self.deadline = deadline
+
+    def should_retry_status(self, method, status_code, attempt):
+        """
+        Return True if a response with `status_code` should be retried.
+
+        :param attempt: The number of the attempt that just failed (1-based)
+        """
+        if attempt >= self.max_attempts or status_code not in self.retry_statuses:
+            return False
+        return status_code == 429 or method.upper() in self.methods
+
+    def should_retry_error(self, method, attempt):
+        """
+        Return True if a connection failure or timeout should be retried.
+        """
+        return attempt < self.max_attempts and method.upper() in self.methods
+
+    def get_delay(self, attempt, retry_after=None):
+        """
+        Return the number of seconds to wait before the next attempt.
+
+        :param attempt: The number of the attempt that just failed (1-based)
+        :param retry_after: Value of the Retry-After header, if any
+        """
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        if self.respect_retry_after:
+            server_delay = parse_retry_after(retry_after)
+            if server_delay is not None:
+                delay = max(delay, server_delay)
+        return delay
+
+
+def parse_retry_after(value):
+    """
+    Parse a Retry-After header (delay in seconds or an HTTP date) into seconds, or None.
+    """
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    import email.utils  # Only needed for HTTP-date values
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class AdaptiveThrottle:
+    """
+    Client-side request rate limiter that adapts to server pressure (additive increase,
+    multiplicative decrease).
+
+    Each throttled response (429/503) cuts the allowed rate and, if the server sent Retry-After,
+    pauses all requests until then. Each successful response raises the rate again, up to max_rate.
+    Shared by every thread (or task) that uses the client.
+    """
+    PRESSURE_STATUSES = frozenset({429, 503})
+
+    def __init__(self, max_rate=20.0, min_rate=0.5, increase=0.5, decrease_factor=0.5):
+        """
+        :param max_rate: Highest request rate (requests per second)
+        :param min_rate: Lowest request rate the throttle backs off to
+        :param increase: Requests per second added after each successful response
+        :param decrease_factor: Factor applied to the rate after each throttled response
+        """
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.rate = max_rate
+        self._next_slot = 0.0
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """
+        Reserve the next request slot and return how many seconds the caller must wait for it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot, self._paused_until)
+            self._next_slot = slot + 1.0 / self.rate
+            return slot - now
+
+    def acquire(self):
+        """
+        Block until the next request may be sent.
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def feedback(self, status_code, retry_after=None):
+        """
+        Adjust the rate based on a response.
+
+        :param status_code: HTTP status code of the response
+        :param retry_after: Value of the Retry-After header, if any
+        """
+        with self._lock:
+            if status_code in self.PRESSURE_STATUSES:
+                self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+                pause = parse_retry_after(retry_after)
+                if pause:
+                    self._paused_until = max(self._paused_until, time.monotonic() + pause)
+            elif status_code < 500:
+                self.rate = min(self.max_rate, self.rate + self.increase)
@@ -0,0 +1,280 @@
+import json
+import re
+import sqlite3
+import threading
+import time
+
+from .resources.resources import APIObject
+
+
+class LocalStore:
+    """
+    Local SQLite copy of Evance resources, queryable with the same filter vocabulary as the API
+    (e.g. {"sku:startsWith": "AB", "id:in": [1, 2], "email": "jane@example.com"}).
+
+    Every record is stored as JSON alongside a set of filterable columns. id, sku, barcode,
+    partNumber, email, reference and modifiedOn are indexed.
+    """
+    COLUMNS = (
+        "sku", "barcode", "partNumber", "email", "reference", "type", "status",
+        "bandId", "manufacturerId", "createdOn", "modifiedOn",
+    )
+    INDEXED_COLUMNS = ("sku", "barcode", "partNumber", "email", "reference", "modifiedOn")
+
+    OPERATORS = {
+        "min": ">=",
+        "max": "<=",
+        "after": ">",
+        "before": "<",
+    }
+
+    def __init__(self, path=":memory:"):
+        """
+        :param path: Path of the SQLite database (default: in memory)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._tables = set()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS sync_checkpoints ("
+                " resource TEXT PRIMARY KEY, modified_on TEXT, synced_at REAL NOT NULL)"
+            )
+
+    @staticmethod
+    def table_name(resource_name):
+        """
+        Return the table used for a resource (e.g., "products" or "products/1/specifications").
+        """
+        return "r_" + re.sub(r"\W", "_", resource_name)
+
+    def _ensure_table(self, resource_name):
+        table = self.table_name(resource_name)
+        if table in self._tables:
+            return table
+        columns = ", ".join(f'"{column}"' for column in self.COLUMNS)
+        with self._connection:
+            self._connection.execute(
+                f'CREATE TABLE IF NOT EXISTS "{table}" (id INTEGER PRIMARY KEY, {columns}, data TEXT NOT NULL)'
+            )
+            for column in self.INDEXED_COLUMNS:
+                self._connection.execute(
+                    f'CREATE INDEX IF NOT EXISTS "{table}_{column}" ON "{table}" ("{column}")'
+                )
+        self._tables.add(table)
+        return table
+
+    @staticmethod
+    def _column_value(value):
+        if value is None or isinstance(value, (str, int, float)):
+            return value
+        return json.dumps(value)
+
+    def upsert(self, resource_name, records):
+        """
+        Insert or replace records (plain dictionaries with an "id").
+
+        :return: The number of records written
+        """
+        rows = [
+            (record["id"],)
+            + tuple(self._column_value(record.get(column)) for column in self.COLUMNS)
+            + (json.dumps(record),)
+            for record in records
+            if record.get("id") is not None
+        ]
+        if not rows:
+            return 0
+        with self._lock:
+            table = self._ensure_table(resource_name)
+            placeholders = ", ".join("?" * (len(self.COLUMNS) + 2))
+            with self._connection:
+                self._connection.executemany(f'INSERT OR REPLACE INTO "{table}" VALUES ({placeholders})', rows)
+        return len(rows)
+
+    def delete(self, resource_name, ids):
+        """
+        Remove records by id.
+        """
+        with self._lock:
+            table = self._ensure_table(resource_name)
+            with self._connection:
+                self._connection.executemany(f'DELETE FROM "{table}" WHERE id = ?', [(i,) for i in ids])
+
+    def _where(self, filters):
+        """
+        Translate API filters into an SQL WHERE clause and its parameters.
+
+        :raises ValueError: If a filter field or operator is not supported locally
+        """
+        clauses = []
+        values = []
+        for key, value in (filters or {}).items():
+            field, _, operator = key.partition(":")
+            if field != "id" and field not in self.COLUMNS:
+                raise ValueError(f"Invalid parameter: {key}")
+            column = f'"{field}"'
+            if not operator:
+                clauses.append(f"{column} = ?")
+                values.append(value)
+            elif operator == "in":
+                value = list(value)
+                if not value:
+                    clauses.append("0")
+                    continue
+                clauses.append(f"{column} IN ({', '.join('?' * len(value))})")
+                values.extend(value)
+            elif operator in self.OPERATORS:
+                clauses.append(f"{column} {self.OPERATORS[operator]} ?")
+                values.append(value)
+            elif operator in ("startsWith", "endsWith", "contains"):
+                escaped = str(value).replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                pattern = {
+                    "startsWith": f"{escaped}%",
+                    "endsWith": f"%{escaped}",
+                    "contains": f"%{escaped}%",
+                }[operator]
+                clauses.append(f"{column} LIKE ? ESCAPE '\\'")
+                values.append(pattern)
+            else:
+                raise ValueError(f"Invalid parameter: {key}")
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", values
+
+    def query(self, resource_name, filters=None, limit=None, offset=0, record_type=APIObject):
+        """
+        Return stored records matching the filters, ordered by id.
+
+        :param resource_name: The resource name (e.g., "products")
+        :param filters: API-style filters, e.g. {"sku:startsWith": "AB"}
+        :param limit: Maximum number of records to return
+        :param offset: Number of matching records to skip
+        :param record_type: Class used to wrap each record (default: APIObject)
+        """
+        where, values = self._where(filters)
+        sql = f'SELECT data FROM "{{table}}"{where} ORDER BY id'
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            values += [limit, offset]
+        with self._lock:
+            table = self._ensure_table(resource_name)
+            rows = self._connection.execute(sql.format(table=table), values).fetchall()
+        return [record_type(json.loads(row[0])) for row in rows]
+
+    def count(self, resource_name, filters=None):
+        where, values = self._where(filters)
+        with self._lock:
+            table = self._ensure_table(resource_name)
+            return self._connection.execute(f'SELECT COUNT(*) FROM "{table}"{where}', values).fetchone()[0]
+
+    def get_checkpoint(self, resource_name):
+        """
+        Return the latest modifiedOn value synced for a resource, or None before the first sync.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT modified_on FROM sync_checkpoints WHERE resource = ?", (resource_name,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_checkpoint(self, resource_name, modified_on):
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO sync_checkpoints VALUES (?, ?, ?)",
+                (resource_name, modified_on, time.time())
+            )
+
+    def reset(self, resource_name):
+        """
+        Drop a resource's records and checkpoint so the next sync is a full backfill.
+        """
+        with self._lock:
+            table = self._ensure_table(resource_name)
+            with self._connection:
+                self._connection.execute(f'DELETE FROM "{table}"')
+                self._connection.execute("DELETE FROM sync_checkpoints WHERE resource = ?", (resource_name,))
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+class SyncEngine:
+    """
+    Keeps a LocalStore copy of a resource current.
+
+    The first sync is a full backfill. Later syncs only pull records with modifiedOn at or after the
+    persisted checkpoint (`modifiedOn:min`, so records sharing the checkpoint timestamp are never
+    missed) and upsert them. The checkpoint only advances once a sync has completed, so an
+    interrupted sync is simply repeated. Deletions on Evance are not visible through modifiedOn
+    filters; call `backfill()` periodically if they matter.
+    """
+
+    def __init__(self, resource, store, page_limit=100, concurrency=None):
+        """
+        :param resource: A Resources instance supporting modifiedOn filters (e.g., Products(client))
+        :param store: The LocalStore to sync into
+        :param page_limit: Page size used while syncing
+        :param concurrency: Fetch pages concurrently with this many workers (default: sequential with prefetch)
+        """
+        self.resource = resource
+        self.store = store
+        self.page_limit = page_limit
+        self.concurrency = concurrency
+
+    @property
+    def resource_name(self):
+        return self.resource.resource_name
+
+    def sync(self):
+        """
+        Pull every record modified since the last checkpoint (everything on the first run).
+
+        :return: The number of records written
+        """
+        checkpoint = self.store.get_checkpoint(self.resource_name)
+        params = {"limit": self.page_limit}
+        if checkpoint is not None:
+            params["modifiedOn:min"] = checkpoint
+
+        if self.concurrency:
+            pages = self.resource.fetch_pages(params, concurrency=self.concurrency, ordered=False, raw=True)
+        else:
+            pages = self.resource.iter_pages(params, raw=True)
+
+        latest = checkpoint
+        written = 0
+        for page in pages:
+            records = page.to_list()
+            written += self.store.upsert(self.resource_name, records)
+            for record in records:
+                modified_on = record.get("modifiedOn")
+                if isinstance(modified_on, str) and (latest is None or modified_on > latest):
+                    latest = modified_on
+
+        if latest is not None:
+            self.store.set_checkpoint(self.resource_name, latest)
+        return written
+
+    def backfill(self):
+        """
+        Discard the local copy and pull every record again.
+        """
+        self.store.reset(self.resource_name)
+        return self.sync()
+
+    def run(self, interval=60, stop_event=None, iterations=None):
+        """
+        Sync repeatedly every `interval` seconds.
+
+        :param stop_event: A threading.Event that stops the loop when set
+        :param iterations: Stop after this many syncs (default: run until stopped)
+        """
+        stop_event = stop_event or threading.Event()
+        count = 0
+        while not stop_event.is_set():
+            self.sync()
+            count += 1
+            if iterations is not None and count >= iterations:
+                break
+            stop_event.wait(interval)
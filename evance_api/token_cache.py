@@ -0,0 +1,117 @@
+import contextlib
+import json
+import os
+import tempfile
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+
+class MemoryTokenCache:
+    """
+    Token cache shared by every EvanceAuth in the current process that is given the same instance.
+    """
+
+    def __init__(self):
+        self._tokens = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Return the cached (token, expires_at) pair for `key`, or None.
+        """
+        with self._lock:
+            return self._tokens.get(key)
+
+    def set(self, key, token, expires_at):
+        with self._lock:
+            self._tokens[key] = (token, expires_at)
+
+    def delete(self, key):
+        with self._lock:
+            self._tokens.pop(key, None)
+
+    @contextlib.contextmanager
+    def lock(self, key):
+        """
+        Serialise refreshes of `key`. In-process refreshes are already serialised by EvanceAuth.
+        """
+        yield
+
+
+class FileTokenCache:
+    """
+    Token cache persisted to a JSON file, so short-lived processes can reuse a token obtained by
+    another process instead of authenticating again.
+
+    The file is written atomically and is only readable by its owner. On POSIX systems a lock file
+    ensures only one process at a time requests a new token.
+    """
+
+    def __init__(self, path):
+        """
+        :param path: Path of the cache file (e.g., "~/.cache/evance/tokens.json")
+        """
+        self.path = os.path.expanduser(path)
+        self._lock = threading.Lock()
+
+    def _read(self):
+        try:
+            with open(self.path, "r") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, tokens):
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix=".tokens-")
+        try:
+            with os.fdopen(descriptor, "w") as file:
+                json.dump(tokens, file)
+            os.chmod(temp_path, 0o600)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(temp_path)
+            raise
+
+    def get(self, key):
+        """
+        Return the cached (token, expires_at) pair for `key`, or None.
+        """
+        entry = self._read().get(key)
+        if not entry:
+            return None
+        return entry.get("token"), entry.get("expires_at")
+
+    def set(self, key, token, expires_at):
+        with self._lock:
+            tokens = self._read()
+            tokens[key] = {"token": token, "expires_at": expires_at}
+            self._write(tokens)
+
+    def delete(self, key):
+        with self._lock:
+            tokens = self._read()
+            if tokens.pop(key, None) is not None:
+                self._write(tokens)
+
+    @contextlib.contextmanager
+    def lock(self, key):
+        """
+        Hold an exclusive inter-process lock while a new token is requested.
+        """
+        if fcntl is None:
+            yield
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path + ".lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
@@ -0,0 +1,515 @@
+import base64
+import json
+import threading
+import time
+import warnings
+from urllib.parse import urlsplit
+
+from .cache import cache_key
+from .compression import accept_encoding, decompress
+from .exceptions import UnexpectedError
+
+TOKEN_PATH = "/admin/oauth/token"
+
+
+class Headers(dict):
+    """
+    Case-insensitive response headers.
+    """
+
+    def __init__(self, headers=None):
+        super().__init__()
+        for name, value in (headers or {}).items():
+            self[name] = value
+
+    def __setitem__(self, name, value):
+        super().__setitem__(name.lower(), value)
+
+    def __getitem__(self, name):
+        return super().__getitem__(name.lower())
+
+    def __contains__(self, name):
+        return super().__contains__(name.lower())
+
+    def get(self, name, default=None):
+        return super().get(name.lower(), default)
+
+
+class TransportResponse:
+    """
+    The parts of an HTTP response the client uses, independent of the HTTP library.
+    """
+    __slots__ = ("status_code", "headers", "content", "http_version", "wire_bytes")
+
+    def __init__(self, status_code, headers=None, content=b"", http_version=None, wire_bytes=None):
+        self.status_code = status_code
+        self.headers = headers if isinstance(headers, Headers) else Headers(headers)
+        self.content = content  # Decoded body (Content-Encoding removed)
+        self.http_version = http_version  # e.g. "HTTP/2", when the transport reports it
+        self.wire_bytes = wire_bytes  # Body size as received (compressed), when the transport reports it
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+    def __repr__(self):
+        return f"TransportResponse({self.status_code}, {len(self.content)} bytes)"
+
+
+class TransportRequest:
+    """
+    A request as passed to an InMemoryTransport handler.
+    """
+    __slots__ = ("method", "url", "params", "headers", "body")
+
+    def __init__(self, method, url, params=None, headers=None, body=None):
+        self.method = method
+        self.url = url
+        self.params = params or {}
+        self.headers = Headers(headers)
+        self.body = body
+
+    @property
+    def path(self):
+        return urlsplit(self.url).path
+
+    def json(self):
+        """
+        Decode the JSON body, removing any Content-Encoding first.
+        """
+        if not self.body:
+            return None
+        content_encoding = self.headers.get("Content-Encoding")
+        return json.loads(decompress(self.body, content_encoding) if content_encoding else self.body)
+
+    def __repr__(self):
+        return f"TransportRequest({self.method} {cache_key(self.url, self.params)})"
+
+
+class Transport:
+    """
+    Sends HTTP requests for EvanceClient and EvanceAuth.
+
+    send() returns a TransportResponse for every HTTP response, including error statuses, and raises
+    ConnectionError or TimeoutError when no response was received.
+    """
+
+    def send(self, method, url, params=None, data=None, headers=None, timeout=None, verify=True):
+        """
+        :param method: HTTP method
+        :param url: Absolute URL without the query string
+        :param params: Query parameters
+        :param data: Encoded request body (bytes) or None
+        :param headers: Request headers (Accept-Encoding defaults to every coding the transport can decode)
+        :param timeout: Timeout in seconds, or a (connect, read) tuple
+        :param verify: Verify TLS certificates
+        :return: A TransportResponse with the decoded body
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """
+        Release any connections held by the transport.
+        """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class RequestsTransport(Transport):
+    """
+    The default transport: a pooled, keep-alive requests.Session.
+
+    requests is imported and the session built on first use, so creating a client stays cheap.
+    """
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, pool_block=False, max_retries=3, session=None):
+        """
+        :param pool_connections: Number of per-host connection pools to cache
+        :param pool_maxsize: Maximum number of connections kept alive per host
+        :param pool_block: Block when the pool is exhausted instead of opening extra connections
+        :param max_retries: Retries for connections that fail or are dropped before a response arrives
+        :param session: Use this requests.Session instead of building one
+        """
+        self._pool = (pool_connections, pool_maxsize, pool_block, max_retries)
+        self._session = session
+        self._closed = False
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        """
+        The requests.Session, built on first access; None once the transport is closed.
+        """
+        session = self._session
+        if session is None and not self._closed:
+            with self._lock:
+                if self._session is None and not self._closed:
+                    self._session = self._build_session(*self._pool)
+                session = self._session
+        return session
+
+    @staticmethod
+    def _build_session(pool_connections, pool_maxsize, pool_block, max_retries):
+        """
+        Build a keep-alive session backed by a bounded connection pool.
+
+        Only connection errors and dropped sockets are retried here. Reads are retried for idempotent
+        methods only (urllib3's default allow-list), so a POST is never sent twice.
+
+        :return: A configured requests.Session
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=max_retries,
+            status=0,
+            redirect=0,
+            backoff_factor=0,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def send(self, method, url, params=None, data=None, headers=None, timeout=None, verify=True):
+        session = self.session
+        if session is None:
+            raise UnexpectedError("The transport has been closed.")
+        from requests import exceptions
+
+        try:
+            if not verify:
+                # Suppress InsecureRequestWarning when certificate verification is disabled (debug mode)
+                from urllib3.exceptions import InsecureRequestWarning
+
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", InsecureRequestWarning)
+                    response = session.request(
+                        method, url, params=params, data=data, headers=headers, verify=False, timeout=timeout
+                    )
+            else:
+                response = session.request(
+                    method, url, params=params, data=data, headers=headers, verify=True, timeout=timeout
+                )
+        except exceptions.ConnectionError as conn_err:
+            raise ConnectionError() from conn_err
+        except exceptions.Timeout as timeout_err:
+            raise TimeoutError() from timeout_err
+        except exceptions.RequestException as req_err:
+            raise UnexpectedError(f"An unexpected error occurred: {req_err}") from req_err
+        # urllib3 decodes gzip/deflate/br/zstd while reading; tell() is the number of bytes read from the socket
+        content = response.content
+        wire_bytes = getattr(response.raw, "tell", None)
+        wire_bytes = wire_bytes() if wire_bytes is not None else None
+        return TransportResponse(
+            response.status_code, response.headers, content,
+            wire_bytes=wire_bytes if isinstance(wire_bytes, int) else None,
+        )
+
+    def close(self):
+        with self._lock:
+            session, self._session = self._session, None
+            self._closed = True
+        if session is not None:
+            session.close()
+
+
+def http2_available(requested=True):
+    """
+    Return True if HTTP/2 was requested and the h2 package is installed. Without h2, warn and fall back
+    to HTTP/1.1.
+    """
+    if not requested:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        warnings.warn(
+            "HTTP/2 requires the h2 package (pip install evance_api_pyclient[http2]); falling back to HTTP/1.1.",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+        return False
+    return True
+
+
+def _query_params(params):
+    """
+    Encode query parameters the way requests does: None values are dropped, other values are str().
+    """
+    if not params:
+        return None
+    encoded = {}
+    for name, value in params.items():
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            encoded[name] = [str(item) for item in value if item is not None]
+        else:
+            encoded[name] = str(value)
+    return encoded
+
+
+class HTTP2Transport(Transport):
+    """
+    Multiplexes concurrent requests over a single HTTP/2 connection per host, using httpx.
+
+    HTTP/2 is negotiated during the TLS handshake. Servers that only speak HTTP/1.1, plain http:// URLs
+    and environments without the h2 package fall back to HTTP/1.1 over a pool of up to
+    `max_connections` connections. Requires httpx with HTTP/2 support:
+    pip install evance_api_pyclient[http2]
+    """
+
+    def __init__(self, max_concurrent_streams=100, max_connections=10, max_retries=3, http2=True):
+        """
+        :param max_concurrent_streams: Maximum number of requests in flight at once (the server's own
+                                       SETTINGS_MAX_CONCURRENT_STREAMS limit also applies)
+        :param max_connections: Maximum number of connections per host, used when falling back to HTTP/1.1
+        :param max_retries: Retries for connections that fail to establish
+        :param http2: Set to False to use httpx over HTTP/1.1 only
+        """
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "HTTP2Transport requires httpx. Install it with: pip install evance_api_pyclient[http2]"
+            ) from None
+        self._httpx = httpx
+        self.http2 = http2_available(http2)
+        self.max_concurrent_streams = max_concurrent_streams
+        self.max_connections = max_connections
+        self.max_retries = max_retries
+        self._streams = threading.BoundedSemaphore(max_concurrent_streams)
+        self._clients = {}  # verify -> httpx.Client, created on first use
+        self._lock = threading.Lock()
+
+    def _client(self, verify):
+        clients = self._clients
+        if clients is None:
+            raise UnexpectedError("The transport has been closed.")
+        client = clients.get(verify)
+        if client is None:
+            with self._lock:
+                client = clients.get(verify)
+                if client is None:
+                    httpx = self._httpx
+                    client = clients[verify] = httpx.Client(
+                        transport=httpx.HTTPTransport(
+                            http2=self.http2,
+                            verify=verify,
+                            retries=self.max_retries,
+                            limits=httpx.Limits(
+                                max_connections=self.max_connections,
+                                max_keepalive_connections=self.max_connections,
+                            ),
+                        ),
+                    )
+        return client
+
+    def send(self, method, url, params=None, data=None, headers=None, timeout=None, verify=True):
+        httpx = self._httpx
+        client = self._client(verify)
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(None, connect=timeout[0], read=timeout[1])
+        else:
+            timeout = httpx.Timeout(timeout)
+        with self._streams:
+            try:
+                response = client.request(
+                    method, url, params=_query_params(params), content=data, headers=headers, timeout=timeout
+                )
+            except httpx.TimeoutException as timeout_err:
+                raise TimeoutError() from timeout_err
+            except httpx.TransportError as conn_err:
+                raise ConnectionError() from conn_err
+            except httpx.HTTPError as req_err:
+                raise UnexpectedError(f"An unexpected error occurred: {req_err}") from req_err
+        return TransportResponse(
+            response.status_code, response.headers, response.content, response.http_version,
+            response.num_bytes_downloaded,
+        )
+
+    def close(self):
+        with self._lock:
+            clients, self._clients = self._clients, None
+        for client in (clients or {}).values():
+            client.close()
+
+
+def _as_response(result):
+    """
+    Turn a handler's return value into a TransportResponse: a TransportResponse, a (status, body) or
+    (status, headers, body) tuple, or a JSON-serialisable value (sent as 200).
+    """
+    if isinstance(result, TransportResponse):
+        return result
+    headers = None
+    if isinstance(result, tuple):
+        if len(result) == 3:
+            status, headers, body = result
+        else:
+            status, body = result
+    else:
+        status, body = 200, result
+    if not isinstance(body, (bytes, str)):
+        body = json.dumps(body)
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    return TransportResponse(status, headers, body)
+
+
+class InMemoryTransport(Transport):
+    """
+    Routes every request to a Python handler in-process: no sockets, no serialisation beyond JSON.
+
+    The handler receives a TransportRequest and returns a TransportResponse, a (status, body) or
+    (status, headers, body) tuple, or a JSON-serialisable value (sent as 200). Bodies returned with a
+    Content-Encoding header are decoded, as an HTTP library would. Useful for tests, CI and load tests of
+    the client itself.
+    """
+
+    def __init__(self, handler, latency=0.0):
+        """
+        :param handler: Callable receiving a TransportRequest
+        :param latency: Seconds to sleep before each response, to simulate the network
+        """
+        self.handler = handler
+        self.latency = latency
+        self.requests = 0
+
+    def send(self, method, url, params=None, data=None, headers=None, timeout=None, verify=True):
+        self.requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+        request = TransportRequest(method, url, params, headers, data)
+        if "Accept-Encoding" not in request.headers:
+            request.headers["Accept-Encoding"] = accept_encoding()
+        response = _as_response(self.handler(request))
+        if response.wire_bytes is None:
+            response.wire_bytes = len(response.content)
+            content_encoding = response.headers.get("Content-Encoding")
+            if content_encoding:
+                response.content = decompress(response.content, content_encoding)
+        return response
+
+
+def _record_key(method, url, params, data, match_body):
+    import hashlib
+
+    body = None
+    if match_body and data and not url.endswith(TOKEN_PATH):  # Credentials never take part in matching
+        body = hashlib.sha256(data if isinstance(data, bytes) else data.encode("utf-8")).hexdigest()
+    return method, cache_key(url, params), body
+
+
+class RecordingTransport(Transport):
+    """
+    Passes requests to another transport and appends every exchange to a cassette file (JSON lines),
+    for replaying later with ReplayTransport.
+
+    Request headers and bodies are not stored (only a hash of the body, for matching), and access tokens
+    in token responses are replaced, so cassettes do not contain credentials.
+    """
+
+    def __init__(self, transport, path, match_body=True):
+        """
+        :param transport: The transport that performs the requests (e.g., RequestsTransport())
+        :param path: Cassette file; new exchanges are appended
+        :param match_body: Store a hash of request bodies so replay can tell writes apart
+        """
+        self.transport = transport
+        self.path = path
+        self.match_body = match_body
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def send(self, method, url, params=None, data=None, headers=None, timeout=None, verify=True):
+        response = self.transport.send(method, url, params, data, headers, timeout, verify)
+        method, key, body = _record_key(method, url, params, data, self.match_body)
+        content = response.content
+        if url.endswith(TOKEN_PATH) and response.status_code < 400:
+            payload = json.loads(content)
+            payload["access_token"] = "replayed-token"
+            content = json.dumps(payload).encode("utf-8")
+        record = {"method": method, "url": key, "body": body, "status": response.status_code,
+                  "headers": dict(response.headers), "wire_bytes": response.wire_bytes}
+        try:
+            record["content"] = content.decode("utf-8")
+        except UnicodeDecodeError:
+            record["content_base64"] = base64.b64encode(content).decode("ascii")
+        with self._lock:
+            self._file.write(json.dumps(record) + "\n")
+            self._file.flush()
+        return response
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+        self.transport.close()
+
+
+class ReplayTransport(Transport):
+    """
+    Answers requests from a cassette written by RecordingTransport, without any network access.
+
+    Requests are matched on method, URL with query parameters, and body hash. Repeated identical requests
+    receive the recorded responses in order; once they run out, `loop=True` starts again from the first.
+    """
+
+    def __init__(self, path, loop=True, match_body=True):
+        """
+        :param path: Cassette file
+        :param loop: Reuse recorded responses once exhausted (False raises UnexpectedError instead)
+        :param match_body: Match request bodies (must agree with the RecordingTransport setting)
+        """
+        self.loop = loop
+        self.match_body = match_body
+        self._responses = {}
+        self._positions = {}
+        self._lock = threading.Lock()
+        with open(path, "r", encoding="utf-8") as file:
+            for line in file:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if "content_base64" in record:
+                    content = base64.b64decode(record["content_base64"])
+                else:
+                    content = record["content"].encode("utf-8")
+                response = TransportResponse(record["status"], record["headers"], content,
+                                             wire_bytes=record.get("wire_bytes"))
+                key = (record["method"], record["url"], record["body"])
+                self._responses.setdefault(key, []).append(response)
+
+    def send(self, method, url, params=None, data=None, headers=None, timeout=None, verify=True):
+        key = _record_key(method, url, params, data, self.match_body)
+        responses = self._responses.get(key)
+        if not responses:
+            raise UnexpectedError(f"No recorded response for {key[0]} {key[1]}")
+        with self._lock:
+            position = self._positions.get(key, 0)
+            if position >= len(responses):
+                if not self.loop:
+                    raise UnexpectedError(f"Recorded responses exhausted for {key[0]} {key[1]}")
+                position = 0
+            self._positions[key] = position + 1
+        return responses[position]
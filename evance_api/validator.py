@@ -1,11 +1,44 @@
+from types import MappingProxyType
+
+
+def _type_name(expected_type):
+    if isinstance(expected_type, tuple):
+        return " or ".join(t.__name__ for t in expected_type)
+    return expected_type.__name__
+
+
+def _type_tuple(expected_type):
+    return expected_type if isinstance(expected_type, tuple) else (expected_type,)
+
+
 class Validator:
     def __init__(self, accepted_params):
         """
         Initialize the parameter validator with accepted parameters.
 
+        The accepted parameters are compiled once into per-key type tuples and error messages; build
+        one validator per resource class and share it between instances. `accepted_params` is exposed
+        as a read-only mapping, since changing it would not change the compiled checks.
+
         :param accepted_params: A dictionary of accepted parameters and their expected types
         """
-        self.accepted_params = accepted_params
+        self.accepted_params = MappingProxyType(dict(accepted_params))
+        self._checkers = {
+            key: (_type_tuple(expected_type), f"Parameter '{key}' must be of type {_type_name(expected_type)}")
+            for key, expected_type in accepted_params.items()
+        }
+
+    def check(self, key, value):
+        """
+        Validate a single parameter.
+
+        :raises ValueError: If the parameter is unknown or its value has the wrong type
+        """
+        checker = self._checkers.get(key)
+        if checker is None:
+            raise ValueError(f"Invalid parameter: {key}")
+        if not isinstance(value, checker[0]):
+            raise ValueError(checker[1])
 
     def validate(self, params):
         """
@@ -15,11 +48,7 @@ class Validator:
         :raises ValueError: If invalid parameters are found
         """
         for key, value in params.items():
-            if key not in self.accepted_params:
-                raise ValueError(f"Invalid parameter: {key}")
-            expected_type = self.accepted_params[key]
-            if not isinstance(value, expected_type):
-                raise ValueError(f"Parameter '{key}' must be of type {expected_type.__name__}")
+            self.check(key, value)
         return True
 
 class JSONValidator:
@@ -27,45 +56,89 @@ class JSONValidator:
         """
         Initialize the JSON body validator with mandatory and optional keys.
 
+        The keys are compiled once into type tuples with their error messages prepared, so validating a body is a
+        single pass over the expected keys with no per-call type-name formatting.
+
         :param mandatory_keys: A dictionary of mandatory keys and their expected types (e.g., {"name": str})
         :param optional_keys: A dictionary of optional keys and their expected types (default: None)
         """
         self.mandatory_keys = mandatory_keys
         self.optional_keys = optional_keys or {}
+        self._mandatory = tuple(
+            (
+                key,
+                _type_tuple(expected_type),
+                f"Missing mandatory key under 'data': {key}",
+                f"Key '{key}' under 'data' must be of type {_type_name(expected_type)} or None",
+            )
+            for key, expected_type in self.mandatory_keys.items()
+        )
+        self._optional = {
+            key: (
+                _type_tuple(expected_type),
+                f"Optional key '{key}' under 'data' must be of type {_type_name(expected_type)} or None",
+            )
+            for key, expected_type in self.optional_keys.items()
+        }
 
-    def validate(self, body):
+    def errors(self, body):
         """
-        Validate the given JSON body.
+        Yield every validation error message for the given JSON body, in checking order.
 
         :param body: Dictionary representing the JSON body to be validated
-        :raises ValueError: If mandatory keys are missing or types mismatch, or if optional keys have invalid types
         """
         if not isinstance(body, dict):
-            raise ValueError("The request body must be a dictionary")
+            yield "The request body must be a dictionary"
+            return
 
         # Validate the presence of the "data" key
         if "data" not in body:
-            raise ValueError("Request body must contain a 'data' key")
+            yield "Request body must contain a 'data' key"
+            return
 
         data = body["data"]
 
         if not isinstance(data, dict):
-            raise ValueError("'data' must be a dictionary")
+            yield "'data' must be a dictionary"
+            return
 
         # Validate mandatory keys inside "data"
-        for key, expected_type in self.mandatory_keys.items():
+        for key, types, missing_message, type_message in self._mandatory:
             if key not in data:
-                raise ValueError(f"Missing mandatory key under 'data': {key}")
-            if data[key] is not None and not isinstance(data[key], expected_type):
-                raise ValueError(
-                    f"Key '{key}' under 'data' must be of type {expected_type.__name__} or None"
-                )
-
-        # Validate optional keys inside "data" (if present)
-        for key, expected_type in self.optional_keys.items():
-            if key in data and data[key] is not None and not isinstance(data[key], expected_type):
-                raise ValueError(
-                    f"Optional key '{key}' under 'data' must be of type {expected_type.__name__} or None"
-                )
-
-        return True
\ No newline at end of file
+                yield missing_message
+                continue
+            value = data[key]
+            if value is not None and not isinstance(value, types):
+                yield type_message
+
+        # Validate optional keys inside "data" (if present); bodies carry far fewer keys than the schema
+        optional = self._optional
+        for key, value in data.items():
+            checker = optional.get(key)
+            if checker is not None and value is not None and not isinstance(value, checker[0]):
+                yield checker[1]
+
+    def validate(self, body):
+        """
+        Validate the given JSON body.
+
+        :param body: Dictionary representing the JSON body to be validated
+        :raises ValueError: If mandatory keys are missing or types mismatch, or if optional keys have invalid types
+        """
+        message = next(self.errors(body), None)
+        if message is not None:
+            raise ValueError(message)
+        return True
+
+    def validate_many(self, bodies):
+        """
+        Validate many JSON bodies and collect every error instead of stopping at the first one.
+
+        :param bodies: Iterable of bodies (e.g., {"data": {...}} for each row)
+        :return: A list of (row_index, message) tuples; empty if every body is valid
+        """
+        errors = []
+        for index, body in enumerate(bodies):
+            for message in self.errors(body):
+                errors.append((index, message))
+        return errors
@@ -15,6 +15,19 @@ setup(
         "jwt==1.3.1",
         "urllib3~=2.2.3",
     ],
+    extras_require={
+        "async": ["httpx>=0.23"],
+        "http2": ["httpx[http2]>=0.23"],
+        "compression": ["brotli", "zstandard"],
+        "fast": ["orjson>=3.6"],
+        "parquet": ["pyarrow>=7"],
+        "columnar": ["pyarrow>=7", "numpy", "pandas"],
+    },
+    entry_points={
+        "console_scripts": [
+            "evance-export=evance_api.cli:main",
+        ],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
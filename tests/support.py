@@ -0,0 +1,90 @@
+"""
+Fakes shared by the tests: an in-memory product catalogue served to a real EvanceClient through
+InMemoryTransport, and an awaitable facade for exercising the async resources against it.
+"""
+import asyncio
+
+from evance_api.auth import EvanceAuth
+from evance_api.client import EvanceClient
+from evance_api.transport import InMemoryTransport
+
+
+def product(product_id, **fields):
+    """
+    A product record; keyword arguments add or replace fields.
+    """
+    record = {
+        "id": product_id,
+        "sku": f"AB-{product_id}",
+        "pricing": {"price": product_id * 1.5, "currency": "GBP"},
+    }
+    record.update(fields)
+    return record
+
+
+class Catalogue:
+    """
+    An InMemoryTransport handler serving `products` page by page, honouring limit, page and
+    modifiedOn:min. The query parameters of every request are recorded in `requests`.
+    """
+
+    def __init__(self, products, fail_on_page=None):
+        """
+        :param products: List of product records (may be changed between requests)
+        :param fail_on_page: Raise ConnectionError once when this page is requested
+        """
+        self.products = products
+        self.fail_on_page = fail_on_page
+        self.requests = []
+
+    @property
+    def pages(self):
+        """
+        The page numbers that were served, in request order.
+        """
+        return [int(params.get("page", 1)) for params in self.requests]
+
+    def client(self):
+        """
+        Return an EvanceClient, already authenticated, that talks to this catalogue.
+        """
+        auth = EvanceAuth(base_url="https://example.evance.me")
+        auth.token = "token"
+        return EvanceClient(auth, "v2", transport=InMemoryTransport(self))
+
+    def __call__(self, request):
+        params = request.params
+        page = int(params.get("page", 1))
+        if page == self.fail_on_page:
+            self.fail_on_page = None
+            raise ConnectionError("connection reset")
+        self.requests.append(dict(params))
+
+        modified_since = params.get("modifiedOn:min", "")
+        matching = [item for item in self.products if item.get("modifiedOn", "") >= modified_since]
+        limit = int(params.get("limit", 100))
+        return {
+            "success": True,
+            "pagination": {"page": page, "limit": limit, "total": len(matching),
+                           "pages": max(1, -(-len(matching) // limit))},
+            "data": matching[(page - 1) * limit:page * limit],
+        }
+
+
+class AsyncClient:
+    """
+    Awaitable facade over a sync client, recording how many requests were in flight at once.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self.in_flight = self.peak = 0
+
+    async def get(self, endpoint, params=None, raw=False):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            return self.client.get(endpoint, params, raw)
+        finally:
+            self.in_flight -= 1
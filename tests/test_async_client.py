@@ -0,0 +1,162 @@
+import asyncio
+import contextlib
+import time
+import unittest
+
+import httpx
+
+from evance_api import AsyncEvanceClient, AsyncProducts, EvanceAuth
+from evance_api.exceptions import NotFoundError
+from evance_api.token_cache import MemoryTokenCache
+
+
+class SharedTokenCache(MemoryTokenCache):
+    """A token cache whose lock records its use and can simulate another process refreshing first."""
+
+    def __init__(self, token_from_other_process=None):
+        super().__init__()
+        self.token_from_other_process = token_from_other_process
+        self.events = []
+
+    @contextlib.contextmanager
+    def lock(self, key):
+        self.events.append("lock")
+        if self.token_from_other_process:
+            self.set(key, self.token_from_other_process, time.time() + 3600)
+        try:
+            yield
+        finally:
+            self.events.append("unlock")
+
+
+class TestAsyncEvanceClient(unittest.IsolatedAsyncioTestCase):
+    def make_client(self, handler, **kwargs):
+        auth = EvanceAuth(base_url="https://example.evance.me")
+        auth.token = "test_token"
+        client = AsyncEvanceClient(auth, "v2", **kwargs)
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client
+
+    async def test_list_products(self):
+        def handler(request):
+            self.assertEqual(request.headers["Authorization"], "Bearer test_token")
+            self.assertEqual(request.url.params["limit"], "5")
+            return httpx.Response(200, json={"success": True, "data": [{"id": 1, "sku": "A"}]})
+
+        async with self.make_client(handler) as client:
+            response = await AsyncProducts(client).list({"limit": 5})
+
+        self.assertTrue(response.success)
+        self.assertEqual(response[0].sku, "A")
+
+    async def test_error_mapping(self):
+        async with self.make_client(lambda request: httpx.Response(404, text="missing")) as client:
+            with self.assertRaises(NotFoundError):
+                await AsyncProducts(client).one(1)
+
+    async def test_concurrency_is_bounded(self):
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"data": {"id": 1}})
+
+        async with self.make_client(handler, max_concurrency=3) as client:
+            products = AsyncProducts(client)
+            await asyncio.gather(*(products.one(i) for i in range(20)))
+
+        self.assertEqual(peak, 3)
+
+    async def test_identical_gets_share_one_call(self):
+        calls = 0
+
+        async def handler(request):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"data": {"id": 1}})
+
+        async with self.make_client(handler, coalesce=True) as client:
+            results = await asyncio.gather(*(client.get("products/1.json") for _ in range(8)))
+
+            self.assertEqual(calls, 1)
+            self.assertTrue(all(result is results[0] for result in results))
+            self.assertEqual(client.coalescing_stats, {"executed": 1, "coalesced": 7})
+
+    async def test_cancelling_the_first_caller_does_not_cancel_the_others(self):
+        calls = 0
+
+        async def handler(request):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"data": {"id": 1}})
+
+        async with self.make_client(handler, coalesce=True) as client:
+            leader = asyncio.ensure_future(asyncio.wait_for(client.get("products/1.json"), 0.01))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(client.get("products/1.json"))
+
+            with self.assertRaises(asyncio.TimeoutError):
+                await leader
+            self.assertEqual(await follower, {"data": {"id": 1}})
+            self.assertEqual(calls, 1)
+
+    async def test_the_shared_call_is_cancelled_with_its_last_caller(self):
+        finished = asyncio.Event()
+
+        async def handler(request):
+            await asyncio.sleep(0.05)
+            finished.set()
+            return httpx.Response(200, json={"data": {"id": 1}})
+
+        async with self.make_client(handler, coalesce=True) as client:
+            callers = [asyncio.ensure_future(client.get("products/1.json")) for _ in range(2)]
+            await asyncio.sleep(0.01)
+            for caller in callers:
+                caller.cancel()
+            await asyncio.gather(*callers, return_exceptions=True)
+            await asyncio.sleep(0.1)
+
+            self.assertFalse(finished.is_set())
+            self.assertEqual(client.single_flight._calls, {})
+
+    def make_refreshing_client(self, token_cache, tokens_issued):
+        def handler(request):
+            if request.url.path == "/admin/oauth/token":
+                token_cache.events.append("authenticate")
+                tokens_issued.append(request)
+                return httpx.Response(200, json={"access_token": "fresh", "expires_in": 3600})
+            return httpx.Response(200, json={"data": {"token": request.headers["Authorization"]}})
+
+        auth = EvanceAuth(base_url="https://example.evance.me", client_id="id", private_key="secret",
+                          token_cache=token_cache)
+        client = AsyncEvanceClient(auth, "v2")
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client
+
+    async def test_refresh_adopts_a_token_cached_by_another_process(self):
+        token_cache = SharedTokenCache(token_from_other_process="from-other-process")
+        tokens_issued = []
+
+        async with self.make_refreshing_client(token_cache, tokens_issued) as client:
+            result = await client.get("products/1.json")
+
+        self.assertEqual(result, {"data": {"token": "Bearer from-other-process"}})
+        self.assertEqual(tokens_issued, [])
+        self.assertEqual(token_cache.events, ["lock", "unlock"])
+
+    async def test_refresh_authenticates_while_holding_the_cache_lock(self):
+        token_cache = SharedTokenCache()
+        tokens_issued = []
+
+        async with self.make_refreshing_client(token_cache, tokens_issued) as client:
+            await asyncio.gather(*(client.get("products/1.json") for _ in range(5)))
+
+        self.assertEqual(len(tokens_issued), 1)
+        self.assertEqual(token_cache.events, ["lock", "authenticate", "unlock"])
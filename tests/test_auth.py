@@ -0,0 +1,76 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+
+from evance_api.auth import EvanceAuth
+from evance_api.client import EvanceClient
+from evance_api.token_cache import FileTokenCache
+
+
+def make_auth(**kwargs):
+    return EvanceAuth(base_url="https://example.evance.me", client_id="id", private_key="secret", **kwargs)
+
+
+def response(status_code, content=b'{"data": []}'):
+    mock = MagicMock()
+    mock.status_code = status_code
+    mock.content = content
+    return mock
+
+
+class TestTokenLifecycle(unittest.TestCase):
+    def test_token_refreshed_before_expiry(self):
+        auth = make_auth(refresh_leeway=60)
+        tokens = iter(["first", "second"])
+
+        with patch.object(EvanceAuth, "authenticate", autospec=True,
+                          side_effect=lambda self: self.store_token({"access_token": next(tokens), "expires_in": 30})):
+            self.assertEqual(auth.get_token(), "first")
+            # 30 seconds left is inside the 60 second leeway
+            self.assertEqual(auth.get_token(), "second")
+
+    def test_concurrent_refresh_is_single_flight(self):
+        auth = make_auth()
+        calls = []
+
+        def authenticate(self):
+            calls.append(1)
+            time.sleep(0.05)
+            return self.store_token({"access_token": "fresh", "expires_in": 3600})
+
+        with patch.object(EvanceAuth, "authenticate", autospec=True, side_effect=authenticate):
+            threads = [threading.Thread(target=auth.refresh, args=(None,)) for _ in range(10)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(auth.token, "fresh")
+
+    @patch("requests.Session.request")
+    def test_unauthorized_call_is_retried_once(self, mock_request):
+        mock_request.side_effect = [response(401), response(200)]
+        auth = make_auth()
+        auth.token = "revoked"
+
+        with patch.object(EvanceAuth, "authenticate", autospec=True,
+                          side_effect=lambda self: self.store_token({"access_token": "fresh"})):
+            result = EvanceClient(auth, "v2").get("products.json")
+
+        self.assertEqual(result, {"data": []})
+        self.assertEqual(mock_request.call_args.kwargs["headers"]["Authorization"], "Bearer fresh")
+
+    def test_file_cache_shares_tokens(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = FileTokenCache(os.path.join(directory, "tokens.json"))
+            first = make_auth(token_cache=cache)
+            first.store_token({"access_token": "cached", "expires_in": 3600})
+
+            second = make_auth(token_cache=cache)
+            with patch.object(EvanceAuth, "authenticate", autospec=True) as authenticate:
+                self.assertEqual(second.get_token(), "cached")
+                authenticate.assert_not_called()
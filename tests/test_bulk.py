@@ -0,0 +1,149 @@
+import asyncio
+import itertools
+import threading
+import unittest
+
+from evance_api import AsyncContacts, Contacts
+from evance_api.exceptions import ServerError, TooManyRequestsError, error_for_status
+from evance_api.retry import RetryPolicy
+
+
+class WriteClient:
+    def __init__(self, failures=None):
+        self.failures = failures or {}
+        self.ids = itertools.count(1)
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def _write(self, method, endpoint, json):
+        with self.lock:
+            self.calls.append((method, endpoint))
+            failures = self.failures.get(json["data"]["email"] if json else endpoint)
+            if failures:
+                raise failures.pop(0)
+            return {"success": True, "data": dict(json["data"], id=next(self.ids)) if json else None}
+
+    def post(self, endpoint, json=None):
+        return self._write("POST", endpoint, json)
+
+    def put(self, endpoint, json=None):
+        return self._write("PUT", endpoint, json)
+
+    def delete(self, endpoint):
+        self._write("DELETE", endpoint, None)
+        return True
+
+
+class AsyncWriteClient(WriteClient):
+    def __init__(self, failures=None):
+        super().__init__(failures)
+        self.in_flight = self.peak = 0
+
+    async def _write_async(self, method, endpoint, json):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            return self._write(method, endpoint, json)
+        finally:
+            self.in_flight -= 1
+
+    async def post(self, endpoint, json=None):
+        return await self._write_async("POST", endpoint, json)
+
+    async def put(self, endpoint, json=None):
+        return await self._write_async("PUT", endpoint, json)
+
+    async def delete(self, endpoint):
+        await self._write_async("DELETE", endpoint, None)
+        return True
+
+
+def contact(number):
+    return {"email": f"user{number}@example.com", "type": "user", "firstName": "Jane", "lastName": "Doe"}
+
+
+class TestBulkWrites(unittest.TestCase):
+    def test_bulk_add_reports_each_record(self):
+        client = WriteClient(failures={
+            "user3@example.com": [TooManyRequestsError()],
+            "user5@example.com": [ServerError()],
+        })
+        records = [contact(n) for n in range(10)]
+        records[7] = {"email": "broken@example.com"}  # Missing mandatory keys
+        progress = []
+
+        report = Contacts(client).bulk_add(
+            iter(records), concurrency=4, retry_policy=RetryPolicy(backoff_factor=0),
+            progress=lambda r: progress.append(r.completed), progress_every=5
+        )
+
+        self.assertEqual([result.index for result in report.results], list(range(10)))
+        self.assertEqual(report.succeeded, 8)
+        self.assertEqual([result.index for result in report.errors], [5, 7])
+        self.assertEqual(report.results[3].attempts, 2)
+        self.assertIsInstance(report.results[7].error, ValueError)
+        self.assertEqual(progress, [5, 10])
+
+    def test_bulk_update_and_delete(self):
+        client = WriteClient(failures={"contacts/2.json": [error_for_status(503, "Unavailable")]})
+        contacts = Contacts(client)
+
+        updated = contacts.bulk_update([(1, contact(1)), dict(contact(2), id=2)])
+        deleted = contacts.bulk_delete([1, 2], retry_policy=RetryPolicy(backoff_factor=0))
+
+        self.assertEqual(updated.succeeded, 2)
+        self.assertEqual(deleted.succeeded, 2)
+        self.assertEqual(deleted.results[1].attempts, 2)
+
+    def test_bulk_update_reports_records_without_an_id(self):
+        client = WriteClient()
+        report = Contacts(client).bulk_update([contact(1), dict(contact(2), id=2)])
+
+        self.assertIsInstance(report.results[0].error, ValueError)
+        self.assertEqual(report.results[0].attempts, 0)
+        self.assertEqual(client.calls, [("PUT", "contacts/2.json")])
+
+    def test_only_the_policy_statuses_are_retried(self):
+        client = WriteClient(failures={
+            "contacts/1.json": [error_for_status(500, "Internal error")],
+            "contacts/2.json": [error_for_status(502, "Bad gateway")],
+        })
+        report = Contacts(client).bulk_delete([1, 2], retry_policy=RetryPolicy(backoff_factor=0))
+
+        self.assertEqual([result.attempts for result in report.results], [1, 2])
+        self.assertEqual([result.ok for result in report.results], [False, True])
+
+
+class TestAsyncBulkWrites(unittest.IsolatedAsyncioTestCase):
+    async def test_bulk_add_awaits_every_write(self):
+        client = AsyncWriteClient(failures={"user3@example.com": [TooManyRequestsError()]})
+        records = [contact(n) for n in range(10)]
+        records[7] = {"email": "broken@example.com"}
+
+        report = await AsyncContacts(client).bulk_add(
+            records, concurrency=3, retry_policy=RetryPolicy(backoff_factor=0)
+        )
+
+        self.assertEqual(report.succeeded, 9)
+        self.assertEqual([result.index for result in report.errors], [7])
+        self.assertEqual(report.results[0].resource_id, report.results[0].response.data.id)
+        self.assertEqual(len(client.calls), 10)
+        self.assertLessEqual(client.peak, 3)
+
+    async def test_bulk_update_and_delete_send_every_request(self):
+        client = AsyncWriteClient(failures={"contacts/2.json": [error_for_status(503, "Unavailable")]})
+        contacts = AsyncContacts(client)
+
+        updated = await contacts.bulk_update([(1, contact(1)), contact(3)])
+        deleted = await contacts.bulk_delete([1, 2], retry_policy=RetryPolicy(backoff_factor=0))
+
+        self.assertEqual(updated.succeeded, 1)
+        self.assertIsInstance(updated.results[1].error, ValueError)
+        self.assertEqual(deleted.succeeded, 2)
+        self.assertEqual(deleted.results[1].attempts, 2)
+        self.assertEqual(
+            sorted(client.calls),
+            [("DELETE", "contacts/1.json"), ("DELETE", "contacts/2.json"), ("DELETE", "contacts/2.json"),
+             ("PUT", "contacts/1.json")]
+        )
@@ -0,0 +1,101 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+
+from evance_api.auth import EvanceAuth
+from evance_api.cache import CacheEntry, DiskCache, MemoryCache, cache_key
+from evance_api.client import EvanceClient
+
+
+def make_response(status_code, content=b'{"data": {"id": 1}}', headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = content
+    response.headers = headers or {}
+    return response
+
+
+class TestResponseCache(unittest.TestCase):
+    def make_client(self, cache):
+        auth = EvanceAuth(base_url="https://example.evance.me")
+        auth.token = "test_token"
+        return EvanceClient(auth, "v2", cache=cache)
+
+    @patch("requests.Session.request")
+    def test_fresh_entries_are_served_from_cache(self, mock_request):
+        mock_request.return_value = make_response(200)
+        client = self.make_client(MemoryCache(ttl=60))
+
+        client.get("products/1.json")
+        self.assertEqual(client.get("products/1.json"), {"data": {"id": 1}})
+        self.assertEqual(mock_request.call_count, 1)
+
+    @patch("requests.Session.request")
+    def test_stale_entries_are_revalidated(self, mock_request):
+        mock_request.side_effect = [make_response(200, headers={"ETag": '"v1"'}), make_response(304, b"")]
+        client = self.make_client(MemoryCache(ttl=0))
+
+        client.get("products/1.json")
+        self.assertEqual(client.get("products/1.json"), {"data": {"id": 1}})
+        self.assertEqual(mock_request.call_args.kwargs["headers"]["If-None-Match"], '"v1"')
+
+    @patch("requests.Session.request")
+    def test_writes_invalidate_the_collection(self, mock_request):
+        mock_request.return_value = make_response(200)
+        cache = MemoryCache(ttl=60)
+        client = self.make_client(cache)
+
+        client.get("products.json", params={"page": 1})
+        client.get("products/1.json")
+        client.get("contacts/1.json")
+        client.put("products/1.json", json={"data": {}})
+
+        self.assertEqual(len(cache), 1)
+
+    @patch("requests.Session.request")
+    def test_stale_entries_without_validators_are_fetched_again(self, mock_request):
+        mock_request.return_value = make_response(200)
+        client = self.make_client(MemoryCache(ttl=0))
+
+        client.get("products/1.json")
+        client.get("products/1.json")
+        self.assertNotIn("If-None-Match", mock_request.call_args.kwargs["headers"])
+        self.assertNotIn("If-Modified-Since", mock_request.call_args.kwargs["headers"])
+
+    def test_invalidation_stops_at_path_boundaries(self):
+        with tempfile.TemporaryDirectory() as directory:
+            disk = DiskCache(os.path.join(directory, "cache.sqlite"))
+            for cache in (MemoryCache(), disk):
+                with self.subTest(cache=type(cache).__name__):
+                    for path in ("products", "products.json?page=2", "products/1.json", "products-archive.json",
+                                 "productsX/1.json"):
+                        cache.set(f"https://example/api/v2/{path}", CacheEntry(b"{}"))
+
+                    cache.invalidate("https://example/api/v2/products")
+
+                    self.assertEqual(len(cache), 2)
+                    self.assertIsNotNone(cache.get("https://example/api/v2/products-archive.json"))
+                    self.assertIsNotNone(cache.get("https://example/api/v2/productsX/1.json"))
+            disk.close()
+
+    def test_memory_cache_evicts_least_recently_used(self):
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", CacheEntry(b"1"))
+        cache.set("b", CacheEntry(b"2"))
+        cache.get("a")
+        cache.set("c", CacheEntry(b"3"))
+
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+
+    def test_disk_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = DiskCache(os.path.join(directory, "cache.sqlite"), max_entries=2)
+            key = cache_key("https://example/api/v2/products.json", {"page": 2, "limit": 5})
+            cache.set(key, CacheEntry(b"{}", etag='"x"'))
+            self.assertEqual(cache.get(key).etag, '"x"')
+
+            cache.invalidate("https://example/api/v2/products")
+            self.assertIsNone(cache.get(key))
+            cache.close()
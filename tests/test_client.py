@@ -1,7 +1,13 @@
+import threading
+import time
 import unittest
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
+from requests.exceptions import HTTPError
 from evance_api.client import EvanceClient
 from evance_api.auth import EvanceAuth
+from evance_api.exceptions import ServerError, NotFoundError
+from evance_api.metrics import MetricsCollector, Instrumentation
+from evance_api.retry import RetryPolicy, AdaptiveThrottle, parse_retry_after
 
 
 class TestEvanceClient(unittest.TestCase):
@@ -27,3 +33,160 @@ class TestEvanceClient(unittest.TestCase):
         response = client.get("products")
 
         self.assertIn("products", response)
+
+    @patch("requests.Session.request")
+    def test_requests_share_pooled_session(self, mock_request):
+        mock_request.return_value.status_code = 200
+        mock_request.return_value.content = b'{"data": []}'
+
+        auth = EvanceAuth(base_url="https://example.evance.me")
+        auth.token = "test_token"
+
+        with EvanceClient(auth, "v2", pool_maxsize=4) as client:
+            self.assertIs(auth.session, client.session)
+            client.get("products.json")
+            client.get("contacts.json")
+            self.assertEqual(mock_request.call_count, 2)
+            self.assertEqual(client.session.get_adapter("https://example.evance.me")._pool_maxsize, 4)
+
+        self.assertIsNone(client.session)
+        self.assertIsNone(auth.session)
+
+    @patch("requests.Session.request")
+    def test_json_codec_encodes_bodies(self, mock_request):
+        mock_request.return_value.status_code = 200
+        mock_request.return_value.content = b'{"data": {"id": 1}}'
+
+        auth = EvanceAuth(base_url="https://example.evance.me")
+        client = EvanceClient(auth, "v2", json_codec="auto")
+        response = client.put("contacts/1.json", json={"data": {"email": "a@b.c"}})
+
+        self.assertEqual(response, {"data": {"id": 1}})
+        kwargs = mock_request.call_args.kwargs
+        self.assertEqual(client.json_codec.loads(kwargs["data"]), {"data": {"email": "a@b.c"}})
+        self.assertEqual(kwargs["headers"]["Content-Type"], "application/json")
+
+
+def make_response(status_code, content=b'{"data": []}', headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = content
+    response.headers = headers or {}
+    if status_code >= 400:
+        response.raise_for_status.side_effect = HTTPError(response=response)
+    return response
+
+
+class TestRetries(unittest.TestCase):
+    def make_client(self, **kwargs):
+        auth = EvanceAuth(base_url="https://example.evance.me")
+        auth.token = "test_token"
+        return EvanceClient(auth, "v2", **kwargs)
+
+    @patch("requests.Session.request")
+    def test_get_is_retried_after_server_pressure(self, mock_request):
+        mock_request.side_effect = [
+            make_response(503, headers={"Retry-After": "0"}),
+            make_response(429),
+            make_response(200),
+        ]
+        client = self.make_client(retry_policy=RetryPolicy(backoff_factor=0))
+
+        self.assertEqual(client.get("products.json"), {"data": []})
+        self.assertEqual(mock_request.call_count, 3)
+
+    @patch("requests.Session.request")
+    def test_post_is_not_retried_after_server_error(self, mock_request):
+        mock_request.return_value = make_response(503)
+        client = self.make_client(retry_policy=RetryPolicy(backoff_factor=0))
+
+        with self.assertRaises(ServerError):
+            client.post("contacts.json", json={"data": {}})
+        self.assertEqual(mock_request.call_count, 1)
+
+    @patch("requests.Session.request")
+    def test_deadline_stops_retries(self, mock_request):
+        mock_request.return_value = make_response(503, headers={"Retry-After": "5"})
+        client = self.make_client(retry_policy=RetryPolicy(deadline=1))
+
+        with self.assertRaises(ServerError):
+            client.get("products.json")
+        self.assertEqual(mock_request.call_count, 1)
+
+    def test_throttle_backs_off_and_recovers(self):
+        throttle = AdaptiveThrottle(max_rate=10, min_rate=1, increase=1)
+        throttle.feedback(429)
+        self.assertEqual(throttle.rate, 5)
+        throttle.feedback(200)
+        self.assertEqual(throttle.rate, 6)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after("3"), 3)
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0)
+        self.assertIsNone(parse_retry_after("soon"))
+
+
+class TestCoalescing(unittest.TestCase):
+    @patch("requests.Session.request")
+    def test_identical_gets_share_one_call(self, mock_request):
+        def slow_response(*args, **kwargs):
+            time.sleep(0.1)
+            return make_response(200, b'{"data": {"id": 1}}')
+
+        mock_request.side_effect = slow_response
+        auth = EvanceAuth(base_url="https://example.evance.me")
+        auth.token = "test_token"
+        client = EvanceClient(auth, "v2", coalesce=True)
+        results = []
+
+        threads = [
+            threading.Thread(target=lambda: results.append(client.get("products/1.json")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(client.coalescing_stats, {"executed": 1, "coalesced": 7})
+
+
+class TestInstrumentation(unittest.TestCase):
+    @patch("requests.Session.request")
+    def test_metrics_are_collected(self, mock_request):
+        mock_request.side_effect = [
+            make_response(503),
+            make_response(200, b'{"data": {"id": 1}}'),
+            make_response(404, b"not found"),
+        ]
+        auth = EvanceAuth(base_url="https://example.evance.me")
+        auth.token = "test_token"
+        metrics = MetricsCollector()
+        events = []
+
+        class Recorder(Instrumentation):
+            def after_request(self, event):
+                events.append((event.status, event.attempts, type(event.error).__name__))
+
+        client = EvanceClient(auth, "v2", pool_maxsize=4, retry_policy=RetryPolicy(backoff_factor=0),
+                              instrumentation=[metrics, Recorder()])
+        client.get("products/1.json")
+        with self.assertRaises(NotFoundError):
+            client.get("products/2.json")
+
+        self.assertEqual(events, [(200, 2, "NoneType"), (404, 1, "NotFoundError")])
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot["requests"]["GET products/{id}.json"]["count"], 2)
+        self.assertEqual(snapshot["requests"]["GET products/{id}.json"]["retries"], 1)
+        self.assertEqual(snapshot["requests"]["GET products/{id}.json"]["bytes_received"], 28)
+        self.assertEqual(snapshot["pool_maxsize"], 4)
+        self.assertEqual(snapshot["in_flight"], 0)
+
+        text = metrics.to_prometheus()
+        self.assertIn('evance_client_requests_total{method="GET",endpoint="products/{id}.json",status="404"} 1', text)
+        self.assertIn('evance_client_request_duration_seconds_count{method="GET",endpoint="products/{id}.json"} 2', text)
+        self.assertIn('evance_client_errors_total{method="GET",endpoint="products/{id}.json",exception="NotFoundError"} 1',
+                      text)
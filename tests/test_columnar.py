@@ -0,0 +1,64 @@
+import asyncio
+import unittest
+
+from evance_api import Products, AsyncProducts
+from evance_api.resources.resources import APIResponse
+from support import AsyncClient, Catalogue, product
+
+try:
+    import pyarrow
+    import pandas
+except ImportError:
+    pyarrow = None
+
+
+def stocked_product(product_id):
+    return product(
+        product_id,
+        status="active" if product_id % 3 else "archived",
+        stock=product_id * 10 if product_id != 4 else None,
+    )
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow and pandas are not installed")
+class TestColumnar(unittest.TestCase):
+    def test_response_to_arrow(self):
+        response = APIResponse({"success": True, "data": [stocked_product(i) for i in range(1, 7)]}, lazy=True)
+
+        table = response.to_arrow()
+
+        self.assertEqual(table.column_names, ["id", "sku", "pricing.price", "pricing.currency", "status", "stock"])
+        self.assertEqual(table.schema.field("id").type, pyarrow.int64())
+        self.assertEqual(table.schema.field("pricing.price").type, pyarrow.float64())
+        self.assertTrue(pyarrow.types.is_dictionary(table.schema.field("status").type))
+        self.assertFalse(pyarrow.types.is_dictionary(table.schema.field("sku").type))
+        self.assertIsNone(response._data)  # No records were created
+
+    def test_pages_to_dataframe(self):
+        products = Products(Catalogue([stocked_product(i) for i in range(1, 8)]).client())
+
+        frame = products.to_dataframe({"limit": 3}, columns=["id", "pricing.price", "status"], types={"id": "int32"})
+
+        self.assertEqual(list(frame["id"]), list(range(1, 8)))
+        self.assertEqual(str(frame["id"].dtype), "int32")
+        self.assertEqual(frame["pricing.price"].iloc[-1], 10.5)
+        self.assertEqual(str(frame["status"].dtype), "category")
+
+    def test_numpy_and_mixed_types(self):
+        records = [stocked_product(1), dict(stocked_product(2), sku=2)]
+        arrays = APIResponse({"success": True, "data": records}).to_numpy(["id", "sku", "stock"])
+
+        self.assertEqual(arrays["id"].dtype.kind, "i")
+        self.assertEqual(list(arrays["sku"]), ["AB-1", "2"])  # Mixed column falls back to strings
+
+    def test_async_to_arrow(self):
+        products = AsyncProducts(AsyncClient(Catalogue([stocked_product(i) for i in range(1, 6)]).client()))
+
+        table = asyncio.run(products.to_arrow({"limit": 2}, concurrency=2))
+
+        self.assertEqual(table.column("id").to_pylist(), [1, 2, 3, 4, 5])
+        self.assertEqual(table.column("stock").null_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
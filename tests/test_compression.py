@@ -0,0 +1,128 @@
+import gzip
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from evance_api.auth import EvanceAuth
+from evance_api.client import EvanceClient
+from evance_api.compression import available_encodings, compress, decompress
+from evance_api.metrics import MetricsCollector
+from evance_api.transport import InMemoryTransport, RequestsTransport
+
+PAGE = json.dumps({"data": [{"id": n, "description": "Lorem ipsum dolor sit amet. " * 10} for n in range(50)]})
+
+
+def make_client(handler, **options):
+    auth = EvanceAuth(base_url="https://example.evance.me")
+    auth.token = "token"
+    metrics = MetricsCollector()
+    client = EvanceClient(auth, "v2", transport=InMemoryTransport(handler), instrumentation=metrics, **options)
+    return client, metrics
+
+
+class TestCodecs(unittest.TestCase):
+    def test_round_trips(self):
+        data = PAGE.encode()
+        for encoding in available_encodings():
+            with self.subTest(encoding=encoding):
+                compressed = compress(data, encoding)
+                self.assertLess(len(compressed), len(data) / 5)
+                self.assertEqual(decompress(compressed, encoding), data)
+
+    def test_stacked_encodings_are_removed_in_reverse(self):
+        data = PAGE.encode()
+        self.assertEqual(decompress(compress(compress(data, "deflate"), "gzip"), "deflate, gzip"), data)
+
+    def test_unknown_encodings_raise(self):
+        with self.assertRaises(ValueError):
+            compress(b"{}", "lzma")
+        with self.assertRaises(ValueError):
+            decompress(b"{}", "lzma")
+        with self.assertRaises(ValueError):
+            make_client(lambda request: {}, compress_requests="lzma")
+
+
+class TestResponseCompression(unittest.TestCase):
+    def test_compressed_responses_are_decoded_and_measured(self):
+        def handler(request):
+            self.assertIn("gzip", request.headers["Accept-Encoding"])
+            return 200, {"Content-Encoding": "gzip"}, gzip.compress(PAGE.encode())
+
+        client, metrics = make_client(handler)
+        self.assertEqual(len(client.get("products.json")["data"]), 50)
+
+        stats = metrics.snapshot()["requests"]["GET products.json"]
+        self.assertEqual(stats["bytes_received"], len(PAGE))
+        self.assertLess(stats["wire_bytes_received"], stats["bytes_received"] / 5)
+
+    def test_accept_encoding_can_be_overridden(self):
+        seen = []
+        client, _ = make_client(lambda request: seen.append(request.headers["Accept-Encoding"]) or {},
+                                accept_encoding="identity")
+        client.get("products.json")
+        self.assertEqual(seen, ["identity"])
+
+    def test_requests_transport_reports_wire_bytes(self):
+        body = gzip.compress(PAGE.encode())
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        with RequestsTransport() as transport:
+            response = transport.send("GET", "http://127.0.0.1:%d/" % server.server_address[1])
+        self.assertEqual(response.content, PAGE.encode())
+        self.assertEqual(response.wire_bytes, len(body))
+
+
+class TestRequestCompression(unittest.TestCase):
+    def test_large_bodies_are_compressed(self):
+        received = []
+
+        def handler(request):
+            received.append((request.headers.get("Content-Encoding"), request.json()))
+            return {"success": True}
+
+        client, metrics = make_client(handler, compress_requests="gzip", compress_min_size=100)
+        client.put("products/1.json", json={"data": {"title": "Short"}})
+        client.put("products/1.json", json=json.loads(PAGE))
+
+        self.assertEqual([encoding for encoding, _ in received], [None, "gzip"])
+        self.assertEqual(received[1][1], json.loads(PAGE))
+        stats = metrics.snapshot()["requests"]["PUT products/{id}.json"]
+        self.assertLess(stats["wire_bytes_sent"], stats["bytes_sent"])
+
+    def test_unsupported_media_type_disables_compression(self):
+        encodings = []
+
+        def handler(request):
+            encodings.append(request.headers.get("Content-Encoding"))
+            if request.headers.get("Content-Encoding"):
+                return 415, {"error": "Unsupported Media Type"}
+            return {"success": True}
+
+        client, _ = make_client(handler, compress_requests="gzip", compress_min_size=0)
+        self.assertEqual(client.post("products.json", json={"data": {}}), {"success": True})
+        client.post("products.json", json={"data": {}})
+
+        self.assertEqual(encodings, ["gzip", None, None])
+        self.assertIsNone(client.compress_requests)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import csv
+import gzip
+import json
+import os
+import tempfile
+import unittest
+
+from evance_api import Products
+from evance_api.cli import parse_param
+from evance_api.export import Exporter, Flattener, detect_format
+from support import Catalogue, product
+
+try:
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+def tagged_product(product_id):
+    return product(product_id, tags=["a"])
+
+
+class TestExport(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_detect_format(self):
+        self.assertEqual(detect_format("products.csv.gz"), ("csv", "gzip"))
+        self.assertEqual(detect_format("products.jsonl"), ("ndjson", None))
+        with self.assertRaises(ValueError):
+            detect_format("products.xml")
+
+    def test_flattener(self):
+        self.assertEqual(Flattener()(tagged_product(2)), {
+            "id": 2, "sku": "AB-2", "pricing.price": 3.0, "pricing.currency": "GBP", "tags": '["a"]'
+        })
+        flatten = Flattener({"sku": "sku", "price": "pricing.price", "tag": "tags.0", "missing": "a.b"})
+        self.assertEqual(flatten(tagged_product(2)), {"sku": "AB-2", "price": 3.0, "tag": "a", "missing": None})
+
+    def test_ndjson_gzip(self):
+        catalogue = Catalogue([tagged_product(i) for i in range(1, 8)])
+        path = self.path("products.ndjson.gz")
+
+        self.assertEqual(Exporter(Products(catalogue.client()), path, page_limit=3).run(), 7)
+
+        with gzip.open(path, "rt") as file:
+            self.assertEqual([json.loads(line) for line in file], catalogue.products)
+        self.assertFalse(os.path.exists(path + ".checkpoint"))
+
+    def test_explicit_format_keeps_gzip_from_the_path(self):
+        catalogue = Catalogue([tagged_product(i) for i in range(1, 4)])
+        path = self.path("products.out.gz")
+
+        self.assertEqual(Exporter(Products(catalogue.client()), path, format="ndjson").run(), 3)
+
+        with gzip.open(path, "rt") as file:
+            self.assertEqual([json.loads(line) for line in file], catalogue.products)
+
+    def test_csv_resumes_after_crash(self):
+        for name in ("products.csv", "products.csv.gz"):
+            catalogue = Catalogue([tagged_product(i) for i in range(1, 11)], fail_on_page=3)
+            path = self.path(name)
+            exporter = Exporter(Products(catalogue.client()), path, page_limit=2, checkpoint_every=1, schema=["id", "pricing.price"])
+
+            with self.assertRaises(ConnectionError):
+                exporter.run()
+            self.assertEqual(json.load(open(path + ".checkpoint"))["page"], 2)
+
+            catalogue.requests.clear()
+            self.assertEqual(exporter.run(), 10)
+            self.assertEqual(catalogue.pages, [3, 4, 5])
+
+            opener = gzip.open if name.endswith(".gz") else open
+            with opener(path, "rt", newline="") as file:
+                rows = list(csv.DictReader(file))
+            self.assertEqual([row["id"] for row in rows], [str(i) for i in range(1, 11)])
+            self.assertEqual(rows[0]["pricing.price"], "1.5")
+
+    def test_cli_params(self):
+        products = Products(None)
+
+        self.assertEqual(parse_param(products, "sku:in=AB-1,AB-2"), ("sku:in", ["AB-1", "AB-2"]))
+        self.assertEqual(parse_param(products, "bandId=4"), ("bandId", 4))
+        with self.assertRaises(ValueError):
+            parse_param(products, "colour=red")
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_parquet_parts(self):
+        catalogue = Catalogue([tagged_product(i) for i in range(1, 8)], fail_on_page=4)
+        path = self.path("products.parquet")
+        exporter = Exporter(Products(catalogue.client()), path, page_limit=2, checkpoint_every=2)
+
+        with self.assertRaises(ConnectionError):
+            exporter.run()
+        self.assertEqual(exporter.run(), 7)
+
+        table = pyarrow.parquet.read_table(path)
+        self.assertEqual(table.column("id").to_pylist(), list(range(1, 8)))
+        self.assertEqual(sorted(os.listdir(path)), ["part-00000.parquet", "part-00001.parquet"])
+
+
+if __name__ == "__main__":
+    unittest.main()
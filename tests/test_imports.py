@@ -0,0 +1,49 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import evance_api
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def loaded_after(statement):
+    """
+    Run `statement` in a fresh interpreter and return the heavy modules it loaded.
+    """
+    code = (f"import sys\n{statement}\n"
+            "print(','.join(m for m in ('requests', 'urllib3', 'httpx', 'asyncio', 'sqlite3', 'concurrent.futures')"
+            " if m in sys.modules))")
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True, capture_output=True, text=True)
+    return [name for name in output.stdout.strip().split(",") if name]
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_import_loads_nothing_heavy(self):
+        self.assertEqual(loaded_after("import evance_api"), [])
+
+    def test_requests_is_imported_on_first_use(self):
+        self.assertEqual(loaded_after(
+            "from evance_api import EvanceAuth, EvanceClient, Products\n"
+            "Products(EvanceClient(EvanceAuth(base_url='https://example.evance.me'), 'v2'))"
+        ), [])
+        self.assertIn("requests", loaded_after(
+            "from evance_api import EvanceAuth, EvanceClient\n"
+            "EvanceClient(EvanceAuth(base_url='https://example.evance.me'), 'v2').session"
+        ))
+
+    def test_public_names_resolve(self):
+        from evance_api.resources.products import Products
+
+        self.assertIs(evance_api.Products, Products)
+        self.assertIs(evance_api.client.EvanceClient, evance_api.EvanceClient)
+        self.assertIn("AsyncProducts", dir(evance_api))
+        for name in evance_api.__all__:
+            self.assertTrue(getattr(evance_api, name))
+        with self.assertRaises(AttributeError):
+            evance_api.Missing
+
+
+if __name__ == "__main__":
+    unittest.main()
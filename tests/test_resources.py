@@ -0,0 +1,289 @@
+import json
+import pickle
+import threading
+import unittest
+
+from evance_api import AsyncProducts, Products
+from evance_api.resources.resources import APIObject, APIResponse
+from support import AsyncClient
+
+
+class FakeClient:
+    """Serves `total` products split into pages of `limit` items."""
+
+    def __init__(self, total=23, limit=5):
+        self.total = total
+        self.limit = limit
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def get(self, endpoint, params=None, raw=False):
+        params = params or {}
+        with self.lock:
+            self.calls.append((endpoint, dict(params)))
+        limit = params.get("limit", self.limit)
+        page = params.get("page", 1)
+        ids = list(range(1, self.total + 1))
+        if "id:in" in params:
+            ids = [i for i in ids if i in set(params["id:in"])]
+        pages = -(-len(ids) // limit)
+        payload = {
+            "success": True,
+            "status": 200,
+            "pagination": {"page": page, "limit": limit, "total": len(ids), "pages": pages},
+            "links": {"next": "next" if page < pages else None},
+            "data": [{"id": i, "sku": f"SKU{i}"} for i in ids[(page - 1) * limit:page * limit]],
+        }
+        return json.dumps(payload).encode() if raw else payload
+
+
+class HydrateClient(FakeClient):
+    """Also serves one specification and one download per product."""
+
+    def get(self, endpoint, params=None, raw=False):
+        if endpoint.startswith("products/"):
+            with self.lock:
+                self.calls.append((endpoint, params))
+            product_id = int(endpoint.split("/")[1])
+            return {"pagination": {"page": 1, "pages": 1}, "data": [{"id": product_id * 10, "path": endpoint}]}
+        return super().get(endpoint, params, raw)
+
+
+class TestPagination(unittest.TestCase):
+    def test_iter_pages_walks_every_page(self):
+        client = FakeClient()
+        pages = list(Products(client).iter_pages({"limit": 5}))
+
+        self.assertEqual([page.pagination.page for page in pages], [1, 2, 3, 4, 5])
+        self.assertEqual(len(client.calls), 5)
+
+    def test_iter_all_yields_items_in_order(self):
+        for prefetch in (True, False):
+            items = list(Products(FakeClient()).iter_all({"limit": 5}, prefetch=prefetch))
+            self.assertEqual([item.id for item in items], list(range(1, 24)))
+
+    def test_iter_all_is_lazy(self):
+        client = FakeClient()
+        iterator = Products(client).iter_all({"limit": 5}, prefetch=False)
+        next(iterator)
+
+        self.assertEqual(len(client.calls), 1)
+
+    def test_raw_pages_are_walked_without_parsing_items(self):
+        products = Products(FakeClient(total=23, limit=5))
+        pages = list(products.iter_pages({"limit": 5}, raw=True))
+        pages += list(products.fetch_pages({"limit": 5}, concurrency=3, ordered=False, raw=True))
+
+        self.assertEqual(len(pages), 10)
+        for page in pages:
+            self.assertIsNone(page._data)
+            self.assertEqual(page._records, [None] * len(page))
+
+    def test_fetch_pages_in_page_order(self):
+        client = FakeClient(total=103, limit=5)
+        pages = list(Products(client).fetch_pages({"limit": 5}, concurrency=4))
+
+        self.assertEqual([page.pagination.page for page in pages], list(range(1, 22)))
+        self.assertEqual(len(client.calls), 21)
+
+    def test_fetch_pages_as_completed(self):
+        pages = Products(FakeClient(total=103, limit=5)).fetch_pages({"limit": 5}, concurrency=4, ordered=False)
+
+        self.assertEqual(sorted(item.id for page in pages for item in page), list(range(1, 104)))
+
+    def test_iter_all_concurrently(self):
+        items = Products(FakeClient(total=103, limit=5)).iter_all({"limit": 5}, concurrency=4)
+
+        self.assertEqual([item.id for item in items], list(range(1, 104)))
+
+    def test_fetch_pages_follows_growing_total(self):
+        client = FakeClient(total=10, limit=5)
+        original_get = client.get
+
+        def get(endpoint, params=None):
+            response = original_get(endpoint, params)
+            client.total = 22  # Records were added after the first page was read
+            return response
+
+        client.get = get
+        pages = list(Products(client).fetch_pages({"limit": 5}, concurrency=2, ordered=False))
+
+        self.assertEqual(sorted(page.pagination.page for page in pages), [1, 2, 3, 4, 5])
+
+    def test_many_chunks_ids(self):
+        client = FakeClient(total=500)
+        products = Products(client)
+        products.max_page_limit = 40
+
+        result = products.many(list(range(1, 101)) + [9999, 5], concurrency=3)
+
+        self.assertEqual(len(result), 100)
+        self.assertEqual(result[42].sku, "SKU42")
+        self.assertEqual(result.missing, [9999])
+        self.assertEqual(len(client.calls), 3)
+
+    def test_many_respects_url_length(self):
+        products = Products(FakeClient())
+        products.max_url_length = 200
+
+        chunks = products._chunk_ids(range(100000, 100100))
+
+        self.assertTrue(all(len(chunk) < 20 for chunk in chunks))
+        self.assertEqual(sum(len(chunk) for chunk in chunks), 100)
+
+    def test_hydrate_attaches_sub_resources(self):
+        client = HydrateClient(total=12, limit=5)
+        cache = {}
+        products = Products(client).hydrate(Products(client).iter_all({"limit": 5}), concurrency=4, cache=cache)
+
+        self.assertEqual([product.id for product in products], list(range(1, 13)))
+        self.assertEqual(products[2].specifications, [{"id": 30, "path": "products/3/specifications.json"}])
+        self.assertEqual(products[2].downloads[0]["path"], "products/3/downloads.json")
+        self.assertEqual(len(cache), 24)
+
+        client.calls.clear()
+        Products(client).hydrate(products[:2], cache=cache)
+        self.assertEqual(client.calls, [])
+
+
+class TestAsyncHydration(unittest.IsolatedAsyncioTestCase):
+    async def test_hydrate_attaches_sub_resources(self):
+        client = AsyncClient(HydrateClient(total=12, limit=5))
+        products = AsyncProducts(client)
+        cache = {}
+
+        hydrated = await products.hydrate(products.iter_all({"limit": 5}), concurrency=3, cache=cache)
+
+        self.assertEqual([product.id for product in hydrated], list(range(1, 13)))
+        self.assertEqual(hydrated[2].specifications, [{"id": 30, "path": "products/3/specifications.json"}])
+        self.assertEqual(hydrated[2].downloads[0]["path"], "products/3/downloads.json")
+        self.assertEqual(len(cache), 24)
+        self.assertLessEqual(client.peak, 4)  # 3 sub-resource requests plus the next product page
+
+    async def test_iter_hydrated_streams_a_plain_iterable(self):
+        client = AsyncClient(HydrateClient())
+        products = (await AsyncProducts(client).list({"limit": 5})).data
+
+        names = []
+        async for product in AsyncProducts(client).iter_hydrated(products, downloads=False):
+            names.append((product.id, product.specifications[0]["id"], "downloads" in product.to_dict()))
+
+        self.assertEqual(names, [(n, n * 10, False) for n in range(1, 6)])
+
+
+class TestAPIResponse(unittest.TestCase):
+    def test_items_share_one_record_type(self):
+        response = APIResponse({"data": [{"id": 1, "sku": "A"}, {"id": 2, "sku": "B"}]})
+
+        self.assertTrue(all(type(item) is APIObject for item in response))
+        self.assertEqual(response[1].sku, "B")
+        self.assertEqual(response[0].to_dict(), {"id": 1, "sku": "A"})
+        self.assertEqual(response[0].title, "Attr[title] not available")
+
+    def test_records_pickle(self):
+        item = APIResponse({"data": {"id": 1, "sku": "A"}}).data
+
+        self.assertEqual(pickle.loads(pickle.dumps(item)).to_dict(), item.to_dict())
+
+    def test_records_hash_by_identity(self):
+        first, second = APIResponse({"data": [{"id": 1}, {"id": 1}]})
+
+        self.assertEqual(len({first, second}), 2)
+        self.assertEqual({first: "a"}[first], "a")
+        self.assertNotEqual(first, second)
+
+    def test_lazy_raw_response(self):
+        payload = b'{"success": true, "data": [{"id": 1, "sku": "A"}, {"id": 2, "sku": "B"}]}'
+        response = APIResponse(payload, lazy=True)
+
+        self.assertEqual(len(response), 2)
+        self.assertEqual(response._records, [None, None])
+        self.assertEqual(response[1].sku, "B")
+        self.assertIsNone(response._records[0])
+        self.assertEqual([item.id for item in response], [1, 2])
+        self.assertEqual(response.to_json(original=True), payload.decode())
+        self.assertEqual(response.raw, payload)
+
+    def test_lazy_raw_body_is_decoded_on_first_read(self):
+        payload = b'{"success": true, "data": [{"id": 1, "sku": "A"}]}'
+        response = APIResponse(payload, lazy=True)
+
+        self.assertEqual(response.raw, payload)
+        self.assertEqual(response.to_json(original=True), payload.decode())
+        self.assertNotIn("_items", vars(response))
+
+        self.assertTrue(response.success)
+        self.assertEqual(response[0].sku, "A")
+
+    def test_projected_response_refuses_the_original_payload(self):
+        payload = b'{"data": [{"id": 1, "sku": "A", "title": "T"}]}'
+        for lazy in (True, False):
+            response = APIResponse(payload, lazy=lazy, fields=["id", "sku"])
+
+            with self.assertRaises(ValueError):
+                response.to_json(original=True)
+            self.assertEqual(json.loads(response.to_json()), [{"id": 1, "sku": "A"}])
+
+
+class WideClient(FakeClient):
+    """Serves products with nested fields and honours a sparse fieldset if `sparse` is set."""
+
+    def __init__(self, sparse=False, **options):
+        super().__init__(**options)
+        self.sparse = sparse
+
+    def get(self, endpoint, params=None, raw=False):
+        payload = super().get(endpoint, params)
+        if endpoint.startswith("products/"):
+            product_id = int(endpoint.split("/")[1].split(".")[0])
+            payload["data"] = {"id": product_id, "sku": f"SKU{product_id}"}
+        for item in payload["data"] if isinstance(payload["data"], list) else [payload["data"]]:
+            item.update(title=f"Product {item['id']}", pricing={"price": item["id"] * 10, "currency": "GBP"},
+                        variants=[{"id": 1, "sku": "V1", "stock": 3}])
+            if self.sparse and params and "fields" in params:
+                for key in set(item) - set(params["fields"].split(",")):
+                    del item[key]
+        return json.dumps(payload).encode() if raw else payload
+
+
+class TestFieldProjection(unittest.TestCase):
+    def test_list_requests_and_keeps_only_selected_fields(self):
+        client = WideClient(sparse=True)
+        products = Products(client)
+        products.fields_param = "fields"
+        response = products.list({"limit": 5}, fields=["id", "pricing.price", "variants.sku"])
+
+        self.assertEqual(client.calls[0][1]["fields"], "id,pricing,variants")
+        self.assertEqual(response[0].to_dict(), {"id": 1, "pricing": {"price": 10}, "variants": [{"sku": "V1"}]})
+
+    def test_projection_applies_when_the_api_ignores_the_fieldset(self):
+        client = WideClient()
+        products = Products(client)
+        products.fields_param = "fields"
+        items = list(products.iter_all({"limit": 5}, fields="id, sku", prefetch=False))
+
+        self.assertEqual(len(items), 23)
+        self.assertEqual(items[7].to_dict(), {"id": 8, "sku": "SKU8"})
+        self.assertTrue(all(params["fields"] == "id,sku" for _, params in client.calls))
+
+    def test_one_and_concurrent_pages(self):
+        client = WideClient()
+        product = Products(client).one(3, fields=["title", "pricing"])
+        pages = list(Products(client).fetch_pages({"limit": 5}, concurrency=3, fields=["id"]))
+
+        self.assertEqual(product.data.to_dict(), {"title": "Product 3", "pricing": {"price": 30, "currency": "GBP"}})
+        self.assertEqual(client.calls[0][0], "products/3.json")
+        self.assertEqual([item.to_dict() for item in pages[4]], [{"id": 21}, {"id": 22}, {"id": 23}])
+
+    def test_selecting_a_parent_whole_wins(self):
+        response = APIResponse({"data": {"pricing": {"price": 1, "currency": "GBP"}, "id": 1}},
+                               fields=["pricing.price", "pricing"])
+
+        self.assertEqual(response.data.to_dict(), {"pricing": {"price": 1, "currency": "GBP"}})
+
+    def test_no_fieldset_is_requested_by_default(self):
+        client = WideClient()
+        response = Products(client).list(fields=["id"])
+
+        self.assertNotIn("fields", client.calls[0][1])
+        self.assertEqual(response[0].to_dict(), {"id": 1})
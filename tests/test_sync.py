@@ -0,0 +1,42 @@
+import unittest
+
+from evance_api import Products
+from evance_api.sync import LocalStore, SyncEngine
+from support import Catalogue, product
+
+
+def modified_product(product_id, sku, modified_on):
+    return product(product_id, sku=sku, barcode=f"50{product_id}", modifiedOn=modified_on)
+
+
+class TestSyncEngine(unittest.TestCase):
+    def test_backfill_then_delta(self):
+        catalogue = Catalogue([modified_product(i, f"AB-{i}", f"2024-01-0{i}T00:00:00") for i in range(1, 8)])
+        store = LocalStore()
+        engine = SyncEngine(Products(catalogue.client()), store, page_limit=3)
+
+        self.assertEqual(engine.sync(), 7)
+        self.assertEqual(store.get_checkpoint("products"), "2024-01-07T00:00:00")
+
+        catalogue.products[2] = modified_product(3, "XY-3", "2024-02-01T00:00:00")
+        catalogue.requests.clear()
+        # The record at the checkpoint itself is pulled again, alongside the modified one
+        self.assertEqual(engine.sync(), 2)
+        self.assertEqual(catalogue.requests[0]["modifiedOn:min"], "2024-01-07T00:00:00")
+        self.assertEqual(store.get_checkpoint("products"), "2024-02-01T00:00:00")
+        self.assertEqual(store.query("products", {"id:in": [3]})[0].sku, "XY-3")
+
+    def test_local_filters(self):
+        store = LocalStore()
+        store.upsert("products", [
+            modified_product(1, "AB-1", "2024-01-01"),
+            modified_product(2, "AB_2", "2024-01-02"),
+            modified_product(3, "CD-3", "2024-01-03"),
+        ])
+
+        self.assertEqual([p.id for p in store.query("products", {"sku:startsWith": "AB"})], [1, 2])
+        self.assertEqual([p.id for p in store.query("products", {"sku:contains": "_"})], [2])
+        self.assertEqual([p.id for p in store.query("products", {"modifiedOn:after": "2024-01-01"})], [2, 3])
+        self.assertEqual(store.count("products", {"barcode": "503"}), 1)
+        with self.assertRaises(ValueError):
+            store.query("products", {"title": "x"})
@@ -0,0 +1,221 @@
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from evance_api.auth import EvanceAuth
+from evance_api.client import EvanceClient
+from evance_api.exceptions import NotFoundError, UnauthorizedError, UnexpectedError
+from evance_api.transport import (
+    HTTP2Transport,
+    Headers,
+    InMemoryTransport,
+    RecordingTransport,
+    ReplayTransport,
+    TransportResponse,
+    http2_available,
+)
+
+
+class FakeAPI:
+    """
+    A tiny in-process Evance API: a token endpoint and products/<id>.json.
+    """
+
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        if request.path == "/admin/oauth/token":
+            return {"access_token": "secret-token", "expires_in": 3600}
+        if request.headers.get("authorization") != "Bearer secret-token":
+            return 401, {"error": "Unauthorized"}
+        if request.method == "PUT":
+            return 200, {"X-Updated": "1"}, request.body
+        if request.path == "/api/v2/products/1.json":
+            return {"data": {"id": 1, "page": request.params.get("page")}}
+        return 404, {"error": "Not found"}
+
+
+def make_client(transport):
+    auth = EvanceAuth(base_url="https://example.evance.me", client_id="id", private_key="key")
+    return EvanceClient(auth, "v2", transport=transport)
+
+
+class TestInMemoryTransport(unittest.TestCase):
+    def test_client_and_auth_use_the_transport(self):
+        api = FakeAPI()
+        client = make_client(InMemoryTransport(api))
+
+        self.assertEqual(client.get("products/1.json", {"page": 2}), {"data": {"id": 1, "page": 2}})
+        self.assertEqual([request.path for request in api.requests],
+                         ["/admin/oauth/token", "/api/v2/products/1.json"])
+        self.assertIn(b"grant_type=client_credentials", api.requests[0].body)
+        self.assertIsNone(client.session)
+
+    def test_a_transport_given_to_auth_is_kept(self):
+        token_api, api = FakeAPI(), FakeAPI()
+        auth = EvanceAuth(base_url="https://example.evance.me", client_id="id", private_key="key",
+                          transport=InMemoryTransport(token_api))
+        first = EvanceClient(auth, "v2", transport=InMemoryTransport(api))
+        EvanceClient(auth, "v2", transport=InMemoryTransport(FakeAPI()))
+
+        first.get("products/1.json")
+        self.assertEqual([request.path for request in token_api.requests], ["/admin/oauth/token"])
+        self.assertEqual([request.path for request in api.requests], ["/api/v2/products/1.json"])
+
+        first.close()
+        self.assertIsNotNone(auth.transport)
+
+    def test_error_statuses_raise_evance_exceptions(self):
+        client = make_client(InMemoryTransport(FakeAPI()))
+        with self.assertRaises(NotFoundError):
+            client.get("products/2.json")
+
+    def test_token_errors_raise_evance_exceptions(self):
+        auth = EvanceAuth(base_url="https://example.evance.me", client_id="id", private_key="key",
+                          transport=InMemoryTransport(lambda request: (401, {"error": "invalid_client"})))
+        with self.assertRaises(UnauthorizedError):
+            auth.authenticate()
+
+    def test_close_releases_the_transport(self):
+        client = make_client(InMemoryTransport(FakeAPI()))
+        client.auth.token = "secret-token"
+        client.close()
+        self.assertIsNone(client.auth.transport)
+        with self.assertRaises(UnexpectedError):
+            client.get("products/1.json")
+
+    def test_headers_are_case_insensitive(self):
+        response = TransportResponse(200, {"Retry-After": "1"})
+        self.assertEqual(response.headers.get("retry-after"), "1")
+        self.assertIn("RETRY-AFTER", Headers(response.headers))
+
+
+class TestRecordReplay(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "cassette.jsonl")
+
+    def record(self):
+        with make_client(RecordingTransport(InMemoryTransport(FakeAPI()), self.path)) as client:
+            client.get("products/1.json", {"page": 1})
+            client.put("products/1.json", json={"data": {"title": "New"}})
+
+    def test_replays_recorded_responses(self):
+        self.record()
+        with make_client(ReplayTransport(self.path)) as client:
+            self.assertEqual(client.get("products/1.json", {"page": 1}), {"data": {"id": 1, "page": 1}})
+            self.assertEqual(client.put("products/1.json", json={"data": {"title": "New"}}),
+                             {"data": {"title": "New"}})
+
+    def test_cassettes_hold_no_credentials(self):
+        self.record()
+        with open(self.path) as file:
+            cassette = file.read()
+        self.assertNotIn("secret-token", cassette)
+        self.assertEqual(json.loads(cassette.splitlines()[0])["body"], None)
+        self.assertNotIn("client_secret", cassette)
+
+    def test_unrecorded_requests_raise(self):
+        self.record()
+        with make_client(ReplayTransport(self.path)) as client:
+            with self.assertRaises(UnexpectedError):
+                client.get("products/1.json", {"page": 2})
+            with self.assertRaises(UnexpectedError):
+                client.put("products/1.json", json={"data": {"title": "Other"}})
+
+    def test_exhausted_responses_raise_without_loop(self):
+        self.record()
+        with make_client(ReplayTransport(self.path, loop=False)) as client:
+            client.get("products/1.json", {"page": 1})
+            with self.assertRaises(UnexpectedError):
+                client.get("products/1.json", {"page": 1})
+
+
+class LocalServer:
+    """
+    A plain-http server answering every request with a small JSON body after `delay` seconds.
+    """
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self.queries = []
+        lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _handle(self):
+                self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                with lock:
+                    server.active += 1
+                    server.max_active = max(server.max_active, server.active)
+                    server.queries.append(self.path)
+                time.sleep(server.delay)
+                body = b'{"access_token": "token", "data": {"id": 1}}'
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                with lock:
+                    server.active -= 1
+
+            do_GET = do_POST = _handle
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        self.base_url = "http://127.0.0.1:%d" % self.httpd.server_address[1]
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class TestHTTP2Transport(unittest.TestCase):
+    def setUp(self):
+        self.server = LocalServer()
+        self.addCleanup(self.server.stop)
+
+    def test_falls_back_to_http1(self):
+        auth = EvanceAuth(base_url=self.server.base_url, client_id="id", private_key="key")
+        with EvanceClient(auth, "v2", http2=True) as client:
+            self.assertIsInstance(client.transport, HTTP2Transport)
+            self.assertEqual(client.get("products/1.json", {"page": 1, "q": None})["data"], {"id": 1})
+            response = client.transport.send("GET", f"{self.server.base_url}/api/v2/products.json")
+        self.assertEqual(response.http_version, "HTTP/1.1")
+        self.assertEqual(self.server.queries[1], "/api/v2/products/1.json?page=1")
+
+    def test_concurrent_streams_are_limited(self):
+        self.server.delay = 0.05
+        transport = HTTP2Transport(max_concurrent_streams=2)
+        self.addCleanup(transport.close)
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            list(executor.map(lambda _: transport.send("GET", self.server.base_url), range(6)))
+        self.assertEqual(self.server.max_active, 2)
+
+    def test_missing_h2_falls_back_with_a_warning(self):
+        with patch.dict(sys.modules, {"h2": None}):
+            with self.assertWarns(RuntimeWarning):
+                self.assertFalse(http2_available())
+        self.assertFalse(http2_available(False))
+
+
+if __name__ == "__main__":
+    unittest.main()
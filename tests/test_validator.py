@@ -0,0 +1,69 @@
+import unittest
+
+from evance_api import Contacts, Products
+from evance_api.validator import Validator, JSONValidator
+
+
+class TestValidator(unittest.TestCase):
+    def test_params(self):
+        validator = Validator({"id:in": list, "title": (str, type(None))})
+
+        self.assertTrue(validator.validate({"id:in": [1], "title": None}))
+        with self.assertRaisesRegex(ValueError, "Invalid parameter: sku"):
+            validator.validate({"sku": "AB"})
+        with self.assertRaisesRegex(ValueError, "must be of type str or NoneType"):
+            validator.check("title", 1)
+
+    def test_validate_many_reports_every_error(self):
+        validator = JSONValidator({"email": str, "type": str}, {"consentsToSms": bool})
+        bodies = [
+            {"data": {"email": "a@example.com", "type": "user"}},
+            {"data": {"email": 1, "consentsToSms": "yes"}},
+            {"data": []},
+            {"data": {"email": "b@example.com", "type": "user", "consentsToSms": True}},
+        ]
+
+        self.assertEqual(validator.validate_many(bodies), [
+            (1, "Key 'email' under 'data' must be of type str or None"),
+            (1, "Missing mandatory key under 'data': type"),
+            (1, "Optional key 'consentsToSms' under 'data' must be of type bool or None"),
+            (2, "'data' must be a dictionary"),
+        ])
+        with self.assertRaisesRegex(ValueError, "Key 'email'"):
+            validator.validate(bodies[1])
+
+
+class TestResourceValidators(unittest.TestCase):
+    def test_validators_are_shared_per_class(self):
+        self.assertIs(Products(None).param_validator, Products(None).param_validator)
+        self.assertIs(Contacts(None).body_validator, Contacts(None).body_validator)
+        self.assertIsNone(Products(None).body_validator)
+        self.assertIn("limit", Products(None).accepted_params)
+
+    def test_accepted_params_cannot_be_changed_through_an_instance(self):
+        products = Products(None)
+        with self.assertRaises(TypeError):
+            products.accepted_params["colour"] = str
+        self.assertNotIn("colour", Products(None).accepted_params)
+        with self.assertRaises(ValueError):
+            products.set("colour", "red")
+
+    def test_set_stores_validated_params(self):
+        products = Products(None)
+        products.set("sku:contains", "1234").set("limit", 10)
+
+        self.assertEqual(products.query.to_dict(), {"sku:contains": "1234", "limit": 10})
+        with self.assertRaises(ValueError):
+            products.set("limit", "10")
+
+    def test_contacts_validate_many(self):
+        records = [{"email": "a@example.com", "type": "user", "firstName": "A", "lastName": "B"}, {"email": "c"}]
+
+        errors = Contacts(None).validate_many(records)
+
+        self.assertEqual({index for index, _ in errors}, {1})
+        self.assertEqual(len(errors), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()